@@ -0,0 +1,71 @@
+"""Throughput of concurrent ``Screenshot.resize`` calls across thread counts.
+
+    python benchmarks/concurrent_resize.py
+    python3.13t -X gil=0 benchmarks/concurrent_resize.py   # free-threaded build
+
+Every thread resizes the same set of screenshots, so the decoded-image cache
+and its decode-once locking are exercised. With the GIL only Pillow's own
+GIL-released sections run in parallel; on a free-threaded build speedup should
+track the thread count until the cores run out.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image
+
+from gui_agent_screenshot_tools import ResizeMode, Screenshot, Space
+
+
+def make_screenshots(count: int, width: int, height: int) -> list[Screenshot]:
+    shots = []
+    for i in range(count):
+        img = Image.linear_gradient("L").resize((width, height)).convert("RGB")
+        img.paste((i * 37 % 256, 90, 160), (0, 0, width // 4, height // 4))
+        shots.append(Screenshot.from_image(img))
+    return shots
+
+
+def run(shots: list[Screenshot], threads: int, rounds: int, target: Space) -> float:
+    """Resizes per second with ``threads`` workers."""
+    jobs = [shot for _ in range(rounds) for shot in shots]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        for _ in pool.map(lambda s: s.resize(target, ResizeMode.LETTERBOX), jobs):
+            pass
+    return len(jobs) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--screenshots", type=int, default=8)
+    parser.add_argument("--rounds", type=int, default=4)
+    parser.add_argument("--size", default="1920x1080")
+    parser.add_argument("--target", default="1024x1024")
+    parser.add_argument(
+        "--threads", type=int, nargs="+", default=[1, 2, 4, 8, os.cpu_count() or 1]
+    )
+    args = parser.parse_args()
+
+    width, height = map(int, args.size.split("x"))
+    tw, th = map(int, args.target.split("x"))
+    target = Space(width=tw, height=th)
+    shots = make_screenshots(args.screenshots, width, height)
+    run(shots, 1, 1, target)  # warm the image cache
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    base = None
+    for threads in sorted(set(args.threads)):
+        rate = run(shots, threads, args.rounds, target)
+        base = base or rate
+        print(f"{threads:>3} threads  {rate:8.1f} resizes/s  speedup {rate / base:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Measure cold import time of the package with ``python -X importtime``.
+
+    python benchmarks/import_time.py                     # report
+    python benchmarks/import_time.py --save baseline.json
+    python benchmarks/import_time.py --baseline baseline.json --tolerance 0.25
+
+Each run imports the statement in a fresh interpreter. The median cumulative
+time (microseconds) per module is reported; with ``--baseline`` the script
+exits non-zero when the package import got slower than the tolerance allows.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PACKAGE = "gui_agent_screenshot_tools"
+
+STATEMENTS = {
+    "package": f"import {PACKAGE}",
+    "geometry": f"from {PACKAGE} import BBox, Coordinate, ResizeMetadata, Space",
+    "screenshot": f"from {PACKAGE} import Screenshot",
+}
+
+
+def importtime(statement: str) -> dict[str, int]:
+    """Cumulative import time in microseconds for each module ``statement`` loads."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        # "import time:  self [us] | cumulative | imported package"
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def measure(repeat: int) -> dict[str, dict[str, object]]:
+    results: dict[str, dict[str, object]] = {}
+    for label, statement in STATEMENTS.items():
+        runs = [importtime(statement) for _ in range(repeat)]
+        total = [run[PACKAGE] for run in runs]
+        loaded = runs[-1]
+        results[label] = {
+            "total_us": int(statistics.median(total)),
+            "pillow": "PIL" in loaded,
+            "numpy": "numpy" in loaded,
+            "slowest": sorted(loaded.items(), key=lambda kv: -kv[1])[:5],
+        }
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--save", type=Path, help="write results as a baseline")
+    parser.add_argument("--baseline", type=Path, help="compare against a baseline")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="allowed relative slowdown"
+    )
+    args = parser.parse_args()
+
+    results = measure(args.repeat)
+    for label, result in results.items():
+        heavy = [name for name in ("pillow", "numpy") if result[name]]
+        print(
+            f"{label:<11} {result['total_us'] / 1000:8.1f} ms"
+            f"  loads: {', '.join(heavy) or '-'}"
+        )
+        for name, us in result["slowest"]:
+            print(f"    {us / 1000:8.1f} ms  {name}")
+
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2) + "\n")
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        failed = False
+        for label, result in results.items():
+            if label not in baseline:
+                continue
+            limit = baseline[label]["total_us"] * (1 + args.tolerance)
+            if result["total_us"] > limit:
+                print(
+                    f"REGRESSION {label}: {result['total_us']} us > {int(limit)} us",
+                    file=sys.stderr,
+                )
+                failed = True
+            for name in ("pillow", "numpy"):
+                if result[name] and not baseline[label][name]:
+                    print(f"REGRESSION {label}: now imports {name}", file=sys.stderr)
+                    failed = True
+        return 1 if failed else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,231 @@
+"""Peak and retained memory of screenshot operations per resolution.
+
+    python benchmarks/memory.py                            # report
+    python benchmarks/memory.py --save memory-baseline.json
+    python benchmarks/memory.py --baseline memory-baseline.json --tolerance 0.15
+
+Each (operation, resolution) pair runs in a fresh interpreter. Two views are
+recorded:
+
+* ``traced``: Python allocations via ``tracemalloc`` (``bytes`` objects such as
+  ``image_bytes`` and encoder buffers).
+* ``rss``: resident set size sampled every millisecond from ``/proc`` (Linux),
+  which also sees Pillow's pixel buffers. Elsewhere only the peak is known,
+  from ``ru_maxrss``.
+
+``peak`` is the high-water mark above the pre-operation level while the
+operation runs; ``retained`` is what is still held afterwards, after a
+``gc.collect()``, with the result kept alive (so it includes the decoded-image
+cache). With ``--baseline`` the script exits non-zero on any peak or retained
+value that grew beyond the tolerance.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import resource
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+RESOLUTIONS = {
+    "mobile": (1170, 2532),
+    "1080p": (1920, 1080),
+    "4k": (3840, 2160),
+}
+
+OPERATIONS = ("from_image", "decode", "resize", "lifecycle")
+
+TARGET = (1024, 1024)
+
+# Absolute slack on top of the relative tolerance; small values are noisy.
+SLACK_BYTES = 2 * 1024 * 1024
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def _rss() -> int | None:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except OSError:
+        return None
+
+
+def _max_rss() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class _RSSSampler(threading.Thread):
+    def __init__(self, interval: float = 0.001) -> None:
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak = _rss() or 0
+        self._stop = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop.is_set():
+            self.peak = max(self.peak, _rss() or 0)
+            time.sleep(self.interval)
+
+    def stop(self) -> int:
+        self._stop.set()
+        self.join()
+        self.peak = max(self.peak, _rss() or 0)
+        return self.peak
+
+
+def _setup(operation: str, size: tuple[int, int]) -> Callable[[], Any]:
+    from PIL import Image
+
+    from gui_agent_screenshot_tools import ResizeMode, Screenshot, Space
+
+    # A gradient with a block of flat color compresses like a real UI capture.
+    img = Image.linear_gradient("L").resize(size).convert("RGB")
+    img.paste((30, 120, 200), (0, 0, size[0] // 3, size[1] // 5))
+    target = Space(width=TARGET[0], height=TARGET[1])
+
+    if operation == "from_image":
+        return lambda img=img: Screenshot.from_image(img)
+    shot = Screenshot.from_image(img)
+    del img
+    if operation == "decode":
+        return lambda: shot.image
+    if operation == "resize":
+        return lambda: shot.resize(target, ResizeMode.LETTERBOX)
+    if operation == "lifecycle":
+        data = shot.image_bytes
+        space = shot.space
+        del shot
+
+        def lifecycle() -> Any:
+            source = Screenshot(image_bytes=data, space=space)
+            resized = source.resize(target, ResizeMode.LETTERBOX)
+            resized.image
+            return resized
+
+        return lifecycle
+    raise ValueError(f"unknown operation {operation!r}")
+
+
+def measure_child(operation: str, resolution: str) -> dict[str, int]:
+    """Measure one operation in this process (called in a fresh interpreter)."""
+    op = _setup(operation, RESOLUTIONS[resolution])
+    gc.collect()
+    rss_before = _rss()
+    max_rss_before = _max_rss()
+
+    sampler = _RSSSampler()
+    sampler.start()
+    tracemalloc.start()
+    result = op()
+    _, traced_peak = tracemalloc.get_traced_memory()
+    rss_peak = sampler.stop()
+    gc.collect()
+    traced_retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss_after = _rss()
+    del result
+
+    stats = {"traced_peak": traced_peak, "traced_retained": traced_retained}
+    if rss_before is not None and rss_after is not None:
+        stats["rss_peak"] = max(rss_peak - rss_before, 0)
+        stats["rss_retained"] = max(rss_after - rss_before, 0)
+    else:
+        stats["rss_peak"] = max(_max_rss() - max_rss_before, 0)
+    return stats
+
+
+def measure(operations: list[str], resolutions: list[str]) -> dict[str, dict[str, int]]:
+    results = {}
+    for resolution in resolutions:
+        for operation in operations:
+            proc = subprocess.run(
+                [sys.executable, __file__, "--child", operation, resolution],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            results[f"{operation}/{resolution}"] = json.loads(proc.stdout)
+    return results
+
+
+def _mib(n: int | None) -> str:
+    return "-" if n is None else f"{n / 2**20:8.1f}"
+
+
+def compare(
+    results: dict[str, dict[str, int]],
+    baseline: dict[str, dict[str, int]],
+    tolerance: float,
+) -> list[str]:
+    regressions = []
+    for key, stats in results.items():
+        for metric, value in stats.items():
+            old = baseline.get(key, {}).get(metric)
+            if old is None:
+                continue
+            limit = old * (1 + tolerance) + SLACK_BYTES
+            if value > limit:
+                regressions.append(
+                    f"{key} {metric}: {_mib(value).strip()} MiB > "
+                    f"{_mib(int(limit)).strip()} MiB (baseline {_mib(old).strip()})"
+                )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--child", nargs=2, metavar=("OPERATION", "RESOLUTION"), help=argparse.SUPPRESS
+    )
+    parser.add_argument(
+        "--operations", nargs="+", default=list(OPERATIONS), choices=OPERATIONS
+    )
+    parser.add_argument(
+        "--resolutions", nargs="+", default=list(RESOLUTIONS), choices=list(RESOLUTIONS)
+    )
+    parser.add_argument("--save", type=Path, help="write results as a baseline")
+    parser.add_argument("--baseline", type=Path, help="compare against a baseline")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.15, help="allowed relative growth"
+    )
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure_child(*args.child)))
+        return 0
+
+    results = measure(args.operations, args.resolutions)
+    print(
+        f"{'operation':<22}{'traced peak':>12}{'retained':>10}"
+        f"{'rss peak':>10}{'retained':>10}  (MiB)"
+    )
+    for key, stats in results.items():
+        print(
+            f"{key:<22}{_mib(stats['traced_peak']):>12}"
+            f"{_mib(stats['traced_retained']):>10}"
+            f"{_mib(stats['rss_peak']):>10}{_mib(stats.get('rss_retained')):>10}"
+        )
+
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2) + "\n")
+    if args.baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text()), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
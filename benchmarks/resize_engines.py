@@ -0,0 +1,53 @@
+"""Compare ``ResizeEngine.PILLOW`` and ``ResizeEngine.AREA`` resample times.
+
+    python benchmarks/resize_engines.py
+
+Times only the resample (no PNG encoding) for common screenshot downscales.
+"""
+
+from __future__ import annotations
+
+import time
+
+from PIL import Image
+
+from gui_agent_screenshot_tools import ResizeEngine, ResizeMode, Space
+from gui_agent_screenshot_tools.screenshot import _resize_image
+
+CASES = [
+    ((3840, 2160), (1920, 1080), ResizeMode.STRETCH),
+    ((3840, 2160), (1280, 720), ResizeMode.STRETCH),
+    ((2560, 1440), (1280, 1280), ResizeMode.LETTERBOX),
+    ((1921, 1081), (960, 540), ResizeMode.STRETCH),
+    ((1920, 1080), (1024, 1024), ResizeMode.LETTERBOX),
+]
+
+
+def best_of(fn, repeat: int = 5) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    for source, target, mode in CASES:
+        img = Image.linear_gradient("L").resize(source).convert("RGB")
+        src = Space(width=source[0], height=source[1])
+        dst = Space(width=target[0], height=target[1])
+        timings = {
+            engine: best_of(lambda: _resize_image(img, src, dst, mode, engine=engine))
+            for engine in ResizeEngine
+        }
+        pillow, area = timings[ResizeEngine.PILLOW], timings[ResizeEngine.AREA]
+        print(
+            f"{source[0]}x{source[1]} -> {target[0]}x{target[1]} {mode.value:<9}"
+            f"  pillow {pillow * 1000:7.1f} ms  area {area * 1000:7.1f} ms"
+            f"  ({pillow / area:4.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,232 @@
+"""Geometry types (``Space``, ``Coordinate``, ``BBox``, ``ResizeMetadata``) are
+imported eagerly; everything else, including the Pillow and NumPy based
+modules, is imported on first attribute access.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .bbox import BBox
 from .coordinate import Coordinate
 from .resize import (
     ResizeMetadata,
     compute_letterbox_metadata,
+    compute_patch_metadata,
     compute_stretch_metadata,
+    plan_patch_space,
 )
-from .screenshot import Screenshot
 from .space import Space
-from .types import ResizeMode
+from .types import ResizeEngine, ResizeMode
+
+if TYPE_CHECKING:
+    from .archive import ArchiveError, ArchiveFrame, ArchiveReader, ArchiveWriter
+    from .cli import BatchProgress, BatchTarget, resize_directory
+    from .client import ResizeClient, ResizeServiceError
+    from .codec import (
+        CODEC_VERSION,
+        decode_boxes,
+        decode_message,
+        decode_points,
+        encode_boxes,
+        encode_message,
+        encode_points,
+    )
+    from .context import ResizeContext
+    from .desktop import DesktopLayout, Monitor
+    from .diff import changed_regions
+    from .foveation import FoveatedView, foveate
+    from .grid import GridProjection, grid_argmax, project_grid
+    from .history import ScreenshotHistory
+    from .image_cache import (
+        ImageCache,
+        ImageCacheStats,
+        clear_image_cache,
+        get_image_cache,
+        image_cache_stats,
+        set_image_cache_limit,
+    )
+    from .lut import (
+        AxisLUT,
+        forward_luts,
+        forward_transform_points,
+        inverse_luts,
+        transform_points,
+    )
+    from .masks import mask_to_space, polygon_to_space
+    from .normalized import (
+        PERMILLE_SPACE,
+        UNIT_SPACE,
+        NormalizedSpace,
+        denormalize_boxes,
+        denormalize_points,
+    )
+    from .screenshot import Screenshot
+    from .serialization import (
+        BlobRef,
+        BlobStore,
+        FileBlobStore,
+        SharedMemoryBlobStore,
+        dump_screenshot,
+        file_ref,
+        load_screenshot,
+    )
+    from .sequence import SequenceReader, SequenceWriter
+    from .server import ResizeJob, ResizeService, make_server
+    from .singleflight import ResizeCoalescer, SingleFlightStats
+    from .tiling import Tile, merge_tile_detections, tile_screenshot
+
+_LAZY_ATTRS = {
+    "ArchiveError": "archive",
+    "ArchiveFrame": "archive",
+    "ArchiveReader": "archive",
+    "ArchiveWriter": "archive",
+    "AxisLUT": "lut",
+    "BatchProgress": "cli",
+    "BatchTarget": "cli",
+    "BlobRef": "serialization",
+    "BlobStore": "serialization",
+    "CODEC_VERSION": "codec",
+    "DesktopLayout": "desktop",
+    "FileBlobStore": "serialization",
+    "FoveatedView": "foveation",
+    "GridProjection": "grid",
+    "ImageCache": "image_cache",
+    "ImageCacheStats": "image_cache",
+    "Monitor": "desktop",
+    "NormalizedSpace": "normalized",
+    "PERMILLE_SPACE": "normalized",
+    "ResizeClient": "client",
+    "ResizeCoalescer": "singleflight",
+    "ResizeContext": "context",
+    "ResizeJob": "server",
+    "ResizeService": "server",
+    "ResizeServiceError": "client",
+    "Screenshot": "screenshot",
+    "ScreenshotHistory": "history",
+    "SequenceReader": "sequence",
+    "SequenceWriter": "sequence",
+    "SharedMemoryBlobStore": "serialization",
+    "SingleFlightStats": "singleflight",
+    "Tile": "tiling",
+    "UNIT_SPACE": "normalized",
+    "changed_regions": "diff",
+    "clear_image_cache": "image_cache",
+    "decode_boxes": "codec",
+    "decode_message": "codec",
+    "decode_points": "codec",
+    "denormalize_boxes": "normalized",
+    "denormalize_points": "normalized",
+    "dump_screenshot": "serialization",
+    "encode_boxes": "codec",
+    "encode_message": "codec",
+    "encode_points": "codec",
+    "file_ref": "serialization",
+    "forward_luts": "lut",
+    "forward_transform_points": "lut",
+    "foveate": "foveation",
+    "get_image_cache": "image_cache",
+    "grid_argmax": "grid",
+    "image_cache_stats": "image_cache",
+    "inverse_luts": "lut",
+    "load_screenshot": "serialization",
+    "make_server": "server",
+    "mask_to_space": "masks",
+    "merge_tile_detections": "tiling",
+    "polygon_to_space": "masks",
+    "project_grid": "grid",
+    "resize_directory": "cli",
+    "set_image_cache_limit": "image_cache",
+    "tile_screenshot": "tiling",
+    "transform_points": "lut",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
+    "ArchiveError",
+    "ArchiveFrame",
+    "ArchiveReader",
+    "ArchiveWriter",
+    "AxisLUT",
     "BBox",
+    "BatchProgress",
+    "BatchTarget",
+    "BlobRef",
+    "BlobStore",
+    "CODEC_VERSION",
     "Coordinate",
+    "DesktopLayout",
+    "FileBlobStore",
+    "FoveatedView",
+    "GridProjection",
+    "ImageCache",
+    "ImageCacheStats",
+    "Monitor",
+    "NormalizedSpace",
+    "PERMILLE_SPACE",
+    "ResizeClient",
+    "ResizeCoalescer",
+    "ResizeContext",
+    "ResizeEngine",
+    "ResizeJob",
     "ResizeMetadata",
     "ResizeMode",
+    "ResizeService",
+    "ResizeServiceError",
     "Screenshot",
+    "ScreenshotHistory",
+    "SequenceReader",
+    "SequenceWriter",
+    "SharedMemoryBlobStore",
+    "SingleFlightStats",
     "Space",
+    "Tile",
+    "UNIT_SPACE",
+    "changed_regions",
+    "clear_image_cache",
     "compute_letterbox_metadata",
+    "compute_patch_metadata",
     "compute_stretch_metadata",
+    "decode_boxes",
+    "decode_message",
+    "decode_points",
+    "denormalize_boxes",
+    "denormalize_points",
+    "dump_screenshot",
+    "encode_boxes",
+    "encode_message",
+    "encode_points",
+    "file_ref",
+    "forward_luts",
+    "forward_transform_points",
+    "foveate",
+    "get_image_cache",
+    "grid_argmax",
+    "image_cache_stats",
+    "inverse_luts",
+    "load_screenshot",
+    "make_server",
+    "mask_to_space",
+    "merge_tile_detections",
+    "plan_patch_space",
+    "polygon_to_space",
+    "project_grid",
+    "resize_directory",
+    "set_image_cache_limit",
+    "tile_screenshot",
+    "transform_points",
 ]
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import time
+import zlib
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .resize import ResizeMetadata
+from .screenshot import Screenshot
+from .space import Space
+
+# File layout:
+#   header:  magic (8s) | version (H) | reserved (6x)
+#   record:  magic (4s) | meta_len (I) | data_len (Q) | crc32(meta + data) (I)
+#            meta (UTF-8 JSON) | data (encoded image bytes)
+_FILE_MAGIC = b"GASTARC\x00"
+_FILE_VERSION = 1
+_FILE_HEADER = struct.Struct("<8sH6x")
+_RECORD_MAGIC = b"FRM1"
+_RECORD_HEADER = struct.Struct("<4sIQI")
+
+
+class ArchiveError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class ArchiveFrame:
+    index: int
+    timestamp: float
+    screenshot: Screenshot
+
+
+def _encode_meta(screenshot: Screenshot, timestamp: float, **extra: Any) -> bytes:
+    metadata = screenshot.resize_metadata
+    meta = {
+        "space": screenshot.space.model_dump(),
+        "resize_metadata": metadata.to_dict() if metadata is not None else None,
+        "timestamp": timestamp,
+        **extra,
+    }
+    return json.dumps(meta, separators=(",", ":")).encode()
+
+
+def _check_file_header(
+    buf: bytes | mmap.mmap, path: Path, file_magic: bytes = _FILE_MAGIC
+) -> None:
+    if len(buf) < _FILE_HEADER.size:
+        raise ArchiveError(f"{path} is too short to be a screenshot archive")
+    magic, version = _FILE_HEADER.unpack_from(buf, 0)
+    if magic != file_magic:
+        raise ArchiveError(f"{path} is not a screenshot archive")
+    if version > _FILE_VERSION:
+        raise ArchiveError(f"{path} uses unsupported archive version {version}")
+
+
+def _scan(buf: bytes | mmap.mmap) -> tuple[list[int], int]:
+    """Walk record headers and return (record offsets, end of last intact record).
+
+    Only the final record is CRC-checked: the file is append-only, so a crash
+    can only leave a torn record at the tail.
+    """
+    offsets: list[int] = []
+    pos = _FILE_HEADER.size
+    size = len(buf)
+    while pos + _RECORD_HEADER.size <= size:
+        magic, meta_len, data_len, _ = _RECORD_HEADER.unpack_from(buf, pos)
+        end = pos + _RECORD_HEADER.size + meta_len + data_len
+        if magic != _RECORD_MAGIC or end > size:
+            break
+        offsets.append(pos)
+        pos = end
+    if offsets and not _crc_ok(buf, offsets[-1]):
+        pos = offsets.pop()
+    return offsets, pos
+
+
+def _crc_ok(buf: bytes | mmap.mmap, offset: int) -> bool:
+    _, meta_len, data_len, crc = _RECORD_HEADER.unpack_from(buf, offset)
+    start = offset + _RECORD_HEADER.size
+    with memoryview(buf)[start : start + meta_len + data_len] as body:
+        return zlib.crc32(body) == crc
+
+
+class ArchiveWriter:
+    """Append-only writer for a single-file screenshot archive.
+
+    Opening an existing archive truncates any torn record left by a crash
+    during a previous append, so the file is always a valid prefix.
+    """
+
+    _file_magic = _FILE_MAGIC
+
+    def __init__(self, path: str | os.PathLike[str], fsync: bool = True) -> None:
+        self.path = Path(path)
+        self.fsync = fsync
+        if self.path.exists() and self.path.stat().st_size > 0:
+            self._file = open(self.path, "r+b")
+            # Map rather than read: only the record headers are visited.
+            try:
+                with mmap.mmap(
+                    self._file.fileno(), 0, access=mmap.ACCESS_READ
+                ) as data:
+                    _check_file_header(data, self.path, self._file_magic)
+                    offsets, end = _scan(data)
+            except BaseException:
+                self._file.close()
+                raise
+            self._count = len(offsets)
+            self._file.truncate(end)
+            self._file.seek(end)
+        else:
+            self._file = open(self.path, "w+b")
+            self._file.write(_FILE_HEADER.pack(self._file_magic, _FILE_VERSION))
+            self._sync()
+            self._count = 0
+
+    def __enter__(self) -> ArchiveWriter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, screenshot: Screenshot, timestamp: float | None = None) -> int:
+        """Append a frame and return its index."""
+        meta = _encode_meta(
+            screenshot, time.time() if timestamp is None else timestamp
+        )
+        return self._write_record(meta, screenshot.image_bytes)
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._sync()
+            self._file.close()
+
+    def _write_record(self, meta: bytes, data: bytes) -> int:
+        crc = zlib.crc32(data, zlib.crc32(meta))
+        header = _RECORD_HEADER.pack(_RECORD_MAGIC, len(meta), len(data), crc)
+        self._file.write(header + meta)
+        self._file.write(data)
+        self._sync()
+        self._count += 1
+        return self._count - 1
+
+    def _sync(self) -> None:
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+
+class ArchiveReader:
+    """Memory-mapped reader with O(1) random access to archived frames.
+
+    Screenshots are returned lazily: their ``image_bytes`` are copied out of
+    the mapping on first access, so the reader must stay open until then.
+    """
+
+    _file_magic = _FILE_MAGIC
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        _check_file_header(self._mmap, self.path, self._file_magic)
+        self._offsets, _ = _scan(self._mmap)
+
+    def __enter__(self) -> ArchiveReader:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, index: int) -> ArchiveFrame:
+        if index < 0:
+            index += len(self._offsets)
+        if not 0 <= index < len(self._offsets):
+            raise IndexError(f"frame index {index} out of range")
+        return self._frame(index)
+
+    def __iter__(self) -> Iterator[ArchiveFrame]:
+        for index in range(len(self._offsets)):
+            yield self._frame(index)
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    def _record(self, index: int) -> tuple[dict[str, Any], int, int]:
+        """Parsed meta and the ``[start, end)`` span of the data of a record."""
+        offset = self._offsets[index]
+        _, meta_len, data_len, _ = _RECORD_HEADER.unpack_from(self._mmap, offset)
+        meta_start = offset + _RECORD_HEADER.size
+        data_start = meta_start + meta_len
+        meta = json.loads(self._mmap[meta_start:data_start])
+        return meta, data_start, data_start + data_len
+
+    def _frame(self, index: int) -> ArchiveFrame:
+        meta, data_start, data_end = self._record(index)
+        raw_metadata = meta["resize_metadata"]
+        screenshot = Screenshot.lazy(
+            lambda: self._mmap[data_start:data_end],
+            space=Space.model_validate(meta["space"]),
+            resize_metadata=(
+                ResizeMetadata.from_dict(raw_metadata)
+                if raw_metadata is not None
+                else None
+            ),
+        )
+        return ArchiveFrame(
+            index=index, timestamp=meta["timestamp"], screenshot=screenshot
+        )
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from PIL import Image
+
+# Modes with alpha are box-averaged premultiplied, like Pillow's resize does.
+_PREMULTIPLIED = {"RGBA": "RGBa", "LA": "La"}
+
+# A factor within this relative distance of an integer counts as near-integer:
+# the integer box average is followed by a small LANCZOS correction.
+NEAR_INTEGER_TOLERANCE = 0.02
+
+
+def area_factor(source: int, target: int) -> int | None:
+    """Integer box size for shrinking ``source`` pixels to ``target``, or ``None``."""
+    if not 0 < target <= source:
+        return None
+    factor = source // target
+    if source % target == 0 or abs(source / factor - target) <= (
+        NEAR_INTEGER_TOLERANCE * target
+    ):
+        return factor
+    return None
+
+
+def area_downscale(img: Image.Image, size: tuple[int, int]) -> Image.Image | None:
+    """Box-average ``img`` down to ``size`` when both factors are (near-)integer.
+
+    Returns ``None`` when the factors do not qualify, so the caller can fall
+    back to a general resample.
+    """
+    fx = area_factor(img.width, size[0])
+    fy = area_factor(img.height, size[1])
+    if fx is None or fy is None or fx == fy == 1:
+        return None
+    premultiplied = _PREMULTIPLIED.get(img.mode)
+    work = img.convert(premultiplied) if premultiplied else img
+    # ``reduce`` is Pillow's native box average over whole fx * fy blocks.
+    result = work.reduce((fx, fy))
+    if premultiplied:
+        result = result.convert(img.mode)
+    if result.size != size:
+        # Near-integer factor: fix up the last few pixels.
+        result = result.resize(size, Image.LANCZOS)
+    return result
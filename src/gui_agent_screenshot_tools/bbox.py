@@ -11,7 +11,7 @@ if TYPE_CHECKING:
     from .resize import ResizeMetadata
 
 
-class BBox(BaseModel, frozen=True):
+class BBox(BaseModel, frozen=True, defer_build=True):
     x: int
     y: int
     width: int
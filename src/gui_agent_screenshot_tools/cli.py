@@ -0,0 +1,308 @@
+"""Batch-resize screenshot directories into model-ready datasets.
+
+    gui-agent-resize captures/ -o dataset/ --target 1024x1024 --target 1280x720 \\
+        --mode letterbox --mode stretch --workers 8
+
+Every image found under the inputs is resized to each target/mode pair and
+written to ``<output>/<W>x<H>-<mode>/<relative path>`` as PNG. One JSON line per
+output is appended to ``<output>/manifest.jsonl`` with the source, output and
+``ResizeMetadata``; outputs already listed there are skipped on the next run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import sys
+import time
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TextIO
+
+from PIL import Image
+
+from .screenshot import Screenshot
+from .space import Space
+from .types import ResizeMode
+
+IMAGE_SUFFIXES = frozenset({".png", ".jpg", ".jpeg", ".webp", ".bmp"})
+
+MANIFEST_NAME = "manifest.jsonl"
+
+
+@dataclass(frozen=True)
+class BatchTarget:
+    space: Space
+    mode: ResizeMode
+
+    @property
+    def name(self) -> str:
+        return f"{self.space.width}x{self.space.height}-{self.mode.value}"
+
+
+@dataclass(frozen=True)
+class _SourceJob:
+    source: Path
+    relative: str
+    outputs: tuple[tuple[BatchTarget, Path], ...]
+    canvas_mode: str | None
+
+
+@dataclass(frozen=True)
+class BatchProgress:
+    done: int
+    total: int
+    failed: int
+    elapsed: float
+
+    @property
+    def rate(self) -> float:
+        """Finished source images per second."""
+        return self.done / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> float | None:
+        return (self.total - self.done) / self.rate if self.rate else None
+
+
+def parse_space(value: str) -> Space:
+    try:
+        width, height = (int(part) for part in value.lower().split("x"))
+    except ValueError:
+        raise ValueError(f"expected WIDTHxHEIGHT, got {value!r}") from None
+    return Space(width=width, height=height)
+
+
+def find_images(inputs: Iterable[Path]) -> list[tuple[Path, str]]:
+    """``(path, relative name)`` of every image under ``inputs``, sorted.
+
+    Relative names are prefixed with the input directory's name when more
+    than one input is given, so identically named files do not collide.
+    """
+    inputs = list(inputs)
+    found = []
+    for root in inputs:
+        prefix = Path(root.name) if len(inputs) > 1 else Path()
+        paths = [root] if root.is_file() else sorted(root.rglob("*"))
+        for path in paths:
+            if path.is_file() and path.suffix.lower() in IMAGE_SUFFIXES:
+                name = path.name if path == root else path.relative_to(root)
+                found.append((path, (prefix / name).as_posix()))
+    return found
+
+
+def read_manifest(path: Path) -> set[tuple[str, str]]:
+    """``(source, target name)`` pairs already recorded in a manifest."""
+    done: set[tuple[str, str]] = set()
+    if not path.exists():
+        return done
+    with path.open() as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+                done.add((record["source"], record["target"]))
+            except (ValueError, KeyError):
+                continue  # torn last line from an interrupted run
+    return done
+
+
+def _output_name(relative: str) -> str:
+    # "a.jpg" -> "a.jpg.png" so it cannot collide with a sibling "a.png".
+    return relative if relative.lower().endswith(".png") else relative + ".png"
+
+
+def _resize_source(job: _SourceJob) -> list[dict[str, Any]]:
+    data = job.source.read_bytes()
+    with Image.open(job.source) as img:
+        space = Space(width=img.width, height=img.height)
+    screenshot = Screenshot(image_bytes=data, space=space)
+    records = []
+    for target, output in job.outputs:
+        resized = screenshot.resize(target.space, target.mode, job.canvas_mode)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        tmp = output.with_name(output.name + ".tmp")
+        tmp.write_bytes(resized.image_bytes)
+        tmp.replace(output)
+        records.append(
+            {
+                "source": job.relative,
+                "target": target.name,
+                "output": output.as_posix(),
+                "resize_metadata": resized.resize_metadata.to_dict(),
+            }
+        )
+    return records
+
+
+def resize_directory(
+    inputs: Sequence[Path],
+    output: Path,
+    targets: Sequence[BatchTarget],
+    canvas_mode: str | None = None,
+    executor: Executor | None = None,
+    workers: int | None = None,
+    on_progress: Callable[[BatchProgress], None] | None = None,
+    on_error: Callable[[Path, Exception], None] | None = None,
+) -> BatchProgress:
+    """Resize every image under ``inputs`` to each of ``targets``.
+
+    Work recorded in ``<output>/manifest.jsonl`` is skipped. Source images
+    are processed in parallel on ``executor`` (a process pool by default).
+    """
+    output.mkdir(parents=True, exist_ok=True)
+    manifest_path = output / MANIFEST_NAME
+    done = read_manifest(manifest_path)
+
+    jobs = []
+    for source, relative in find_images(inputs):
+        outputs = tuple(
+            (target, output / target.name / _output_name(relative))
+            for target in targets
+            if (relative, target.name) not in done
+        )
+        if outputs:
+            jobs.append(_SourceJob(source, relative, outputs, canvas_mode))
+
+    owns_executor = executor is None
+    if executor is None:
+        executor = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+    start = time.perf_counter()
+    finished = failed = 0
+    try:
+        futures = {executor.submit(_resize_source, job): job for job in jobs}
+        with manifest_path.open("a+") as manifest:
+            _terminate_torn_line(manifest)
+            for future in as_completed(futures):
+                try:
+                    records = future.result()
+                except Exception as exc:
+                    failed += 1
+                    if on_error is not None:
+                        on_error(futures[future].source, exc)
+                else:
+                    for record in records:
+                        record["output"] = (
+                            Path(record["output"]).relative_to(output).as_posix()
+                        )
+                    _append(manifest, records)
+                finished += 1
+                if on_progress is not None:
+                    on_progress(
+                        BatchProgress(
+                            finished, len(jobs), failed, time.perf_counter() - start
+                        )
+                    )
+    finally:
+        if owns_executor:
+            executor.shutdown(cancel_futures=True)
+    return BatchProgress(finished, len(jobs), failed, time.perf_counter() - start)
+
+
+def _terminate_torn_line(manifest: TextIO) -> None:
+    if manifest.tell() == 0:
+        return
+    manifest.seek(manifest.tell() - 1)
+    if manifest.read(1) != "\n":
+        manifest.write("\n")
+
+
+def _append(manifest: TextIO, records: list[dict[str, Any]]) -> None:
+    for record in records:
+        manifest.write(json.dumps(record, separators=(",", ":")) + "\n")
+    manifest.flush()
+
+
+def _format_seconds(seconds: float | None) -> str:
+    if seconds is None:
+        return "--:--:--"
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}"
+
+
+def _reporter(interval: float) -> Callable[[BatchProgress], None]:
+    last = 0.0
+
+    def report(progress: BatchProgress) -> None:
+        nonlocal last
+        if progress.done < progress.total and progress.elapsed - last < interval:
+            return
+        last = progress.elapsed
+        print(
+            f"[{progress.done}/{progress.total}] {progress.rate:.1f} img/s"
+            f"  elapsed {_format_seconds(progress.elapsed)}"
+            f"  ETA {_format_seconds(progress.eta)}"
+            + (f"  failed {progress.failed}" if progress.failed else ""),
+            file=sys.stderr,
+        )
+
+    return report
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Batch-resize screenshot directories with a JSONL manifest."
+    )
+    parser.add_argument(
+        "inputs", nargs="+", type=Path, help="image files or directories"
+    )
+    parser.add_argument("-o", "--output", type=Path, required=True)
+    parser.add_argument(
+        "-t",
+        "--target",
+        action="append",
+        required=True,
+        help="target space as WIDTHxHEIGHT; repeatable",
+    )
+    parser.add_argument(
+        "-m",
+        "--mode",
+        action="append",
+        choices=[mode.value for mode in ResizeMode],
+        help="resize mode; repeatable (default: letterbox)",
+    )
+    parser.add_argument("--canvas-mode", help='output image mode, e.g. "L" or "P"')
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument(
+        "--progress-interval", type=float, default=2.0, help="seconds between reports"
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        spaces = [parse_space(value) for value in args.target]
+    except ValueError as exc:
+        parser.error(str(exc))
+    targets = [
+        BatchTarget(space, ResizeMode(mode))
+        for space in spaces
+        for mode in args.mode or [ResizeMode.LETTERBOX.value]
+    ]
+
+    def on_error(path: Path, exc: Exception) -> None:
+        print(f"error: {path}: {exc}", file=sys.stderr)
+
+    progress = resize_directory(
+        args.inputs,
+        args.output,
+        targets,
+        canvas_mode=args.canvas_mode,
+        workers=args.workers,
+        on_progress=_reporter(args.progress_interval),
+        on_error=on_error,
+    )
+    print(
+        f"resized {progress.done - progress.failed} of {progress.total} images"
+        f" in {_format_seconds(progress.elapsed)}"
+        + (f", {progress.failed} failed" if progress.failed else ""),
+        file=sys.stderr,
+    )
+    return 1 if progress.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
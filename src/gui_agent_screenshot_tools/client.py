@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import http.client
+import json
+import socket
+from urllib.parse import urlencode, urlsplit
+
+from .resize import ResizeMetadata
+from .screenshot import Screenshot
+from .server import METADATA_HEADER
+from .space import Space
+from .types import PadColor, ResizeMode
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path: str, timeout: float | None) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self._path = path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not None:
+            self.sock.settimeout(self.timeout)
+        self.sock.connect(self._path)
+
+
+class ResizeServiceError(RuntimeError):
+    pass
+
+
+class ResizeClient:
+    """Client for the resize service; ``resize`` mirrors ``Screenshot.resize``.
+
+    Connect with either ``unix_socket`` or ``url`` (``http://host:port``).
+    """
+
+    def __init__(
+        self,
+        unix_socket: str | None = None,
+        url: str | None = None,
+        timeout: float | None = 30.0,
+    ) -> None:
+        if (unix_socket is None) == (url is None):
+            raise ValueError("pass exactly one of unix_socket or url")
+        self.unix_socket = unix_socket
+        self.url = url
+        self.timeout = timeout
+
+    def _connection(self) -> http.client.HTTPConnection:
+        if self.unix_socket is not None:
+            return _UnixHTTPConnection(self.unix_socket, self.timeout)
+        parts = urlsplit(self.url)
+        return http.client.HTTPConnection(
+            parts.hostname or "127.0.0.1", parts.port, timeout=self.timeout
+        )
+
+    def resize(
+        self,
+        screenshot: Screenshot,
+        target: Space,
+        mode: ResizeMode,
+        canvas_mode: str | None = None,
+        pad_color: PadColor | None = None,
+    ) -> Screenshot:
+        params: dict[str, str | int] = {
+            "source_width": screenshot.space.width,
+            "source_height": screenshot.space.height,
+            "width": target.width,
+            "height": target.height,
+            "mode": mode.value,
+        }
+        if canvas_mode is not None:
+            params["canvas_mode"] = canvas_mode
+        if pad_color is not None:
+            params["pad_color"] = json.dumps(pad_color)
+
+        conn = self._connection()
+        try:
+            conn.request(
+                "POST",
+                f"/resize?{urlencode(params)}",
+                body=screenshot.image_bytes,
+                headers={"Content-Type": "application/octet-stream"},
+            )
+            response = conn.getresponse()
+            body = response.read()
+            metadata = response.getheader(METADATA_HEADER)
+        finally:
+            conn.close()
+
+        if response.status != 200 or metadata is None:
+            try:
+                message = json.loads(body)["error"]
+            except (ValueError, KeyError, TypeError):
+                message = body[:200].decode(errors="replace")
+            raise ResizeServiceError(f"resize failed ({response.status}): {message}")
+        return Screenshot(
+            image_bytes=body,
+            space=target,
+            resize_metadata=ResizeMetadata.from_dict(json.loads(metadata)),
+        )
@@ -0,0 +1,192 @@
+"""Fixed-layout binary encoding for spaces, coordinates, boxes and resize metadata.
+
+Every message starts with an 8-byte header: magic ``GAC1``, a format version
+(u8), a kind (u8) and two pad bytes. All fields are little-endian. Point and
+box batches are stored as int32 arrays that ``decode_points`` and
+``decode_boxes`` return as read-only views into the input buffer.
+
+Decoders accept any version up to ``CODEC_VERSION`` and reject newer ones.
+"""
+
+from __future__ import annotations
+
+import struct
+from enum import IntEnum
+from typing import Union
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .bbox import BBox
+from .coordinate import Coordinate
+from .resize import ResizeMetadata
+from .space import Space
+from .types import ResizeMode
+
+CODEC_VERSION = 1
+
+_MAGIC = b"GAC1"
+_HEADER = struct.Struct("<4sBB2x")
+
+
+class Kind(IntEnum):
+    SPACE = 1
+    COORDINATE = 2
+    BBOX = 3
+    RESIZE_METADATA = 4
+    POINTS = 5
+    BOXES = 6
+
+
+_SPACE = struct.Struct("<II")
+_COORDINATE = struct.Struct("<iiII")
+_BBOX = struct.Struct("<iiiiII")
+# source w/h, target w/h, mode, scale, offset x/y, scaled w/h
+_RESIZE_METADATA = struct.Struct("<IIIIB3xdiiII")
+# space w/h, row count; rows follow 4-byte aligned
+_BATCH = struct.Struct("<III")
+
+_MODES = {ResizeMode.LETTERBOX: 0, ResizeMode.STRETCH: 1}
+_MODES_BY_CODE = {code: mode for mode, code in _MODES.items()}
+
+_ARRAY_DTYPE = np.dtype("<i4")
+
+Message = Union[Space, Coordinate, BBox, ResizeMetadata]
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+def _header(kind: Kind) -> bytes:
+    return _HEADER.pack(_MAGIC, CODEC_VERSION, kind)
+
+
+def read_header(data: Buffer) -> tuple[int, Kind]:
+    """Return the ``(version, kind)`` of an encoded message."""
+    if len(data) < _HEADER.size:
+        raise ValueError("buffer too short for codec header")
+    magic, version, kind = _HEADER.unpack_from(data)
+    if magic != _MAGIC:
+        raise ValueError(f"bad codec magic {magic!r}")
+    if version > CODEC_VERSION:
+        raise ValueError(
+            f"codec version {version} is newer than supported version {CODEC_VERSION}"
+        )
+    try:
+        return version, Kind(kind)
+    except ValueError:
+        raise ValueError(f"unknown codec kind {kind}") from None
+
+
+def _unpack(layout: struct.Struct, data: Buffer) -> tuple:
+    if len(data) < _HEADER.size + layout.size:
+        raise ValueError("buffer too short for payload")
+    return layout.unpack_from(data, _HEADER.size)
+
+
+def encode_message(obj: Message) -> bytes:
+    """Encode a ``Space``, ``Coordinate``, ``BBox`` or ``ResizeMetadata``."""
+    if isinstance(obj, Space):
+        return _header(Kind.SPACE) + _SPACE.pack(obj.width, obj.height)
+    if isinstance(obj, Coordinate):
+        return _header(Kind.COORDINATE) + _COORDINATE.pack(
+            obj.x, obj.y, obj.space.width, obj.space.height
+        )
+    if isinstance(obj, BBox):
+        return _header(Kind.BBOX) + _BBOX.pack(
+            obj.x, obj.y, obj.width, obj.height, obj.space.width, obj.space.height
+        )
+    if isinstance(obj, ResizeMetadata):
+        return _header(Kind.RESIZE_METADATA) + _RESIZE_METADATA.pack(
+            obj.source_space.width,
+            obj.source_space.height,
+            obj.target_space.width,
+            obj.target_space.height,
+            _MODES[obj.mode],
+            obj.scale,
+            obj.offset_x,
+            obj.offset_y,
+            obj.scaled_width,
+            obj.scaled_height,
+        )
+    raise TypeError(f"cannot encode {type(obj).__name__}")
+
+
+def decode_message(data: Buffer) -> Message:
+    """Decode a message written by ``encode_message``."""
+    _, kind = read_header(data)
+    if kind == Kind.SPACE:
+        w, h = _unpack(_SPACE, data)
+        return Space(width=w, height=h)
+    if kind == Kind.COORDINATE:
+        x, y, w, h = _unpack(_COORDINATE, data)
+        return Coordinate(x=x, y=y, space=Space(width=w, height=h))
+    if kind == Kind.BBOX:
+        x, y, bw, bh, w, h = _unpack(_BBOX, data)
+        return BBox(x=x, y=y, width=bw, height=bh, space=Space(width=w, height=h))
+    if kind == Kind.RESIZE_METADATA:
+        sw, sh, tw, th, mode, scale, ox, oy, cw, ch = _unpack(_RESIZE_METADATA, data)
+        if mode not in _MODES_BY_CODE:
+            raise ValueError(f"unknown resize mode code {mode}")
+        return ResizeMetadata(
+            source_space=Space(width=sw, height=sh),
+            target_space=Space(width=tw, height=th),
+            mode=_MODES_BY_CODE[mode],
+            scale=scale,
+            offset_x=ox,
+            offset_y=oy,
+            scaled_width=cw,
+            scaled_height=ch,
+        )
+    raise ValueError(f"{kind.name} is a batch; use decode_points or decode_boxes")
+
+
+def _encode_batch(kind: Kind, rows: ArrayLike, columns: int, space: Space) -> bytes:
+    arr = np.asarray(rows)
+    if arr.size == 0:
+        arr = arr.reshape(0, columns)
+    if arr.ndim != 2 or arr.shape[1] != columns:
+        raise ValueError(f"rows must have shape (N, {columns})")
+    info = np.iinfo(_ARRAY_DTYPE)
+    if arr.size and (arr.min() < info.min or arr.max() > info.max):
+        raise ValueError("values do not fit in int32")
+    body = np.ascontiguousarray(arr, dtype=_ARRAY_DTYPE)
+    return (
+        _header(kind)
+        + _BATCH.pack(space.width, space.height, len(body))
+        + body.tobytes()
+    )
+
+
+def _decode_batch(
+    kind: Kind, data: Buffer, columns: int
+) -> tuple[NDArray[np.int32], Space]:
+    _, found = read_header(data)
+    if found != kind:
+        raise ValueError(f"expected {kind.name}, got {found.name}")
+    w, h, count = _unpack(_BATCH, data)
+    offset = _HEADER.size + _BATCH.size
+    if len(data) < offset + count * columns * _ARRAY_DTYPE.itemsize:
+        raise ValueError("buffer too short for payload")
+    rows = np.frombuffer(data, dtype=_ARRAY_DTYPE, count=count * columns, offset=offset)
+    rows = rows.reshape(count, columns)
+    rows.flags.writeable = False
+    return rows, Space(width=w, height=h)
+
+
+def encode_points(points: ArrayLike, space: Space) -> bytes:
+    """Encode an ``(N, 2)`` array of ``(x, y)`` points in ``space``."""
+    return _encode_batch(Kind.POINTS, points, 2, space)
+
+
+def decode_points(data: Buffer) -> tuple[NDArray[np.int32], Space]:
+    """Points and their space; the array is a read-only view into ``data``."""
+    return _decode_batch(Kind.POINTS, data, 2)
+
+
+def encode_boxes(boxes: ArrayLike, space: Space) -> bytes:
+    """Encode an ``(N, 4)`` array of ``[x, y, width, height]`` boxes in ``space``."""
+    return _encode_batch(Kind.BOXES, boxes, 4, space)
+
+
+def decode_boxes(data: Buffer) -> tuple[NDArray[np.int32], Space]:
+    """Boxes and their space; the array is a read-only view into ``data``."""
+    return _decode_batch(Kind.BOXES, data, 4)
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import io
+import threading
+
+from PIL import Image
+
+from .resize import (
+    ResizeMetadata,
+    compute_letterbox_metadata,
+    compute_stretch_metadata,
+)
+from .screenshot import (
+    Screenshot,
+    _encode_png,
+    _new_canvas,
+    _output_mode,
+    _resize_image,
+    _working_mode,
+)
+from .space import Space
+from .types import PadColor, ResizeEngine, ResizeMode
+
+
+class _Slot(threading.local):
+    def __init__(self) -> None:
+        self.canvases: dict[str, Image.Image] = {}
+        self.buffer = io.BytesIO()
+
+
+class ResizeContext:
+    """Reusable state for repeatedly resizing ``source`` screenshots to ``target``.
+
+    Keeps the ``ResizeMetadata``, a pre-filled letterbox canvas and an output
+    buffer. Each thread gets its own canvas and buffer, so one context can be
+    shared by a pool of workers.
+    """
+
+    def __init__(
+        self,
+        source: Space,
+        target: Space,
+        mode: ResizeMode,
+        canvas_mode: str | None = None,
+        pad_color: PadColor | None = None,
+        engine: ResizeEngine = ResizeEngine.PILLOW,
+    ) -> None:
+        self.source = source
+        self.target = target
+        self.mode = mode
+        self.canvas_mode = canvas_mode
+        self.pad_color = pad_color
+        self.engine = engine
+        self.metadata: ResizeMetadata = (
+            compute_letterbox_metadata(source, target)
+            if mode == ResizeMode.LETTERBOX
+            else compute_stretch_metadata(source, target)
+        )
+        self._slot = _Slot()
+
+    def resize(self, screenshot: Screenshot) -> Screenshot:
+        """Equivalent to ``screenshot.resize(target, mode, canvas_mode, pad_color, engine)``."""
+        if screenshot.space != self.source:
+            raise ValueError(
+                f"screenshot space {screenshot.space} does not match context source {self.source}"
+            )
+        img = screenshot.image
+        canvas = None
+        if self.mode == ResizeMode.LETTERBOX:
+            # The content rectangle is identical on every call, so pasting
+            # over the previous frame leaves the padding intact.
+            work_mode = _working_mode(img, _output_mode(img, self.canvas_mode))
+            canvas = self._slot.canvases.get(work_mode)
+            if canvas is None:
+                canvas = _new_canvas(work_mode, self.target, self.pad_color)
+                self._slot.canvases[work_mode] = canvas
+        result_img, metadata = _resize_image(
+            img,
+            self.source,
+            self.target,
+            self.mode,
+            self.canvas_mode,
+            self.pad_color,
+            metadata=self.metadata,
+            canvas=canvas,
+            engine=self.engine,
+        )
+        return Screenshot(
+            image_bytes=_encode_png(result_img, self._slot.buffer),
+            space=self.target,
+            resize_metadata=metadata,
+        )
@@ -10,7 +10,7 @@ if TYPE_CHECKING:
     from .resize import ResizeMetadata
 
 
-class Coordinate(BaseModel, frozen=True):
+class Coordinate(BaseModel, frozen=True, defer_build=True):
     x: int
     y: int
     space: Space
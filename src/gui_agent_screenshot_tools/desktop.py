@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .bbox import BBox
+from .coordinate import Coordinate
+from .lut import AxisLUT, _freeze, _rescale, inverse_luts
+from .resize import ResizeMetadata
+from .space import Space
+
+
+@dataclass(frozen=True)
+class Monitor:
+    """A monitor's rectangle on the virtual desktop and its DPI scale.
+
+    ``bbox`` is in virtual-desktop (logical) coordinates; the monitor's
+    screenshots are ``space``: the rectangle's size times ``scale`` pixels.
+    """
+
+    bbox: BBox
+    scale: float = 1.0
+
+    def __post_init__(self) -> None:
+        if self.scale <= 0:
+            raise ValueError("scale must be positive")
+
+    @property
+    def space(self) -> Space:
+        return Space(
+            width=max(round(self.bbox.width * self.scale), 1),
+            height=max(round(self.bbox.height * self.scale), 1),
+        )
+
+
+class DesktopLayout:
+    """Monitors on one virtual desktop, with mapping between global and per-monitor pixels.
+
+    Virtual-desktop coordinates start at (0, 0); shift OS layouts with
+    negative origins before building ``Monitor`` boxes. Monitors must not
+    overlap.
+    """
+
+    def __init__(self, monitors: Sequence[Monitor]) -> None:
+        if not monitors:
+            raise ValueError("at least one monitor is required")
+        self.space = monitors[0].bbox.space
+        if any(m.bbox.space != self.space for m in monitors):
+            raise ValueError("all monitor boxes must be in the same virtual space")
+        self.monitors = tuple(monitors)
+
+        # Grid index: monitor edges split the desktop into cells, each either
+        # inside exactly one monitor or in a gap (-1).
+        self._xs = np.unique(
+            [m.bbox.x for m in monitors] + [m.bbox.x + m.bbox.width for m in monitors]
+        )
+        self._ys = np.unique(
+            [m.bbox.y for m in monitors] + [m.bbox.y + m.bbox.height for m in monitors]
+        )
+        self._cells = np.full((len(self._ys), len(self._xs)), -1, dtype=np.int64)
+        for index, m in enumerate(monitors):
+            cols = slice(
+                np.searchsorted(self._xs, m.bbox.x),
+                np.searchsorted(self._xs, m.bbox.x + m.bbox.width),
+            )
+            rows = slice(
+                np.searchsorted(self._ys, m.bbox.y),
+                np.searchsorted(self._ys, m.bbox.y + m.bbox.height),
+            )
+            if (self._cells[rows, cols] != -1).any():
+                raise ValueError(f"monitor {index} overlaps another monitor")
+            self._cells[rows, cols] = index
+
+        # Per monitor: local pixel column/row -> global column/row.
+        self._to_global = tuple(
+            AxisLUT(
+                x=_axis_to_global(m.space.width, m.bbox.width, m.bbox.x),
+                y=_axis_to_global(m.space.height, m.bbox.height, m.bbox.y),
+            )
+            for m in monitors
+        )
+
+    def __len__(self) -> int:
+        return len(self.monitors)
+
+    def monitor_at(self, points: ArrayLike) -> NDArray[np.int64]:
+        """Index of the monitor under each ``(x, y)`` global point; -1 in gaps."""
+        pts = _points(points)
+        col = np.searchsorted(self._xs, pts[:, 0], side="right") - 1
+        row = np.searchsorted(self._ys, pts[:, 1], side="right") - 1
+        # Past the last edge lands in the all-gap last row/column of ``_cells``.
+        inside = (col >= 0) & (row >= 0)
+        result = np.full(len(pts), -1, dtype=np.int64)
+        result[inside] = self._cells[row[inside], col[inside]]
+        return result
+
+    def to_local_points(
+        self, points: ArrayLike
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """``(monitor indices, local points)`` for ``(N, 2)`` global points.
+
+        Local points are pixels of each monitor's ``space``; points in gaps get
+        monitor -1 and local ``(-1, -1)``.
+        """
+        pts = _points(points)
+        monitor = self.monitor_at(pts)
+        local = np.full(pts.shape, -1, dtype=np.int64)
+        for index, m in enumerate(self.monitors):
+            sel = monitor == index
+            if not sel.any():
+                continue
+            space = m.space
+            local[sel, 0] = _rescale(pts[sel, 0] - m.bbox.x, m.bbox.width, space.width)
+            local[sel, 1] = _rescale(
+                pts[sel, 1] - m.bbox.y, m.bbox.height, space.height
+            )
+        return monitor, local
+
+    def to_local(self, coord: Coordinate) -> tuple[int, Coordinate]:
+        """The monitor under a global coordinate and the coordinate on that monitor."""
+        if coord.space != self.space:
+            raise ValueError("coordinate must be in the layout's virtual space")
+        monitor, local = self.to_local_points([[coord.x, coord.y]])
+        index = int(monitor[0])
+        if index < 0:
+            raise ValueError(f"({coord.x}, {coord.y}) is not on any monitor")
+        x, y = (int(v) for v in local[0])
+        return index, Coordinate(x=x, y=y, space=self.monitors[index].space)
+
+    def to_global_points(
+        self,
+        monitor: int,
+        points: ArrayLike,
+        resize_metadata: ResizeMetadata | None = None,
+    ) -> NDArray[np.int64]:
+        """Map ``(N, 2)`` points on one monitor to global coordinates.
+
+        With ``resize_metadata``, points are in that monitor's resized
+        screenshot (e.g. model outputs) and the resize is undone first.
+        """
+        luts = self._to_global[monitor]
+        pts = _points(points)
+        if resize_metadata is not None:
+            pts = inverse_luts(resize_metadata, self.monitors[monitor].space).map(pts)
+        return luts.map(pts)
+
+    def to_global(
+        self,
+        monitor: int,
+        coord: Coordinate,
+        resize_metadata: ResizeMetadata | None = None,
+    ) -> Coordinate:
+        """Scalar ``to_global_points``; ``coord`` is in the monitor's (or resized) space."""
+        expected = (
+            resize_metadata.target_space
+            if resize_metadata is not None
+            else self.monitors[monitor].space
+        )
+        if coord.space != expected:
+            raise ValueError(f"coordinate must be in {expected}")
+        point = self.to_global_points(monitor, [[coord.x, coord.y]], resize_metadata)
+        return Coordinate(x=int(point[0, 0]), y=int(point[0, 1]), space=self.space)
+
+
+def _points(points: ArrayLike) -> NDArray[np.int64]:
+    pts = np.asarray(points, dtype=np.int64)
+    if pts.size == 0:
+        pts = pts.reshape(0, 2)
+    if pts.ndim != 2 or pts.shape[1] != 2:
+        raise ValueError("points must have shape (N, 2)")
+    return pts
+
+
+def _axis_to_global(pixels: int, logical: int, origin: int) -> NDArray[np.int64]:
+    return _freeze(_rescale(np.arange(pixels), pixels, logical) + origin)
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import NDArray
+from PIL import Image
+
+from .bbox import BBox
+from .screenshot import Screenshot
+
+
+def pixel_array(img: Image.Image) -> NDArray[np.uint8]:
+    """``(height, width, channels)`` uint8 view of an image, alpha dropped."""
+    if img.mode not in ("RGB", "L"):
+        img = img.convert("RGB")
+    arr = np.asarray(img)
+    return arr[:, :, None] if arr.ndim == 2 else arr
+
+
+def changed_mask(
+    before: NDArray[np.uint8], after: NDArray[np.uint8], tolerance: int
+) -> NDArray[np.bool_]:
+    """Per-pixel mask of channel differences larger than ``tolerance``."""
+    delta = np.abs(before.astype(np.int16) - after.astype(np.int16))
+    return delta.max(axis=2) > tolerance
+
+
+def block_grid(mask: NDArray[np.bool_], block_size: int) -> NDArray[np.bool_]:
+    """Reduce a pixel mask to one flag per ``block_size`` square (any pixel set)."""
+    h, w = mask.shape
+    rows = -(-h // block_size)
+    cols = -(-w // block_size)
+    padded = np.zeros((rows * block_size, cols * block_size), dtype=bool)
+    padded[:h, :w] = mask
+    return padded.reshape(rows, block_size, cols, block_size).any(axis=(1, 3))
+
+
+def _components(grid: NDArray[np.bool_]) -> list[tuple[int, int, int, int]]:
+    """Bounding ``(row0, col0, row1, col1)`` of 8-connected groups of set blocks."""
+    seen = np.zeros_like(grid)
+    rows, cols = grid.shape
+    boxes = []
+    for r, c in zip(*np.nonzero(grid)):
+        if seen[r, c]:
+            continue
+        seen[r, c] = True
+        stack = [(r, c)]
+        r0, c0, r1, c1 = r, c, r, c
+        while stack:
+            y, x = stack.pop()
+            r0, c0, r1, c1 = min(r0, y), min(c0, x), max(r1, y), max(c1, x)
+            for ny in range(max(y - 1, 0), min(y + 2, rows)):
+                for nx in range(max(x - 1, 0), min(x + 2, cols)):
+                    if grid[ny, nx] and not seen[ny, nx]:
+                        seen[ny, nx] = True
+                        stack.append((ny, nx))
+        boxes.append((int(r0), int(c0), int(r1), int(c1)))
+    return boxes
+
+
+def _merge_overlapping(boxes: NDArray[np.int64]) -> NDArray[np.int64]:
+    """Union ``(N, 4)`` boxes (inclusive ``x0, y0, x1, y1``) until none overlap.
+
+    Sweeps boxes sorted by ``x0``: box ``i`` only needs checking against the
+    run of later boxes starting at or before its ``x1``. Overlapping boxes are
+    joined, and the sweep repeats while a merge produced a new overlap.
+    """
+    while len(boxes) > 1:
+        boxes = boxes[np.argsort(boxes[:, 0], kind="stable")]
+        ends = np.searchsorted(boxes[:, 0], boxes[:, 2], side="right")
+        parent = np.arange(len(boxes))
+
+        def root(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        merged = False
+        for i in np.flatnonzero(ends > np.arange(1, len(boxes) + 1)):
+            others = boxes[i + 1 : ends[i]]
+            hits = (others[:, 1] <= boxes[i, 3]) & (boxes[i, 1] <= others[:, 3])
+            for j in i + 1 + np.flatnonzero(hits):
+                a, b = root(i), root(j)
+                if a != b:
+                    parent[max(a, b)] = min(a, b)
+                    merged = True
+        if not merged:
+            break
+        labels = np.array([root(i) for i in range(len(boxes))])
+        groups, inverse = np.unique(labels, return_inverse=True)
+        out = np.empty((len(groups), 4), dtype=boxes.dtype)
+        out[:, :2] = np.iinfo(boxes.dtype).max
+        out[:, 2:] = np.iinfo(boxes.dtype).min
+        np.minimum.at(out[:, 0], inverse, boxes[:, 0])
+        np.minimum.at(out[:, 1], inverse, boxes[:, 1])
+        np.maximum.at(out[:, 2], inverse, boxes[:, 2])
+        np.maximum.at(out[:, 3], inverse, boxes[:, 3])
+        boxes = out
+    return boxes
+
+
+def changed_regions(
+    before: Screenshot,
+    after: Screenshot,
+    tolerance: int = 8,
+    block_size: int = 16,
+) -> list[BBox]:
+    """Boxes, in the frames' ``Space``, around pixels that changed between two screenshots.
+
+    A pixel changed if any channel differs by more than ``tolerance``.
+    Changed pixels are grouped on a ``block_size`` grid, and each group's box
+    is then tightened to the exact changed pixels at full resolution.
+    """
+    if before.space != after.space:
+        raise ValueError("screenshots must share the same space")
+    if block_size <= 0:
+        raise ValueError("block_size must be positive")
+    mask = changed_mask(
+        pixel_array(before.image), pixel_array(after.image), tolerance
+    )
+    grid = block_grid(mask, block_size)
+
+    refined = []
+    for r0, c0, r1, c1 in _components(grid):
+        y0, x0 = r0 * block_size, c0 * block_size
+        region = mask[y0 : (r1 + 1) * block_size, x0 : (c1 + 1) * block_size]
+        ys = np.flatnonzero(region.any(axis=1))
+        xs = np.flatnonzero(region.any(axis=0))
+        refined.append((x0 + xs[0], y0 + ys[0], x0 + xs[-1], y0 + ys[-1]))
+    boxes = _merge_overlapping(np.array(refined, dtype=np.int64).reshape(-1, 4))
+
+    return [
+        BBox(
+            x=int(x0),
+            y=int(y0),
+            width=int(x1 - x0 + 1),
+            height=int(y1 - y0 + 1),
+            space=before.space,
+        )
+        for x0, y0, x1, y1 in boxes[np.lexsort((boxes[:, 0], boxes[:, 1]))]
+    ]
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from .bbox import BBox
+from .coordinate import Coordinate
+from .screenshot import Screenshot, _encode_png, _resize_image
+from .space import Space
+from .tiling import Tile
+from .types import ResizeMode
+
+
+@dataclass(frozen=True)
+class FoveatedView:
+    """A downscaled view of the whole frame plus a native-resolution crop.
+
+    Both parts are ``Tile``s, so ``to_source`` / ``coordinate_to_source`` map
+    detections from either image back to the original space.
+    """
+
+    overview: Tile
+    fovea: Tile
+
+
+def _fovea_window(space: Space, focus: BBox, size: Space) -> BBox:
+    width = min(max(size.width, focus.width), space.width)
+    height = min(max(size.height, focus.height), space.height)
+    center = focus.center
+    x = min(max(center.x - width // 2, 0), space.width - width)
+    y = min(max(center.y - height // 2, 0), space.height - height)
+    return BBox(x=x, y=y, width=width, height=height, space=space)
+
+
+def foveate(
+    screenshot: Screenshot,
+    overview_space: Space,
+    focus: Coordinate | BBox,
+    fovea_size: Space,
+    mode: ResizeMode = ResizeMode.LETTERBOX,
+) -> FoveatedView:
+    """Build a low-res overview and a native crop around ``focus`` from one decode.
+
+    The crop is ``fovea_size`` (grown to contain a larger ``focus`` box),
+    centered on the focus and shifted to stay inside the frame.
+    """
+    if focus.space != screenshot.space:
+        raise ValueError("focus must be in the screenshot's space")
+    if isinstance(focus, Coordinate):
+        focus = BBox(x=focus.x, y=focus.y, width=1, height=1, space=focus.space)
+    window = _fovea_window(screenshot.space, focus, fovea_size)
+
+    img = screenshot.image
+    overview_img, metadata = _resize_image(img, screenshot.space, overview_space, mode)
+    overview = Screenshot(
+        image_bytes=_encode_png(overview_img),
+        space=overview_space,
+        resize_metadata=metadata,
+    )
+    crop = img.crop(
+        (window.x, window.y, window.x + window.width, window.y + window.height)
+    )
+    full = BBox(
+        x=0,
+        y=0,
+        width=screenshot.space.width,
+        height=screenshot.space.height,
+        space=screenshot.space,
+    )
+    return FoveatedView(
+        overview=Tile(bbox=full, screenshot=overview),
+        fovea=Tile(bbox=window, screenshot=Screenshot.from_image(crop)),
+    )
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .coordinate import Coordinate
+from .lut import inverse_luts
+from .resize import ResizeMetadata
+from .space import Space
+from .types import ResizeMode
+
+
+class GridProjection(NamedTuple):
+    """Grid cells that overlap image content, projected into a target space.
+
+    ``boxes`` holds one ``[x, y, width, height]`` row per kept cell, ``cells``
+    its ``[row, col]`` in the input grid and ``scores`` its score.
+    """
+
+    boxes: NDArray[np.int64]
+    cells: NDArray[np.int64]
+    scores: NDArray
+    space: Space
+
+
+def _cell_edges(cells: int, pixels: int) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+    if cells > pixels:
+        raise ValueError(f"grid has {cells} cells along an axis of {pixels} pixels")
+    edges = np.arange(cells + 1) * pixels // cells
+    return edges[:-1], edges[1:] - 1
+
+
+def project_grid(
+    scores: ArrayLike, metadata: ResizeMetadata, target: Space | None = None
+) -> GridProjection:
+    """Project a 2-D score grid laid over ``metadata.target_space`` into ``target``.
+
+    Cells lying entirely in letterbox padding are dropped. Each remaining cell
+    is remapped like ``BBox.to_space`` (corner pixels through
+    ``transform_coordinate``). ``target`` defaults to the source space.
+    """
+    grid = np.asarray(scores)
+    if grid.ndim != 2:
+        raise ValueError("scores must be a 2-D array")
+    target = metadata.source_space if target is None else target
+    resized = metadata.target_space
+    rows, cols = grid.shape
+    x0, x1 = _cell_edges(cols, resized.width)
+    y0, y1 = _cell_edges(rows, resized.height)
+
+    keep_x = np.ones(cols, dtype=bool)
+    keep_y = np.ones(rows, dtype=bool)
+    if metadata.mode == ResizeMode.LETTERBOX:
+        keep_x = (x1 >= metadata.offset_x) & (x0 < metadata.offset_x + metadata.scaled_width)
+        keep_y = (y1 >= metadata.offset_y) & (y0 < metadata.offset_y + metadata.scaled_height)
+
+    luts = inverse_luts(metadata, target)
+    col_idx = np.flatnonzero(keep_x)
+    row_idx = np.flatnonzero(keep_y)
+    left, right = luts.x[x0[col_idx]], luts.x[x1[col_idx]]
+    top, bottom = luts.y[y0[row_idx]], luts.y[y1[row_idx]]
+
+    rr, cc = np.meshgrid(np.arange(len(row_idx)), np.arange(len(col_idx)), indexing="ij")
+    rr, cc = rr.ravel(), cc.ravel()
+    boxes = np.stack(
+        [left[cc], top[rr], right[cc] - left[cc] + 1, bottom[rr] - top[rr] + 1], axis=1
+    )
+    cells = np.stack([row_idx[rr], col_idx[cc]], axis=1)
+    return GridProjection(
+        boxes=boxes, cells=cells, scores=grid[cells[:, 0], cells[:, 1]], space=target
+    )
+
+
+def grid_argmax(
+    scores: ArrayLike, metadata: ResizeMetadata, target: Space | None = None
+) -> Coordinate:
+    """Center, in ``target``, of the highest-scoring grid cell that overlaps image content."""
+    projection = project_grid(scores, metadata, target)
+    if len(projection.scores) == 0:
+        raise ValueError("no grid cell overlaps the image content")
+    x, y, w, h = projection.boxes[int(np.argmax(projection.scores))]
+    return Coordinate(x=int(x + w // 2), y=int(y + h // 2), space=projection.space)
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+from .screenshot import Screenshot
+
+
+class ScreenshotHistory:
+    """Bounded buffer of recent screenshots, addressed by step index.
+
+    Steps are assigned sequentially by ``append``. When the combined size of
+    encoded bytes and decoded images exceeds ``max_bytes``, decoded images are
+    released oldest-first, then whole frames are dropped oldest-first. The
+    newest frame is always kept.
+    """
+
+    def __init__(self, max_bytes: int, max_frames: int | None = None) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        if max_frames is not None and max_frames <= 0:
+            raise ValueError("max_frames must be positive")
+        self.max_bytes = max_bytes
+        self.max_frames = max_frames
+        self._frames: dict[int, Screenshot] = {}
+        self._first_step = 0
+        self._next_step = 0
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def __contains__(self, step: object) -> bool:
+        return step in self._frames
+
+    def __getitem__(self, step: int) -> Screenshot:
+        if step < 0:
+            step += self._next_step
+        try:
+            return self._frames[step]
+        except KeyError:
+            raise KeyError(f"step {step} is not in history") from None
+
+    def __iter__(self) -> Iterator[Screenshot]:
+        return iter(list(self._frames.values()))
+
+    @property
+    def steps(self) -> range:
+        return range(self._first_step, self._next_step)
+
+    @property
+    def encoded_nbytes(self) -> int:
+        return sum(shot.encoded_nbytes for shot in self._frames.values())
+
+    @property
+    def decoded_nbytes(self) -> int:
+        return sum(shot.decoded_nbytes for shot in self._frames.values())
+
+    @property
+    def nbytes(self) -> int:
+        return self.encoded_nbytes + self.decoded_nbytes
+
+    def append(self, screenshot: Screenshot) -> int:
+        """Add a screenshot and return its step index."""
+        step = self._next_step
+        self._frames[step] = screenshot
+        self._next_step += 1
+        if self.max_frames is not None:
+            while len(self._frames) > self.max_frames:
+                self._drop_oldest()
+        self.enforce_budget()
+        return step
+
+    def enforce_budget(self) -> None:
+        """Evict until within ``max_bytes``.
+
+        Called by ``append``; call it directly after decoding frames obtained
+        from the history to reclaim memory eagerly.
+        """
+        decoded = {step: shot.decoded_nbytes for step, shot in self._frames.items()}
+        total = self.encoded_nbytes + sum(decoded.values())
+        if total <= self.max_bytes:
+            return
+        for step, nbytes in decoded.items():
+            if total <= self.max_bytes:
+                return
+            if nbytes:
+                self._frames[step].release_image()
+                total -= nbytes
+        while total > self.max_bytes and len(self._frames) > 1:
+            total -= self._drop_oldest()
+
+    def _drop_oldest(self) -> int:
+        shot = self._frames.pop(self._first_step)
+        self._first_step += 1
+        return shot.encoded_nbytes + shot.decoded_nbytes
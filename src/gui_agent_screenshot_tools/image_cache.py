@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ImageCacheStats:
+    entries: int
+    nbytes: int
+    max_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+def image_nbytes(img: Image.Image) -> int:
+    """Memory Pillow uses for the pixel data of a loaded image."""
+    if len(img.getbands()) > 1 or img.mode in ("I", "F"):
+        # Multi-band images are stored as 32-bit pixels, RGB included.
+        pixel_size = 4
+    elif img.mode.startswith("I;16"):
+        pixel_size = 2
+    else:
+        pixel_size = 1
+    return img.width * img.height * pixel_size
+
+
+class ImageCache:
+    """Thread-safe LRU cache of decoded images bounded by total pixel memory."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be non-negative")
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[object, tuple[Image.Image, int]] = OrderedDict()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        # Re-entrant: weakref finalizers may discard entries while a lookup
+        # on the same thread holds the lock.
+        self._lock = threading.RLock()
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        if value < 0:
+            raise ValueError("max_bytes must be non-negative")
+        with self._lock:
+            self._max_bytes = value
+            self._evict()
+
+    def get(self, key: object) -> Image.Image | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def peek(self, key: object) -> Image.Image | None:
+        """Like ``get`` but without touching the LRU order or the hit/miss counts."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry[0] if entry is not None else None
+
+    def put(self, key: object, img: Image.Image) -> None:
+        nbytes = image_nbytes(img)
+        with self._lock:
+            self._discard(key)
+            if nbytes > self._max_bytes:
+                return
+            self._entries[key] = (img, nbytes)
+            self._nbytes += nbytes
+            self._evict()
+
+    def nbytes_of(self, key: object) -> int:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry[1] if entry is not None else 0
+
+    def discard(self, key: object) -> None:
+        with self._lock:
+            self._discard(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    def stats(self) -> ImageCacheStats:
+        with self._lock:
+            return ImageCacheStats(
+                entries=len(self._entries),
+                nbytes=self._nbytes,
+                max_bytes=self._max_bytes,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+            )
+
+    def _discard(self, key: object) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._nbytes -= entry[1]
+
+    def _evict(self) -> None:
+        while self._nbytes > self._max_bytes and self._entries:
+            _, (_, nbytes) = self._entries.popitem(last=False)
+            self._nbytes -= nbytes
+            self._evictions += 1
+
+
+_cache = ImageCache()
+
+
+def get_image_cache() -> ImageCache:
+    return _cache
+
+
+def set_image_cache_limit(max_bytes: int) -> None:
+    _cache.max_bytes = max_bytes
+
+
+def image_cache_stats() -> ImageCacheStats:
+    return _cache.stats()
+
+
+def clear_image_cache() -> None:
+    _cache.clear()
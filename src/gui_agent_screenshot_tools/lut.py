@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from typing import Literal, NamedTuple
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .resize import ResizeMetadata
+from .space import Space
+from .types import ResizeMode
+
+Axis = Literal["x", "y"]
+
+
+class AxisLUT(NamedTuple):
+    """Per-axis lookup tables: ``x[i]`` is the mapped column of column ``i``, ``y[j]`` of row ``j``."""
+
+    x: NDArray[np.int64]
+    y: NDArray[np.int64]
+
+    def map(self, points: ArrayLike) -> NDArray[np.int64]:
+        """Map an ``(N, 2)`` array of integer ``(x, y)`` points by table gather."""
+        pts = np.asarray(points)
+        if pts.ndim != 2 or pts.shape[1] != 2:
+            raise ValueError("points must have shape (N, 2)")
+        xs, ys = pts[:, 0], pts[:, 1]
+        if pts.size and (
+            xs.min() < 0 or xs.max() >= len(self.x) or ys.min() < 0 or ys.max() >= len(self.y)
+        ):
+            raise ValueError(
+                f"points out of bounds for lookup tables of size {len(self.x)}x{len(self.y)}"
+            )
+        return np.stack([self.x[xs], self.y[ys]], axis=1)
+
+
+def _extent(space: Space, axis: Axis) -> int:
+    return space.width if axis == "x" else space.height
+
+
+def _rescale(values: NDArray, src: int, dst: int) -> NDArray[np.int64]:
+    """Pixel-center ratio scaling between axes of ``src`` and ``dst`` pixels."""
+    if src <= 1:
+        return np.zeros(values.shape, dtype=np.int64)
+    scaled = np.rint(values * (dst - 1) / (src - 1)).astype(np.int64)
+    return np.clip(scaled, 0, dst - 1)
+
+
+def inverse_transform_axis(
+    metadata: ResizeMetadata, values: ArrayLike, axis: Axis, target: Space
+) -> NDArray[np.int64]:
+    """Vectorized ``ResizeMetadata.transform_coordinate`` along one axis."""
+    vals = np.asarray(values)
+    s = _extent(metadata.source_space, axis) - 1
+    if metadata.mode == ResizeMode.STRETCH:
+        t = _extent(metadata.target_space, axis) - 1
+        src = np.rint(vals * s / t) if t > 0 else np.zeros(vals.shape)
+    else:
+        c = (metadata.scaled_width if axis == "x" else metadata.scaled_height) - 1
+        offset = metadata.offset_x if axis == "x" else metadata.offset_y
+        src = np.rint((vals - offset) * s / c) if c > 0 else np.zeros(vals.shape)
+    src = np.clip(src, 0, s).astype(np.int64)
+    if target == metadata.source_space:
+        return src
+    return _rescale(src, s + 1, _extent(target, axis))
+
+
+def forward_transform_axis(
+    metadata: ResizeMetadata, values: ArrayLike, axis: Axis, source: Space | None = None
+) -> NDArray[np.int64]:
+    """Vectorized ``ResizeMetadata.forward_transform_coordinate`` along one axis.
+
+    ``values`` are in ``source`` (default: ``metadata.source_space``); other
+    spaces are first mapped onto the metadata's source space.
+    """
+    vals = np.asarray(values)
+    if source is not None and source != metadata.source_space:
+        vals = _rescale(vals, _extent(source, axis), _extent(metadata.source_space, axis))
+    s = _extent(metadata.source_space, axis) - 1
+    t = _extent(metadata.target_space, axis) - 1
+    if metadata.mode == ResizeMode.STRETCH:
+        out = np.rint(vals * t / s) if s > 0 else np.zeros(vals.shape)
+    else:
+        c = (metadata.scaled_width if axis == "x" else metadata.scaled_height) - 1
+        offset = metadata.offset_x if axis == "x" else metadata.offset_y
+        out = (np.rint(vals * c / s) if s > 0 else np.zeros(vals.shape)) + offset
+    return np.clip(out, 0, t).astype(np.int64)
+
+
+def _cache(metadata: ResizeMetadata) -> dict[tuple[str, Space], AxisLUT]:
+    # Stored on the instance outside the dataclass fields, so it does not
+    # affect equality, hashing or serialization of the metadata.
+    return metadata.__dict__.setdefault("_axis_luts", {})
+
+
+def _freeze(arr: NDArray[np.int64]) -> NDArray[np.int64]:
+    arr.flags.writeable = False
+    return arr
+
+
+def inverse_luts(metadata: ResizeMetadata, target: Space) -> AxisLUT:
+    """Tables mapping every column/row of ``metadata.target_space`` into ``target``."""
+    cache = _cache(metadata)
+    key = ("inverse", target)
+    luts = cache.get(key)
+    if luts is None:
+        resized = metadata.target_space
+        luts = AxisLUT(
+            x=_freeze(inverse_transform_axis(metadata, np.arange(resized.width), "x", target)),
+            y=_freeze(inverse_transform_axis(metadata, np.arange(resized.height), "y", target)),
+        )
+        cache[key] = luts
+    return luts
+
+
+def forward_luts(metadata: ResizeMetadata, source: Space | None = None) -> AxisLUT:
+    """Tables mapping every column/row of ``source`` into ``metadata.target_space``."""
+    source = metadata.source_space if source is None else source
+    cache = _cache(metadata)
+    key = ("forward", source)
+    luts = cache.get(key)
+    if luts is None:
+        luts = AxisLUT(
+            x=_freeze(forward_transform_axis(metadata, np.arange(source.width), "x", source)),
+            y=_freeze(forward_transform_axis(metadata, np.arange(source.height), "y", source)),
+        )
+        cache[key] = luts
+    return luts
+
+
+def transform_points(
+    metadata: ResizeMetadata, points: ArrayLike, target: Space
+) -> NDArray[np.int64]:
+    """Batch ``transform_coordinate`` for ``(N, 2)`` points in the resized space."""
+    return inverse_luts(metadata, target).map(points)
+
+
+def forward_transform_points(
+    metadata: ResizeMetadata, points: ArrayLike, source: Space | None = None
+) -> NDArray[np.int64]:
+    """Batch ``forward_transform_coordinate`` for ``(N, 2)`` points in ``source``."""
+    return forward_luts(metadata, source).map(points)
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .lut import forward_luts, inverse_transform_axis
+from .resize import ResizeMetadata
+from .space import Space
+
+
+def mask_to_space(
+    mask: ArrayLike, metadata: ResizeMetadata, target: Space | None = None
+) -> NDArray:
+    """Resample a mask from the resized space into ``target`` (default: source space).
+
+    ``mask`` has shape ``(..., height, width)`` matching
+    ``metadata.target_space``; leading axes (e.g. one per element) are kept.
+    Each output pixel takes the nearest resized pixel, located with the same
+    pixel-center mapping as ``forward_transform_coordinate``, so letterbox
+    padding is never sampled.
+    """
+    arr = np.asarray(mask)
+    resized = metadata.target_space
+    if arr.ndim < 2 or arr.shape[-2:] != (resized.height, resized.width):
+        raise ValueError(
+            f"mask shape {arr.shape} does not end with ({resized.height}, {resized.width})"
+        )
+    luts = forward_luts(metadata, metadata.source_space if target is None else target)
+    return arr[..., luts.y[:, None], luts.x[None, :]]
+
+
+def polygon_to_space(
+    vertices: ArrayLike, metadata: ResizeMetadata, target: Space | None = None
+) -> NDArray[np.int64]:
+    """Map ``(N, 2)`` polygon vertices from the resized space into ``target``.
+
+    Vertices may be fractional; each is mapped exactly like
+    ``ResizeMetadata.transform_coordinate`` (including padding clamping).
+    """
+    pts = np.asarray(vertices)
+    if pts.ndim != 2 or pts.shape[1] != 2:
+        raise ValueError("vertices must have shape (N, 2)")
+    target = metadata.source_space if target is None else target
+    return np.stack(
+        [
+            inverse_transform_axis(metadata, pts[:, 0], "x", target),
+            inverse_transform_axis(metadata, pts[:, 1], "y", target),
+        ],
+        axis=1,
+    )
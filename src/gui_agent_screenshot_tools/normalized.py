@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+from pydantic import BaseModel, model_validator
+
+from .bbox import BBox
+from .coordinate import Coordinate
+from .lut import _rescale, inverse_luts
+from .resize import ResizeMetadata
+from .space import Space
+
+
+class NormalizedSpace(BaseModel, frozen=True):
+    """Resolution-independent space whose coordinates run from 0 to ``scale``.
+
+    Values map onto pixels with the library's pixel-center convention:
+    0 is the first pixel and ``scale`` the last.
+    """
+
+    scale: float
+
+    @model_validator(mode="after")
+    def _validate_positive(self) -> NormalizedSpace:
+        if self.scale <= 0:
+            raise ValueError("scale must be positive")
+        return self
+
+    def to_pixels(self, values: ArrayLike, extent: int) -> NDArray[np.int64]:
+        """Convert normalized values along an axis of ``extent`` pixels."""
+        pixels = np.rint(np.asarray(values, dtype=np.float64) * (extent - 1) / self.scale)
+        return np.clip(pixels, 0, extent - 1).astype(np.int64)
+
+    def coordinate(self, x: float, y: float, space: Space) -> Coordinate:
+        return Coordinate(
+            x=int(self.to_pixels(x, space.width)),
+            y=int(self.to_pixels(y, space.height)),
+            space=space,
+        )
+
+    def bbox(self, x1: float, y1: float, x2: float, y2: float, space: Space) -> BBox:
+        """Box from normalized corners; both corners are inclusive pixel positions."""
+        left, right = sorted(int(v) for v in self.to_pixels([x1, x2], space.width))
+        top, bottom = sorted(int(v) for v in self.to_pixels([y1, y2], space.height))
+        return BBox(
+            x=left, y=top, width=right - left + 1, height=bottom - top + 1, space=space
+        )
+
+    def normalize(self, coord: Coordinate) -> tuple[float, float]:
+        w = coord.space.width - 1
+        h = coord.space.height - 1
+        return (
+            coord.x * self.scale / w if w > 0 else 0.0,
+            coord.y * self.scale / h if h > 0 else 0.0,
+        )
+
+
+UNIT_SPACE = NormalizedSpace(scale=1.0)
+PERMILLE_SPACE = NormalizedSpace(scale=1000.0)
+
+
+def _resolve(
+    space: Space | None,
+    resize_metadata: ResizeMetadata | None,
+    target: Space | None,
+) -> tuple[Space, Space]:
+    if space is None:
+        if resize_metadata is None:
+            raise ValueError("either space or resize_metadata is required")
+        space = resize_metadata.target_space
+    if resize_metadata is not None and space != resize_metadata.target_space:
+        raise ValueError("space must match resize_metadata.target_space")
+    if target is None:
+        target = resize_metadata.source_space if resize_metadata is not None else space
+    return space, target
+
+
+def _axis_maps(
+    space: Space, target: Space, resize_metadata: ResizeMetadata | None
+) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+    if resize_metadata is not None:
+        return inverse_luts(resize_metadata, target)
+    # Generic pixel-center scaling, as in ``Coordinate.to_space``.
+    return (
+        _rescale(np.arange(space.width), space.width, target.width),
+        _rescale(np.arange(space.height), space.height, target.height),
+    )
+
+
+def denormalize_points(
+    points: ArrayLike,
+    normalized: NormalizedSpace,
+    space: Space | None = None,
+    *,
+    resize_metadata: ResizeMetadata | None = None,
+    target: Space | None = None,
+) -> NDArray[np.int64]:
+    """Map ``(N, 2)`` normalized points straight to pixel ``(x, y)`` in ``target``.
+
+    Points are normalized over ``space``, which defaults to the letterboxed
+    input ``resize_metadata.target_space``. ``target`` defaults to the
+    metadata's source space (or ``space`` without metadata). The result equals
+    ``normalized.coordinate(...).to_space(target, resize_metadata)`` per point.
+    """
+    pts = np.asarray(points, dtype=np.float64)
+    if pts.ndim != 2 or pts.shape[1] != 2:
+        raise ValueError("points must have shape (N, 2)")
+    space, target = _resolve(space, resize_metadata, target)
+    map_x, map_y = _axis_maps(space, target, resize_metadata)
+    xs = normalized.to_pixels(pts[:, 0], space.width)
+    ys = normalized.to_pixels(pts[:, 1], space.height)
+    return np.stack([map_x[xs], map_y[ys]], axis=1)
+
+
+def denormalize_boxes(
+    boxes: ArrayLike,
+    normalized: NormalizedSpace,
+    space: Space | None = None,
+    *,
+    resize_metadata: ResizeMetadata | None = None,
+    target: Space | None = None,
+) -> NDArray[np.int64]:
+    """Map ``(N, 4)`` normalized ``[x1, y1, x2, y2]`` boxes to ``[x, y, width, height]`` rows.
+
+    Each row equals ``normalized.bbox(...).to_space(target, resize_metadata)``.
+    """
+    arr = np.asarray(boxes, dtype=np.float64)
+    if arr.ndim != 2 or arr.shape[1] != 4:
+        raise ValueError("boxes must have shape (N, 4)")
+    space, target = _resolve(space, resize_metadata, target)
+    map_x, map_y = _axis_maps(space, target, resize_metadata)
+    x1 = normalized.to_pixels(arr[:, 0], space.width)
+    y1 = normalized.to_pixels(arr[:, 1], space.height)
+    x2 = normalized.to_pixels(arr[:, 2], space.width)
+    y2 = normalized.to_pixels(arr[:, 3], space.height)
+    left = map_x[np.minimum(x1, x2)]
+    right = map_x[np.maximum(x1, x2)]
+    top = map_y[np.minimum(y1, y2)]
+    bottom = map_y[np.maximum(y1, y2)]
+    return np.stack([left, top, right - left + 1, bottom - top + 1], axis=1)
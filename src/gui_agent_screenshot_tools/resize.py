@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
+from typing import Any
 
 from .coordinate import Coordinate
 from .space import Space
@@ -18,6 +20,31 @@ class ResizeMetadata:
     scaled_width: int
     scaled_height: int
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "source_space": self.source_space.model_dump(),
+            "target_space": self.target_space.model_dump(),
+            "mode": self.mode.value,
+            "scale": self.scale,
+            "offset_x": self.offset_x,
+            "offset_y": self.offset_y,
+            "scaled_width": self.scaled_width,
+            "scaled_height": self.scaled_height,
+        }
+
+    @staticmethod
+    def from_dict(data: dict[str, Any]) -> ResizeMetadata:
+        return ResizeMetadata(
+            source_space=Space.model_validate(data["source_space"]),
+            target_space=Space.model_validate(data["target_space"]),
+            mode=ResizeMode(data["mode"]),
+            scale=data["scale"],
+            offset_x=data["offset_x"],
+            offset_y=data["offset_y"],
+            scaled_width=data["scaled_width"],
+            scaled_height=data["scaled_height"],
+        )
+
     def transform_coordinate(self, coord: Coordinate, target: Space) -> Coordinate:
         """Inverse transform: target_space coords -> source_space coords, then re-map to target."""
         sw = self.source_space.width - 1
@@ -97,3 +124,85 @@ def compute_stretch_metadata(source: Space, target: Space) -> ResizeMetadata:
         scaled_width=target.width,
         scaled_height=target.height,
     )
+
+
+def plan_patch_space(
+    source: Space,
+    patch_size: int,
+    min_pixels: int | None = None,
+    max_pixels: int | None = None,
+) -> Space:
+    """Choose a target ``Space`` whose sides are multiples of ``patch_size``.
+
+    The source is scaled (preserving aspect ratio) only as far as needed to
+    satisfy the pixel bounds, then each side is rounded to the nearest patch
+    multiple, falling back to floor or ceil when rounding would break a
+    bound. For extreme aspect ratios, where one side is a single patch, the
+    long side is shortened to stay within ``max_pixels``. ``ValueError`` is
+    raised when no size near the source's aspect ratio meets both bounds.
+    Otherwise
+    letterboxing into the result pads by less than one patch per side.
+    """
+    if patch_size <= 0:
+        raise ValueError("patch_size must be positive")
+    if min_pixels is not None and max_pixels is not None and min_pixels > max_pixels:
+        raise ValueError("min_pixels must not exceed max_pixels")
+    if max_pixels is not None and max_pixels < patch_size * patch_size:
+        raise ValueError("max_pixels is smaller than a single patch")
+
+    area = source.width * source.height
+    scale = 1.0
+    if max_pixels is not None and area > max_pixels:
+        scale = math.sqrt(max_pixels / area)
+    if min_pixels is not None and area * scale * scale < min_pixels:
+        scale = math.sqrt(min_pixels / area)
+    patches_w = source.width * scale / patch_size
+    patches_h = source.height * scale / patch_size
+
+    cell = patch_size * patch_size
+
+    def snap(round_w, round_h) -> tuple[int, int]:
+        return max(1, round_w(patches_w)), max(1, round_h(patches_h))
+
+    def fits(cols: int, rows: int) -> bool:
+        pixels = cols * rows * cell
+        return (max_pixels is None or pixels <= max_pixels) and (
+            min_pixels is None or pixels >= min_pixels
+        )
+
+    cols, rows = snap(round, round)
+    if max_pixels is not None and cols * rows * cell > max_pixels:
+        cols, rows = snap(math.floor, math.floor)
+    elif min_pixels is not None and cols * rows * cell < min_pixels:
+        cols, rows = snap(math.ceil, math.ceil)
+    if not fits(cols, rows):
+        mixed = [
+            candidate
+            for candidate in (snap(math.floor, math.ceil), snap(math.ceil, math.floor))
+            if fits(*candidate)
+        ]
+        if mixed:
+            cols, rows = min(
+                mixed, key=lambda c: abs(math.log(c[0] / c[1] * patches_h / patches_w))
+            )
+    if max_pixels is not None and cols * rows * cell > max_pixels:
+        # Extreme aspect ratios: the short side is pinned at one patch, so
+        # only shortening the long side can meet the budget.
+        limit = max_pixels // cell
+        if cols >= rows:
+            cols = max(limit // rows, 1)
+        else:
+            rows = max(limit // cols, 1)
+    if not fits(cols, rows):
+        raise ValueError("no patch-aligned size satisfies the pixel bounds")
+    return Space(width=cols * patch_size, height=rows * patch_size)
+
+
+def compute_patch_metadata(
+    source: Space,
+    patch_size: int,
+    min_pixels: int | None = None,
+    max_pixels: int | None = None,
+) -> ResizeMetadata:
+    target = plan_patch_space(source, patch_size, min_pixels, max_pixels)
+    return compute_letterbox_metadata(source, target)
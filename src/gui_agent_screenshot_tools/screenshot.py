@@ -1,59 +1,447 @@
 from __future__ import annotations
 
+import binascii
 import io
-from functools import cached_property
+import threading
+import weakref
+from collections.abc import Callable, Iterator
+from typing import Any
 
 from PIL import Image
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PrivateAttr, model_serializer
 
+from .area import area_downscale
+from .bbox import BBox
+from .image_cache import get_image_cache
 from .resize import (
     ResizeMetadata,
     compute_letterbox_metadata,
     compute_stretch_metadata,
+    plan_patch_space,
 )
 from .space import Space
-from .types import ResizeMode
+from .types import PadColor, ResizeEngine, ResizeMode
+
+
+# Modes Pillow resamples with LANCZOS as-is; others (P, 1, CMYK, ...) are
+# resampled in RGB and converted back.
+_RESAMPLE_MODES = frozenset({"L", "LA", "RGB", "RGBA", "I", "F"})
+
+
+# Modes Pillow can write as PNG; other sources default to RGB(A) output.
+_PNG_MODES = frozenset({"1", "L", "LA", "I", "I;16", "I;16B", "P", "RGB", "RGBA"})
+
+
+def _has_alpha(img: Image.Image) -> bool:
+    return "A" in img.getbands() or "transparency" in img.info
+
+
+def _output_mode(img: Image.Image, canvas_mode: str | None) -> str:
+    if canvas_mode is not None:
+        return canvas_mode
+    if img.mode in _PNG_MODES:
+        return img.mode
+    return "RGBA" if _has_alpha(img) else "RGB"
+
+
+def _working_mode(img: Image.Image, out_mode: str) -> str:
+    if out_mode in _RESAMPLE_MODES:
+        return out_mode
+    if out_mode != "P" and _has_alpha(img):
+        return "RGBA"
+    return "RGB"
+
+
+def _to_output_mode(
+    img: Image.Image, out_mode: str, original: Image.Image
+) -> Image.Image:
+    if img.mode == out_mode:
+        return img
+    if out_mode == "P":
+        if original.mode == "P":
+            # Keep the capture's own palette rather than computing a new one.
+            return img.quantize(palette=original, dither=Image.Dither.NONE)
+        return img.quantize(method=Image.Quantize.FASTOCTREE, dither=Image.Dither.NONE)
+    return img.convert(out_mode)
+
+
+def _resize_image(
+    img: Image.Image,
+    source: Space,
+    target: Space,
+    mode: ResizeMode,
+    canvas_mode: str | None = None,
+    pad_color: PadColor | None = None,
+    metadata: ResizeMetadata | None = None,
+    canvas: Image.Image | None = None,
+    engine: ResizeEngine = ResizeEngine.PILLOW,
+) -> tuple[Image.Image, ResizeMetadata]:
+    """Resample ``img`` into ``target``.
+
+    ``metadata`` and ``canvas`` let callers reuse precomputed state; a reused
+    letterbox canvas must be in the working mode, already filled with padding.
+    """
+    out_mode = _output_mode(img, canvas_mode)
+    work_mode = _working_mode(img, out_mode)
+    # Converting before resampling means an "L" output resamples one band.
+    work_img = img if img.mode == work_mode else img.convert(work_mode)
+    if mode == ResizeMode.LETTERBOX:
+        if metadata is None:
+            metadata = compute_letterbox_metadata(source, target)
+        scaled = _scale(
+            work_img, (metadata.scaled_width, metadata.scaled_height), engine
+        )
+        if canvas is None:
+            canvas = _new_canvas(work_mode, target, pad_color)
+        canvas.paste(scaled, (metadata.offset_x, metadata.offset_y))
+        result = canvas
+    else:
+        if metadata is None:
+            metadata = compute_stretch_metadata(source, target)
+        result = _scale(work_img, (target.width, target.height), engine)
+    return _to_output_mode(result, out_mode, img), metadata
+
+
+def _scale(
+    img: Image.Image, size: tuple[int, int], engine: ResizeEngine
+) -> Image.Image:
+    if engine == ResizeEngine.AREA:
+        scaled = area_downscale(img, size)
+        if scaled is not None:
+            return scaled
+    return img.resize(size, Image.LANCZOS)
+
+
+def _new_canvas(
+    work_mode: str, target: Space, pad_color: PadColor | None
+) -> Image.Image:
+    return Image.new(
+        work_mode, (target.width, target.height), _pad_fill(work_mode, pad_color)
+    )
+
+
+def _pad_fill(work_mode: str, pad_color: PadColor | None) -> float | tuple | str:
+    # Color names are resolved by ``Image.new``; RGB(A) tuples are converted so
+    # they also fill grayscale canvases.
+    if pad_color is None:
+        return "black"
+    if (
+        isinstance(pad_color, tuple)
+        and len(pad_color) in (3, 4)
+        and len(pad_color) != Image.getmodebands(work_mode)
+    ):
+        source = "RGB" if len(pad_color) == 3 else "RGBA"
+        pixel = Image.new(source, (1, 1), pad_color).convert(work_mode)
+        return pixel.getpixel((0, 0))
+    return pad_color
+
+
+def _encode_png(img: Image.Image, buf: io.BytesIO | None = None) -> bytes:
+    if buf is None:
+        buf = io.BytesIO()
+    else:
+        buf.seek(0)
+    img.save(buf, format="PNG")
+    buf.truncate()
+    return buf.getvalue()
+
+
+_MIME_SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+    (b"BM", "image/bmp"),
+)
+
+
+def _sniff_mime(data: bytes) -> str:
+    for signature, mime in _MIME_SIGNATURES:
+        if data.startswith(signature):
+            return mime
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    return "application/octet-stream"
+
+
+def _save_format(format: str) -> str:
+    """Pillow format name for ``format``, accepting extensions such as "jpg"."""
+    name = format.upper()
+    extensions = Image.registered_extensions()  # also loads the plugins
+    if name not in Image.SAVE:
+        name = extensions.get("." + format.lower().lstrip("."), name)
+    if name not in Image.SAVE:
+        raise ValueError(f"unsupported image format {format!r}")
+    return name
+
+
+# Guards decode-once of ``image`` and load-once of lazy ``image_bytes``.
+# Striped rather than per instance so screenshots stay picklable/copyable.
+_DECODE_LOCKS = tuple(threading.RLock() for _ in range(64))
+
+
+def _decode_lock(key: object) -> threading.RLock:
+    return _DECODE_LOCKS[hash(key) % len(_DECODE_LOCKS)]
+
+
+# Re-encoded buffers and data URLs kept per screenshot, least recently used
+# dropped first.
+MAX_CACHED_PAYLOADS = 4
 
 
 class Screenshot(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    model_config = ConfigDict(arbitrary_types_allowed=True, defer_build=True)
 
     image_bytes: bytes
     space: Space
     resize_metadata: ResizeMetadata | None = None
 
-    @cached_property
+    _image_bytes_loader: Callable[[], bytes] | None = PrivateAttr(default=None)
+    _image_key: object = PrivateAttr(default_factory=object)
+    _image_finalizer: weakref.finalize | None = PrivateAttr(default=None)
+    # key -> (payload, nbytes), oldest first.
+    _payloads: dict[tuple, tuple[Any, int]] = PrivateAttr(default_factory=dict)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached when ``image_bytes`` was not supplied (see ``lazy``).
+        if name == "image_bytes":
+            private = self.__pydantic_private__ or {}
+            loader = private.get("_image_bytes_loader")
+            if loader is not None:
+                with _decode_lock(private["_image_key"]):
+                    data = self.__dict__.get("image_bytes")
+                    if data is None:
+                        data = loader()
+                        self.__dict__["image_bytes"] = data
+                return data
+        return super().__getattr__(name)
+
+    def __eq__(self, other: object) -> bool:
+        # Private attributes are cache bookkeeping; compare fields only.
+        if not isinstance(other, Screenshot):
+            return NotImplemented
+        return (
+            self.space == other.space
+            and self.resize_metadata == other.resize_metadata
+            and self.image_bytes == other.image_bytes
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "image_bytes":
+            self.release_image()
+            self._payloads = {}
+
+    def __copy__(self) -> Screenshot:
+        copied = super().__copy__()
+        copied._detach_image()
+        return copied
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> Screenshot:
+        copied = super().__deepcopy__(memo)
+        copied._detach_image()
+        return copied
+
+    def __setstate__(self, state: dict[Any, Any]) -> None:
+        super().__setstate__(state)
+        self._detach_image()
+
+    def _detach_image(self) -> None:
+        # Copies (``model_copy`` may replace ``image_bytes``) and unpickled
+        # instances get their own image-cache entry and payload cache.
+        private = self.__pydantic_private__
+        private["_image_key"] = object()
+        private["_image_finalizer"] = None
+        private["_payloads"] = {}
+
+    @model_serializer(mode="wrap")
+    def _serialize(self, handler: Any) -> Any:
+        # Load lazy bytes first so they are not silently left out.
+        self.image_bytes
+        return handler(self)
+
+    @property
     def image(self) -> Image.Image:
-        return Image.open(io.BytesIO(self.image_bytes))
+        """Decoded image, held in the process-wide image cache.
+
+        If the cache evicted it, the image is decoded again from ``image_bytes``.
+        Concurrent first accesses from several threads decode only once.
+        """
+        cache = get_image_cache()
+        img = cache.get(self._image_key)
+        if img is not None:
+            return img
+        with _decode_lock(self._image_key):
+            # Another thread may have decoded it meanwhile; the miss is counted.
+            img = cache.peek(self._image_key)
+            if img is None:
+                img = Image.open(io.BytesIO(self.image_bytes))
+                img.load()
+                self._cache_image(img)
+        return img
+
+    def _cache_image(self, img: Image.Image) -> None:
+        """Store an already decoded ``image`` so it need not be decoded from bytes."""
+        cache = get_image_cache()
+        cache.put(self._image_key, img)
+        if self._image_finalizer is None:
+            self._image_finalizer = weakref.finalize(
+                self, cache.discard, self._image_key
+            )
+
+    @property
+    def encoded_nbytes(self) -> int:
+        """Size of the held ``image_bytes`` plus cached re-encodings and data URLs.
+
+        ``image_bytes`` of a lazy screenshot count once loaded.
+        """
+        data = self.__dict__.get("image_bytes")
+        payloads = sum(nbytes for _, nbytes in list(self._payloads.values()))
+        return (len(data) if data is not None else 0) + payloads
+
+    @property
+    def decoded_nbytes(self) -> int:
+        """Memory held in the image cache for the decoded ``image``, or 0 if not cached."""
+        return get_image_cache().nbytes_of(self._image_key)
+
+    def release_image(self) -> None:
+        """Drop the decoded ``image``; it is decoded again on next access."""
+        get_image_cache().discard(self._image_key)
+
+    def _encoded(
+        self, format: str | None, quality: int | None
+    ) -> tuple[bytes | memoryview, str]:
+        if format is None:
+            data = self.image_bytes
+            return data, _sniff_mime(data)
+        format = _save_format(format)
+        key = ("encoded", format, quality)
+        buf = self._cached_payload(key)
+        if buf is None:
+            img = self.image
+            if format == "JPEG" and img.mode not in ("L", "RGB", "CMYK"):
+                img = img.convert("RGB")
+            buf = io.BytesIO()
+            options = {} if quality is None else {"quality": quality}
+            img.save(buf, format=format, **options)
+            self._cache_payload(key, buf, buf.tell())
+        # A view of the encoder's buffer; no getvalue() copy.
+        mime = Image.MIME.get(format, "application/octet-stream")
+        return buf.getbuffer(), mime
+
+    def to_data_url(self, format: str | None = None, quality: int | None = None) -> str:
+        """``data:<mime>;base64,...`` URL for model API payloads.
+
+        By default ``image_bytes`` are used as-is (MIME type sniffed from the
+        bytes); pass ``format`` (e.g. "JPEG", "WEBP") and ``quality`` to
+        re-encode. The most recent results are cached on this screenshot and
+        counted in ``encoded_nbytes``.
+        """
+        key = ("data_url", format and _save_format(format), quality)
+        url = self._cached_payload(key)
+        if url is None:
+            data, mime = self._encoded(format, quality)
+            url = f"data:{mime};base64," + binascii.b2a_base64(
+                data, newline=False
+            ).decode("ascii")
+            self._cache_payload(key, url, len(url))
+        return url
+
+    def _cached_payload(self, key: tuple) -> Any:
+        entry = self._payloads.pop(key, None)
+        if entry is None:
+            return None
+        self._payloads[key] = entry
+        return entry[0]
+
+    def _cache_payload(self, key: tuple, payload: Any, nbytes: int) -> None:
+        self._payloads[key] = (payload, nbytes)
+        while len(self._payloads) > MAX_CACHED_PAYLOADS:
+            self._payloads.pop(next(iter(self._payloads)), None)
+
+    def iter_base64_chunks(
+        self,
+        chunk_size: int = 3 * 64 * 1024,
+        format: str | None = None,
+        quality: int | None = None,
+    ) -> Iterator[bytes]:
+        """Stream the base64 of the encoded image without building it whole.
+
+        ``chunk_size`` counts raw bytes and is rounded down to a multiple of 3
+        so the chunks concatenate into valid base64.
+        """
+        step = max(chunk_size - chunk_size % 3, 3)
+        data, _ = self._encoded(format, quality)
+        view = memoryview(data)
+        for start in range(0, len(view), step):
+            yield binascii.b2a_base64(view[start : start + step], newline=False)
 
     @staticmethod
     def from_image(img: Image.Image) -> Screenshot:
-        buf = io.BytesIO()
-        img.save(buf, format="PNG")
         return Screenshot(
-            image_bytes=buf.getvalue(),
+            image_bytes=_encode_png(img),
             space=Space(width=img.width, height=img.height),
         )
 
-    def resize(self, target: Space, mode: ResizeMode) -> Screenshot:
-        img = self.image
+    @staticmethod
+    def lazy(
+        loader: Callable[[], bytes],
+        space: Space,
+        resize_metadata: ResizeMetadata | None = None,
+    ) -> Screenshot:
+        """Build a screenshot whose ``image_bytes`` are fetched by ``loader`` on first access."""
+        screenshot = Screenshot.model_construct(
+            space=space, resize_metadata=resize_metadata
+        )
+        screenshot._image_bytes_loader = loader
+        return screenshot
 
-        if mode == ResizeMode.LETTERBOX:
-            metadata = compute_letterbox_metadata(self.space, target)
-            scaled = img.resize(
-                (metadata.scaled_width, metadata.scaled_height), Image.LANCZOS
-            )
-            canvas = Image.new("RGB", (target.width, target.height), (0, 0, 0))
-            canvas.paste(scaled, (metadata.offset_x, metadata.offset_y))
-            result_img = canvas
-        else:
-            metadata = compute_stretch_metadata(self.space, target)
-            result_img = img.resize((target.width, target.height), Image.LANCZOS)
+    def resize(
+        self,
+        target: Space,
+        mode: ResizeMode,
+        canvas_mode: str | None = None,
+        pad_color: PadColor | None = None,
+        engine: ResizeEngine = ResizeEngine.PILLOW,
+    ) -> Screenshot:
+        """Resize to ``target``, recording the transform in ``resize_metadata``.
 
-        buf = io.BytesIO()
-        result_img.save(buf, format="PNG")
+        The output keeps the source's image mode unless ``canvas_mode`` is
+        given ("L" and "P" give much smaller PNGs for text-heavy UIs).
+        Letterbox padding is ``pad_color``, black by default.
+        ``ResizeEngine.AREA`` box-averages (near-)integer downscales such as
+        4K to 1080p; output size and metadata match the Pillow engine.
+        """
+        result_img, metadata = _resize_image(
+            self.image,
+            self.space,
+            target,
+            mode,
+            canvas_mode,
+            pad_color,
+            engine=engine,
+        )
         return Screenshot(
-            image_bytes=buf.getvalue(),
+            image_bytes=_encode_png(result_img),
             space=target,
             resize_metadata=metadata,
         )
+
+    def crop(self, bbox: BBox) -> Screenshot:
+        """Native-resolution crop of ``bbox``, which must be in this screenshot's space."""
+        if bbox.space != self.space:
+            raise ValueError("bbox must be in the screenshot's space")
+        region = self.image.crop(
+            (bbox.x, bbox.y, bbox.x + bbox.width, bbox.y + bbox.height)
+        )
+        return Screenshot.from_image(region)
+
+    def resize_to_patches(
+        self,
+        patch_size: int,
+        min_pixels: int | None = None,
+        max_pixels: int | None = None,
+    ) -> Screenshot:
+        """Letterbox into the patch-aligned ``Space`` chosen by ``plan_patch_space``."""
+        target = plan_patch_space(self.space, patch_size, min_pixels, max_pixels)
+        return self.resize(target, ResizeMode.LETTERBOX)
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import io
+import os
+import time
+import zlib
+
+import numpy as np
+from numpy.typing import NDArray
+from PIL import Image
+
+from .archive import ArchiveFrame, ArchiveReader, ArchiveWriter, _encode_meta
+from .diff import block_grid, changed_mask
+from .resize import ResizeMetadata
+from .screenshot import Screenshot, _encode_png
+from .space import Space
+
+# Same record layout as the archive. A keyframe record's data is the frame's
+# encoded image bytes; a delta record's data is the changed tile indices
+# (uint32, row-major over the tile grid) followed by the zlib-compressed raw
+# pixels of those tiles, in the same order.
+_SEQUENCE_MAGIC = b"GASTSEQ\x00"
+
+# Modes whose pixels map 1:1 onto a uint8 array; other modes are always keyframes.
+_DELTA_MODES = frozenset({"L", "LA", "RGB", "RGBA"})
+
+
+def _as_hwc(pixels: NDArray[np.uint8]) -> NDArray[np.uint8]:
+    return pixels[:, :, None] if pixels.ndim == 2 else pixels
+
+
+def _tile_slices(index: int, cols: int, tile_size: int) -> tuple[slice, slice]:
+    row, col = divmod(index, cols)
+    return (
+        slice(row * tile_size, (row + 1) * tile_size),
+        slice(col * tile_size, (col + 1) * tile_size),
+    )
+
+
+class SequenceWriter(ArchiveWriter):
+    """Archive writer that stores most frames as tile deltas against the previous one.
+
+    A frame is written as a keyframe (its encoded bytes, as in ``ArchiveWriter``)
+    every ``keyframe_interval`` frames, when its space or mode changes, or when
+    more than ``max_changed`` of its tiles differ; otherwise only the changed
+    ``tile_size`` tiles are stored, losslessly.
+    """
+
+    _file_magic = _SEQUENCE_MAGIC
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        keyframe_interval: int = 30,
+        tile_size: int = 32,
+        max_changed: float = 0.5,
+        fsync: bool = True,
+    ) -> None:
+        if keyframe_interval <= 0 or tile_size <= 0:
+            raise ValueError("keyframe_interval and tile_size must be positive")
+        super().__init__(path, fsync)
+        self.keyframe_interval = keyframe_interval
+        self.tile_size = tile_size
+        self.max_changed = max_changed
+        # Reopened files start with a keyframe: the previous pixels are unknown.
+        self._previous: NDArray[np.uint8] | None = None
+        self._previous_mode: str | None = None
+        self._keyframe = -1
+        self._since_keyframe = 0
+
+    def append(self, screenshot: Screenshot, timestamp: float | None = None) -> int:
+        """Append a frame and return its index."""
+        timestamp = time.time() if timestamp is None else timestamp
+        img = screenshot.image
+        pixels = np.asarray(img) if img.mode in _DELTA_MODES else None
+
+        delta = None
+        if (
+            pixels is not None
+            and self._previous is not None
+            and img.mode == self._previous_mode
+            and pixels.shape == self._previous.shape
+            and self._since_keyframe < self.keyframe_interval
+        ):
+            delta = self._encode_delta(self._previous, pixels)
+
+        if delta is None:
+            index = self._write_record(
+                _encode_meta(screenshot, timestamp, kind="key"),
+                screenshot.image_bytes,
+            )
+            self._keyframe = index
+            self._since_keyframe = 1
+        else:
+            tiles, data = delta
+            meta = _encode_meta(
+                screenshot,
+                timestamp,
+                kind="delta",
+                keyframe=self._keyframe,
+                tile_size=self.tile_size,
+                tiles=tiles,
+            )
+            index = self._write_record(meta, data)
+            self._since_keyframe += 1
+        self._previous = pixels
+        self._previous_mode = img.mode
+        return index
+
+    def _encode_delta(
+        self, previous: NDArray[np.uint8], current: NDArray[np.uint8]
+    ) -> tuple[int, bytes] | None:
+        current = _as_hwc(current)
+        grid = block_grid(changed_mask(_as_hwc(previous), current, 0), self.tile_size)
+        changed = np.flatnonzero(grid)
+        if len(changed) > self.max_changed * grid.size:
+            return None
+        cols = grid.shape[1]
+        body = b"".join(
+            current[_tile_slices(int(i), cols, self.tile_size)].tobytes()
+            for i in changed
+        )
+        return len(changed), changed.astype("<u4").tobytes() + zlib.compress(body)
+
+
+class SequenceReader(ArchiveReader):
+    """Random-access reader for ``SequenceWriter`` files.
+
+    Reading a delta frame replays the deltas since its keyframe; the last
+    decoded frame is kept, so iterating in order applies each delta once.
+    Frames come back as ordinary ``Screenshot`` objects: keyframes with their
+    stored bytes, delta frames with their image already in the image cache
+    and ``image_bytes`` rebuilt from the file and encoded as PNG on first
+    access, so the reader must stay open until then.
+    """
+
+    _file_magic = _SEQUENCE_MAGIC
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        super().__init__(path)
+        self._last: tuple[int, NDArray[np.uint8]] | None = None
+
+    def _frame(self, index: int) -> ArchiveFrame:
+        meta, _, _ = self._record(index)
+        if meta["kind"] == "key":
+            return super()._frame(index)
+
+        pixels = self._pixels(index, meta)
+        raw_metadata = meta["resize_metadata"]
+        screenshot = Screenshot.lazy(
+            # Replays from the file rather than closing over the pixels, so
+            # the image cache alone decides how long they stay in memory.
+            lambda: _encode_png(Image.fromarray(self._pixels(index, meta))),
+            space=Space.model_validate(meta["space"]),
+            resize_metadata=(
+                ResizeMetadata.from_dict(raw_metadata)
+                if raw_metadata is not None
+                else None
+            ),
+        )
+        screenshot._cache_image(Image.fromarray(pixels))
+        return ArchiveFrame(
+            index=index, timestamp=meta["timestamp"], screenshot=screenshot
+        )
+
+    def _pixels(self, index: int, meta: dict) -> NDArray[np.uint8]:
+        keyframe = meta["keyframe"]
+        # Read once: frames may be decoded from several threads, and the
+        # cached frame is replaced whole, never modified in place.
+        last = self._last
+        if last is not None and keyframe <= last[0] <= index:
+            start, pixels = last[0], last[1].copy()
+        else:
+            _, data_start, data_end = self._record(keyframe)
+            with Image.open(io.BytesIO(self._mmap[data_start:data_end])) as img:
+                pixels = np.array(img)
+            start = keyframe
+        for i in range(start + 1, index + 1):
+            self._apply_delta(pixels, i)
+        self._last = (index, pixels)
+        return pixels
+
+    def _apply_delta(self, pixels: NDArray[np.uint8], index: int) -> None:
+        meta, data_start, data_end = self._record(index)
+        count, tile_size = meta["tiles"], meta["tile_size"]
+        split = data_start + 4 * count
+        changed = np.frombuffer(self._mmap[data_start:split], dtype="<u4")
+        body = zlib.decompress(self._mmap[split:data_end])
+        target = _as_hwc(pixels)
+        cols = -(-target.shape[1] // tile_size)
+        pos = 0
+        for i in changed:
+            tile = target[_tile_slices(int(i), cols, tile_size)]
+            tile[...] = np.frombuffer(
+                body, dtype=np.uint8, count=tile.size, offset=pos
+            ).reshape(tile.shape)
+            pos += tile.size
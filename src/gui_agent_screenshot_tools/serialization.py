@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Literal, Protocol
+
+from pydantic import BaseModel
+
+from .resize import ResizeMetadata
+from .screenshot import Screenshot
+from .space import Space
+
+
+class BlobRef(BaseModel, frozen=True):
+    """Where a screenshot's pixel bytes live.
+
+    ``file``: ``key`` is a file path. ``sha256``: ``key`` is the content hash
+    in a ``FileBlobStore``. ``shm``: ``key`` is a shared-memory segment name.
+    """
+
+    scheme: Literal["file", "sha256", "shm"]
+    key: str
+    size: int
+
+
+class BlobStore(Protocol):
+    def put(self, data: bytes) -> BlobRef: ...
+
+    def get(self, ref: BlobRef) -> bytes: ...
+
+
+def file_ref(path: str | os.PathLike[str]) -> BlobRef:
+    """Reference an existing image file without copying it."""
+    p = Path(path).resolve()
+    return BlobRef(scheme="file", key=str(p), size=p.stat().st_size)
+
+
+class FileBlobStore:
+    """Content-addressed blob directory: identical images are stored once."""
+
+    def __init__(self, root: str | os.PathLike[str]) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest
+
+    def put(self, data: bytes) -> BlobRef:
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._path(digest)
+        if not path.exists():
+            path.parent.mkdir(exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent)
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        return BlobRef(scheme="sha256", key=digest, size=len(data))
+
+    def get(self, ref: BlobRef) -> bytes:
+        if ref.scheme != "sha256":
+            raise ValueError(f"FileBlobStore cannot resolve {ref.scheme!r} refs")
+        return self._path(ref.key).read_bytes()
+
+
+class SharedMemoryBlobStore:
+    """Blobs in named shared-memory segments, readable from other processes.
+
+    Segments live until ``close`` (or process exit) unlinks them.
+    """
+
+    def __init__(self) -> None:
+        self._segments: dict[str, shared_memory.SharedMemory] = {}
+
+    def put(self, data: bytes) -> BlobRef:
+        segment = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+        segment.buf[: len(data)] = data
+        self._segments[segment.name] = segment
+        return BlobRef(scheme="shm", key=segment.name, size=len(data))
+
+    def get(self, ref: BlobRef) -> bytes:
+        if ref.scheme != "shm":
+            raise ValueError(f"SharedMemoryBlobStore cannot resolve {ref.scheme!r} refs")
+        segment = self._segments.get(ref.key)
+        if segment is not None:
+            return bytes(segment.buf[: ref.size])
+        segment = shared_memory.SharedMemory(name=ref.key, track=False)
+        try:
+            return bytes(segment.buf[: ref.size])
+        finally:
+            segment.close()
+
+    def close(self) -> None:
+        for segment in self._segments.values():
+            segment.close()
+            segment.unlink()
+        self._segments.clear()
+
+
+def dump_screenshot(
+    screenshot: Screenshot,
+    store: BlobStore | None = None,
+    ref: BlobRef | None = None,
+) -> str:
+    """Compact JSON for ``screenshot`` with its bytes stored out of band.
+
+    The bytes are put into ``store``, unless ``ref`` points at bytes that are
+    already stored (e.g. ``file_ref``).
+    """
+    if ref is None:
+        if store is None:
+            raise ValueError("either store or ref is required")
+        ref = store.put(screenshot.image_bytes)
+    metadata = screenshot.resize_metadata
+    return json.dumps(
+        {
+            "space": screenshot.space.model_dump(),
+            "resize_metadata": metadata.to_dict() if metadata is not None else None,
+            "blob": ref.model_dump(),
+        },
+        separators=(",", ":"),
+    )
+
+
+def load_screenshot(data: str | bytes, store: BlobStore | None = None) -> Screenshot:
+    """Rebuild a screenshot from ``dump_screenshot`` output.
+
+    The blob is not read until ``image_bytes`` (or ``image``) is first used.
+    ``file`` refs need no store.
+    """
+    raw = json.loads(data)
+    ref = BlobRef.model_validate(raw["blob"])
+    if store is None and ref.scheme != "file":
+        raise ValueError(f"a blob store is required to resolve {ref.scheme!r} refs")
+
+    def load() -> bytes:
+        if ref.scheme == "file":
+            return Path(ref.key).read_bytes()
+        return store.get(ref)
+
+    metadata = raw["resize_metadata"]
+    return Screenshot.lazy(
+        load,
+        space=Space.model_validate(raw["space"]),
+        resize_metadata=(
+            ResizeMetadata.from_dict(metadata) if metadata is not None else None
+        ),
+    )
@@ -0,0 +1,315 @@
+"""Local resize service: one process per host resizes screenshots for many agents.
+
+Protocol (HTTP/1.1 over a Unix socket or TCP)::
+
+    POST /resize?source_width=W&source_height=H&width=W&height=H&mode=letterbox
+         [&canvas_mode=L][&pad_color=<JSON>]
+    body: encoded image bytes
+
+    200: body is the resized PNG; the ``X-Resize-Metadata`` header carries
+         ``ResizeMetadata.to_dict()`` as JSON.
+    4xx/5xx: JSON ``{"error": "..."}``.
+
+Requests arriving together are grouped into batches and run on a process pool.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import queue
+import socketserver
+import stat
+import threading
+from collections.abc import Sequence
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from PIL import Image, UnidentifiedImageError
+
+from .screenshot import Screenshot
+from .space import Space
+from .types import ResizeMode
+
+METADATA_HEADER = "X-Resize-Metadata"
+
+
+@dataclass(frozen=True)
+class ResizeJob:
+    image_bytes: bytes
+    source: Space
+    target: Space
+    mode: ResizeMode
+    canvas_mode: str | None = None
+    pad_color: Any = None
+
+
+_Result = tuple[bytes, dict[str, Any]]
+
+# Failures caused by the submitted job itself, answered with HTTP 400.
+_BAD_INPUT = (ValueError, UnidentifiedImageError, Image.DecompressionBombError)
+
+
+def _resize_batch(jobs: Sequence[ResizeJob]) -> list[_Result | Exception]:
+    results: list[_Result | Exception] = []
+    for job in jobs:
+        try:
+            source = Screenshot(image_bytes=job.image_bytes, space=job.source)
+            resized = source.resize(
+                job.target, job.mode, job.canvas_mode, job.pad_color
+            )
+            results.append((resized.image_bytes, resized.resize_metadata.to_dict()))
+        # Reported per job, not per batch, as plain exceptions that pickle
+        # cleanly back from a worker process.
+        except _BAD_INPUT as exc:
+            results.append(ValueError(str(exc)))
+        except Exception as exc:
+            results.append(RuntimeError(str(exc)))
+    return results
+
+
+class ResizeService:
+    """Groups submitted jobs into batches and spreads each batch over a worker pool.
+
+    A batch is dispatched once ``max_batch`` jobs are queued or ``max_delay``
+    seconds have passed since its first job arrived. It is split into up to
+    ``workers`` tasks, so jobs arriving together run in parallel while each
+    task still amortizes its round trip over several jobs.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        max_batch: int = 8,
+        max_delay: float = 0.005,
+        executor: Executor | None = None,
+    ) -> None:
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._owns_executor = executor is None
+        self._executor = executor or ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        if workers is None:
+            # Both stdlib pools record their size; fall back for other executors.
+            workers = getattr(self._executor, "_max_workers", None) or os.cpu_count()
+        self.workers = max(workers or 1, 1)
+        self._queue: queue.Queue[tuple[ResizeJob, Future] | None] = queue.Queue()
+        self._thread = threading.Thread(target=self._dispatch, daemon=True)
+        self._thread.start()
+
+    def submit(self, job: ResizeJob) -> Future[_Result]:
+        future: Future[_Result] = Future()
+        self._queue.put((job, future))
+        return future
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+        if self._owns_executor:
+            self._executor.shutdown()
+
+    def _dispatch(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            stop = False
+            while len(batch) < self.max_batch:
+                try:
+                    item = self._queue.get(timeout=self.max_delay)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            self._run(batch)
+            if stop:
+                return
+
+    def _run(self, batch: list[tuple[ResizeJob, Future]]) -> None:
+        parts = min(len(batch), self.workers)
+        bounds = [len(batch) * i // parts for i in range(parts + 1)]
+        for start, end in zip(bounds, bounds[1:]):
+            self._run_part(batch[start:end])
+
+    def _run_part(self, batch: list[tuple[ResizeJob, Future]]) -> None:
+        futures = [future for _, future in batch]
+        try:
+            done = self._executor.submit(_resize_batch, [job for job, _ in batch])
+        except Exception as exc:
+            for future in futures:
+                future.set_exception(exc)
+            return
+
+        def deliver(done: Future) -> None:
+            try:
+                results = done.result()
+            except Exception as exc:
+                for future in futures:
+                    future.set_exception(exc)
+                return
+            for future, result in zip(futures, results):
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+        done.add_done_callback(deliver)
+
+
+def _parse_job(path: str, body: bytes) -> ResizeJob:
+    url = urlsplit(path)
+    if url.path != "/resize":
+        raise LookupError(url.path)
+    params = {k: v[0] for k, v in parse_qs(url.query).items()}
+    try:
+        return ResizeJob(
+            image_bytes=body,
+            source=Space(
+                width=int(params["source_width"]), height=int(params["source_height"])
+            ),
+            target=Space(width=int(params["width"]), height=int(params["height"])),
+            mode=ResizeMode(params.get("mode", ResizeMode.LETTERBOX.value)),
+            canvas_mode=params.get("canvas_mode"),
+            pad_color=_pad_color(params.get("pad_color")),
+        )
+    except KeyError as exc:
+        raise ValueError(f"missing parameter {exc.args[0]}") from None
+
+
+def _pad_color(raw: str | None) -> Any:
+    if raw is None:
+        return None
+    value = json.loads(raw)
+    return tuple(value) if isinstance(value, list) else value
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: _ServiceServer
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        try:
+            job = _parse_job(self.path, body)
+            image_bytes, metadata = self.server.service.submit(job).result()
+        except LookupError:
+            self._send_error_json(404, "not found")
+        except ValueError as exc:
+            self._send_error_json(400, str(exc))
+        except Exception as exc:
+            self._send_error_json(500, str(exc))
+        else:
+            self._send(
+                200,
+                image_bytes,
+                "image/png",
+                {METADATA_HEADER: json.dumps(metadata, separators=(",", ":"))},
+            )
+
+    def _send_error_json(self, status: int, message: str) -> None:
+        body = json.dumps({"error": message}).encode()
+        self._send(status, body, "application/json")
+
+    def _send(
+        self,
+        status: int,
+        body: bytes,
+        content_type: str,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self) -> str:
+        # Unix socket peers have no (host, port) address.
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class _ServiceServer:
+    service: ResizeService
+    verbose: bool
+
+
+class _TCPServer(_ServiceServer, ThreadingHTTPServer):
+    pass
+
+
+class _UnixServer(
+    _ServiceServer, socketserver.ThreadingMixIn, socketserver.UnixStreamServer
+):
+    daemon_threads = True
+
+
+def make_server(
+    service: ResizeService,
+    unix_socket: str | None = None,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    verbose: bool = False,
+) -> socketserver.BaseServer:
+    """Bind an HTTP server for ``service``; call ``serve_forever`` to run it."""
+    server: _TCPServer | _UnixServer
+    if unix_socket is not None:
+        try:
+            is_socket = stat.S_ISSOCK(os.lstat(unix_socket).st_mode)
+        except FileNotFoundError:
+            pass
+        else:
+            # Only replace a stale socket, never an unrelated file.
+            if not is_socket:
+                raise FileExistsError(f"{unix_socket} exists and is not a socket")
+            os.unlink(unix_socket)
+        server = _UnixServer(unix_socket, _Handler)
+    else:
+        server = _TCPServer((host, port), _Handler)
+    server.service = service
+    server.verbose = verbose
+    return server
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Screenshot resize service.")
+    parser.add_argument("--unix-socket", help="listen on this Unix socket path")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-batch", type=int, default=8)
+    parser.add_argument("--max-delay-ms", type=float, default=5.0)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    service = ResizeService(
+        workers=args.workers,
+        max_batch=args.max_batch,
+        max_delay=args.max_delay_ms / 1000,
+    )
+    server = make_server(service, args.unix_socket, args.host, args.port, args.verbose)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+
+
+if __name__ == "__main__":
+    main()
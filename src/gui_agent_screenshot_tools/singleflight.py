@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import threading
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from dataclasses import dataclass
+
+from .screenshot import Screenshot
+from .space import Space
+from .types import PadColor, ResizeMode
+
+
+@dataclass(frozen=True)
+class SingleFlightStats:
+    calls: int
+    computed: int
+    deduplicated: int
+    in_flight: int
+
+
+class ResizeCoalescer:
+    """Share one ``Screenshot.resize`` among concurrent identical requests.
+
+    Requests are identical when the image content hash, target, mode and
+    encoding options match. The first caller computes the result; callers
+    arriving while it runs wait for and receive the same ``Screenshot``.
+    Nothing is cached once the computation finishes.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._in_flight: dict[Hashable, Future[Screenshot]] = {}
+        self._calls = 0
+        self._computed = 0
+        self._deduplicated = 0
+
+    @staticmethod
+    def key(
+        screenshot: Screenshot,
+        target: Space,
+        mode: ResizeMode,
+        canvas_mode: str | None = None,
+        pad_color: PadColor | None = None,
+    ) -> Hashable:
+        digest = hashlib.blake2b(screenshot.image_bytes, digest_size=16).digest()
+        return (digest, target.width, target.height, mode, canvas_mode, pad_color)
+
+    def resize(
+        self,
+        screenshot: Screenshot,
+        target: Space,
+        mode: ResizeMode,
+        canvas_mode: str | None = None,
+        pad_color: PadColor | None = None,
+    ) -> Screenshot:
+        key = self.key(screenshot, target, mode, canvas_mode, pad_color)
+        future, leader = self._join(key)
+        if leader:
+            self._run(
+                key,
+                future,
+                lambda: screenshot.resize(target, mode, canvas_mode, pad_color),
+            )
+        return future.result()
+
+    async def aresize(
+        self,
+        screenshot: Screenshot,
+        target: Space,
+        mode: ResizeMode,
+        canvas_mode: str | None = None,
+        pad_color: PadColor | None = None,
+    ) -> Screenshot:
+        """Async counterpart of ``resize``; shares in-flight work with it.
+
+        The resize runs in the default executor and completes for waiting
+        callers even if the task that started it is cancelled.
+        """
+        key = self.key(screenshot, target, mode, canvas_mode, pad_color)
+        future, leader = self._join(key)
+        if leader:
+            asyncio.get_running_loop().run_in_executor(
+                None,
+                self._run,
+                key,
+                future,
+                lambda: screenshot.resize(target, mode, canvas_mode, pad_color),
+            )
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> SingleFlightStats:
+        with self._lock:
+            return SingleFlightStats(
+                calls=self._calls,
+                computed=self._computed,
+                deduplicated=self._deduplicated,
+                in_flight=len(self._in_flight),
+            )
+
+    def _join(self, key: Hashable) -> tuple[Future[Screenshot], bool]:
+        with self._lock:
+            self._calls += 1
+            future = self._in_flight.get(key)
+            if future is not None:
+                self._deduplicated += 1
+                return future, False
+            future = Future()
+            self._in_flight[key] = future
+            self._computed += 1
+            return future, True
+
+    def _run(
+        self,
+        key: Hashable,
+        future: Future[Screenshot],
+        compute: Callable[[], Screenshot],
+    ) -> None:
+        try:
+            result = compute()
+        except BaseException as exc:
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+        finally:
+            with self._lock:
+                del self._in_flight[key]
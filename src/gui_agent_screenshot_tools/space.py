@@ -1,7 +1,7 @@
 from pydantic import BaseModel, model_validator
 
 
-class Space(BaseModel, frozen=True):
+class Space(BaseModel, frozen=True, defer_build=True):
     width: int
     height: int
 
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+from PIL import Image
+
+from .bbox import BBox
+from .coordinate import Coordinate
+from .screenshot import Screenshot, _encode_png, _resize_image
+from .space import Space
+from .types import ResizeMode
+
+
+@dataclass(frozen=True)
+class Tile:
+    """A model-ready view of ``bbox``, a region of the source screenshot.
+
+    ``screenshot.resize_metadata`` maps the view back to the crop
+    (``bbox.as_space``); ``bbox`` then places the crop in the source space.
+    """
+
+    bbox: BBox
+    screenshot: Screenshot
+
+    def to_source(self, detection: BBox) -> BBox:
+        return detection.to_space(
+            self.bbox.as_space,
+            resize_metadata=self.screenshot.resize_metadata,
+            offset=self.bbox,
+        )
+
+    def coordinate_to_source(self, coord: Coordinate) -> Coordinate:
+        local = coord.to_space(
+            self.bbox.as_space, resize_metadata=self.screenshot.resize_metadata
+        )
+        return self.bbox.absolutize(local)
+
+
+def _tile_starts(length: int, tile: int, stride: int) -> list[int]:
+    if length <= tile:
+        return [0]
+    starts = list(range(0, length - tile, stride))
+    starts.append(length - tile)
+    return starts
+
+
+def _render_tile(
+    region: Image.Image, crop: Space, model_space: Space, mode: ResizeMode
+) -> Screenshot:
+    img, metadata = _resize_image(region, crop, model_space, mode)
+    return Screenshot(
+        image_bytes=_encode_png(img), space=model_space, resize_metadata=metadata
+    )
+
+
+def tile_screenshot(
+    screenshot: Screenshot,
+    model_space: Space,
+    tile_size: Space | None = None,
+    overlap: float = 0.2,
+    mode: ResizeMode = ResizeMode.LETTERBOX,
+    max_workers: int | None = None,
+) -> list[Tile]:
+    """Split ``screenshot`` into overlapping tiles resized to ``model_space``.
+
+    Tiles cover ``tile_size`` source pixels (default: ``model_space``, i.e.
+    native resolution) and overlap by the given fraction of the tile size.
+    The image is decoded once; resizing and encoding run on a thread pool.
+    """
+    if not 0 <= overlap < 1:
+        raise ValueError("overlap must be in [0, 1)")
+    tile_size = model_space if tile_size is None else tile_size
+    space = screenshot.space
+    tile_w = min(tile_size.width, space.width)
+    tile_h = min(tile_size.height, space.height)
+    stride_x = max(1, round(tile_w * (1 - overlap)))
+    stride_y = max(1, round(tile_h * (1 - overlap)))
+
+    boxes = [
+        BBox(x=x, y=y, width=tile_w, height=tile_h, space=space)
+        for y in _tile_starts(space.height, tile_h, stride_y)
+        for x in _tile_starts(space.width, tile_w, stride_x)
+    ]
+    crop = Space(width=tile_w, height=tile_h)
+    img = screenshot.image
+    regions = [img.crop((b.x, b.y, b.x + b.width, b.y + b.height)) for b in boxes]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        shots = pool.map(lambda r: _render_tile(r, crop, model_space, mode), regions)
+        return [Tile(bbox=b, screenshot=s) for b, s in zip(boxes, shots)]
+
+
+def _corners(boxes: np.ndarray) -> tuple[np.ndarray, ...]:
+    x1, y1 = boxes[:, 0], boxes[:, 1]
+    return x1, y1, x1 + boxes[:, 2], y1 + boxes[:, 3]
+
+
+def _suppress(
+    boxes: np.ndarray,
+    tile_of: np.ndarray,
+    tile_boxes: np.ndarray,
+    order: np.ndarray,
+    iou_threshold: float,
+    containment_threshold: float,
+) -> list[int]:
+    x1, y1, x2, y2 = _corners(boxes)
+    tx1, ty1, tx2, ty2 = _corners(tile_boxes)
+    areas = boxes[:, 2] * boxes[:, 3]
+    keep: list[int] = []
+    remaining = order
+    while remaining.size:
+        i = remaining[0]
+        keep.append(int(i))
+        rest = remaining[1:]
+        iw = np.clip(np.minimum(x2[i], x2[rest]) - np.maximum(x1[i], x1[rest]), 0, None)
+        ih = np.clip(np.minimum(y2[i], y2[rest]) - np.maximum(y1[i], y1[rest]), 0, None)
+        inter = iw * ih
+        iou = inter / (areas[i] + areas[rest] - inter)
+        # Detections cut by a tile edge are mostly contained in the full one.
+        # Only pairs from different tiles meeting inside both tiles count, so
+        # nested elements (a button in a panel) are kept.
+        a, b = tile_of[i], tile_of[rest]
+        in_shared = (
+            (a != b)
+            & (np.maximum(x1[i], x1[rest]) >= np.maximum(tx1[a], tx1[b]))
+            & (np.maximum(y1[i], y1[rest]) >= np.maximum(ty1[a], ty1[b]))
+            & (np.minimum(x2[i], x2[rest]) <= np.minimum(tx2[a], tx2[b]))
+            & (np.minimum(y2[i], y2[rest]) <= np.minimum(ty2[a], ty2[b]))
+        )
+        containment = inter / np.minimum(areas[i], areas[rest])
+        duplicate = (iou >= iou_threshold) | (
+            in_shared & (containment >= containment_threshold)
+        )
+        remaining = rest[~duplicate]
+    return keep
+
+
+def merge_tile_detections(
+    tiles: Sequence[Tile],
+    detections: Sequence[Sequence[BBox]],
+    scores: Sequence[Sequence[float]] | None = None,
+    iou_threshold: float = 0.5,
+    containment_threshold: float = 0.9,
+) -> list[BBox]:
+    """Map per-tile detections into the source space and drop cross-tile duplicates.
+
+    ``detections[i]`` (and ``scores[i]``) belong to ``tiles[i]``. Duplicates
+    are suppressed greedily, keeping the highest score (or the largest box
+    when no scores are given): boxes overlapping by ``iou_threshold``, and
+    boxes from different tiles where one is mostly inside the other within
+    the tiles' shared region (a detection cut by a tile edge).
+    """
+    if len(detections) != len(tiles):
+        raise ValueError("detections must have one entry per tile")
+    mapped = [
+        tile.to_source(det) for tile, dets in zip(tiles, detections) for det in dets
+    ]
+    if not mapped:
+        return []
+    boxes = np.array([[b.x, b.y, b.width, b.height] for b in mapped], dtype=np.float64)
+    tile_of = np.array(
+        [index for index, dets in enumerate(detections) for _ in dets], dtype=np.int64
+    )
+    tile_boxes = np.array(
+        [[t.bbox.x, t.bbox.y, t.bbox.width, t.bbox.height] for t in tiles],
+        dtype=np.float64,
+    )
+    if scores is None:
+        rank = boxes[:, 2] * boxes[:, 3]
+    else:
+        rank = np.array([s for per_tile in scores for s in per_tile], dtype=np.float64)
+        if len(rank) != len(mapped):
+            raise ValueError("scores must match detections")
+    order = np.argsort(-rank, kind="stable")
+    keep = _suppress(
+        boxes, tile_of, tile_boxes, order, iou_threshold, containment_threshold
+    )
+    return [mapped[i] for i in keep]
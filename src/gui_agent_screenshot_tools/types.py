@@ -4,3 +4,14 @@ from enum import Enum
 class ResizeMode(Enum):
     LETTERBOX = "letterbox"
     STRETCH = "stretch"
+
+
+# Any fill Pillow's ``Image.new`` accepts: a band value, a tuple or a color name.
+PadColor = float | tuple[int, ...] | str
+
+
+class ResizeEngine(Enum):
+    # Pillow LANCZOS for every resize.
+    PILLOW = "pillow"
+    # Box averaging for (near-)integer downscale factors, LANCZOS otherwise.
+    AREA = "area"
@@ -44,6 +44,16 @@ def sample_image_bytes():
     return buf.getvalue()
 
 
+@pytest.fixture
+def make_screenshot():
+    """Factory for small solid-color screenshots."""
+
+    def make(color=0, size=(64, 48), mode="RGB"):
+        return Screenshot.from_image(Image.new(mode, size, color=color))
+
+    return make
+
+
 @pytest.fixture
 def sample_screenshot(sample_image_bytes, hd_space):
     return Screenshot(image_bytes=sample_image_bytes, space=hd_space)
@@ -0,0 +1,135 @@
+import pytest
+
+from gui_agent_screenshot_tools import (
+    ArchiveError,
+    ArchiveReader,
+    ArchiveWriter,
+    ResizeMode,
+    Space,
+)
+
+
+@pytest.fixture
+def archive_path(tmp_path):
+    return tmp_path / "trajectory.gsa"
+
+
+@pytest.fixture
+def frames(make_screenshot):
+    return [make_screenshot((i * 40, 0, 0)) for i in range(5)]
+
+
+class TestArchiveRoundtrip:
+    def test_append_returns_index(self, archive_path, frames):
+        with ArchiveWriter(archive_path, fsync=False) as writer:
+            indices = [writer.append(f, timestamp=float(i)) for i, f in enumerate(frames)]
+        assert indices == [0, 1, 2, 3, 4]
+
+    def test_random_access(self, archive_path, frames):
+        with ArchiveWriter(archive_path, fsync=False) as writer:
+            for i, f in enumerate(frames):
+                writer.append(f, timestamp=100.0 + i)
+        with ArchiveReader(archive_path) as reader:
+            assert len(reader) == 5
+            frame = reader[3]
+            assert frame.index == 3
+            assert frame.timestamp == 103.0
+            assert frame.screenshot.image_bytes == frames[3].image_bytes
+            assert reader[-1].screenshot.image_bytes == frames[4].image_bytes
+
+    def test_out_of_range(self, archive_path, frames):
+        with ArchiveWriter(archive_path, fsync=False) as writer:
+            writer.append(frames[0])
+        with ArchiveReader(archive_path) as reader:
+            with pytest.raises(IndexError):
+                reader[1]
+
+    def test_iteration_in_order(self, archive_path, frames):
+        with ArchiveWriter(archive_path, fsync=False) as writer:
+            for f in frames:
+                writer.append(f)
+        with ArchiveReader(archive_path) as reader:
+            data = [frame.screenshot.image_bytes for frame in reader]
+        assert data == [f.image_bytes for f in frames]
+
+    def test_resize_metadata_preserved(self, archive_path, frames):
+        resized = frames[0].resize(Space(width=32, height=32), ResizeMode.LETTERBOX)
+        with ArchiveWriter(archive_path, fsync=False) as writer:
+            writer.append(resized)
+        with ArchiveReader(archive_path) as reader:
+            shot = reader[0].screenshot
+            assert shot.space == resized.space
+            assert shot.resize_metadata == resized.resize_metadata
+
+    def test_reads_are_lazy(self, archive_path, frames):
+        with ArchiveWriter(archive_path, fsync=False) as writer:
+            writer.append(frames[0])
+        with ArchiveReader(archive_path) as reader:
+            shot = reader[0].screenshot
+            assert "image_bytes" not in shot.__dict__
+            assert shot.image.size == (64, 48)
+            assert "image_bytes" in shot.__dict__
+
+    def test_lazy_frame_model_dump_includes_bytes(self, archive_path, frames):
+        with ArchiveWriter(archive_path, fsync=False) as writer:
+            writer.append(frames[0])
+        with ArchiveReader(archive_path) as reader:
+            dumped = reader[0].screenshot.model_dump()
+        assert dumped["image_bytes"] == frames[0].image_bytes
+
+    def test_reopen_appends(self, archive_path, frames):
+        with ArchiveWriter(archive_path, fsync=False) as writer:
+            writer.append(frames[0])
+        with ArchiveWriter(archive_path, fsync=False) as writer:
+            assert len(writer) == 1
+            assert writer.append(frames[1]) == 1
+        with ArchiveReader(archive_path) as reader:
+            assert len(reader) == 2
+
+
+class TestArchiveCrashSafety:
+    def test_torn_tail_ignored_by_reader(self, archive_path, frames):
+        with ArchiveWriter(archive_path, fsync=False) as writer:
+            writer.append(frames[0])
+            writer.append(frames[1])
+        data = archive_path.read_bytes()
+        archive_path.write_bytes(data[:-10])
+        with ArchiveReader(archive_path) as reader:
+            assert len(reader) == 1
+
+    def test_corrupt_tail_ignored_by_reader(self, archive_path, frames):
+        with ArchiveWriter(archive_path, fsync=False) as writer:
+            writer.append(frames[0])
+            writer.append(frames[1])
+        data = bytearray(archive_path.read_bytes())
+        data[-1] ^= 0xFF
+        archive_path.write_bytes(bytes(data))
+        with ArchiveReader(archive_path) as reader:
+            assert len(reader) == 1
+
+    def test_writer_truncates_torn_tail(self, archive_path, frames):
+        with ArchiveWriter(archive_path, fsync=False) as writer:
+            writer.append(frames[0])
+            writer.append(frames[1])
+        data = archive_path.read_bytes()
+        archive_path.write_bytes(data[:-10])
+        with ArchiveWriter(archive_path, fsync=False) as writer:
+            assert writer.append(frames[2]) == 1
+        with ArchiveReader(archive_path) as reader:
+            assert [f.screenshot.image_bytes for f in reader] == [
+                frames[0].image_bytes,
+                frames[2].image_bytes,
+            ]
+
+    def test_rejects_foreign_file(self, tmp_path):
+        path = tmp_path / "not-an-archive"
+        path.write_bytes(b"\x89PNG\r\n\x1a\n" + b"\x00" * 32)
+        with pytest.raises(ArchiveError):
+            ArchiveReader(path)
+
+    def test_writer_rejects_foreign_file(self, tmp_path):
+        path = tmp_path / "not-an-archive"
+        path.write_bytes(b"\x89PNG\r\n\x1a\n" + b"\x00" * 32)
+        with pytest.raises(ArchiveError):
+            ArchiveWriter(path, fsync=False)
+        assert path.read_bytes().startswith(b"\x89PNG")
@@ -0,0 +1,117 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from gui_agent_screenshot_tools import (
+    ResizeContext,
+    ResizeEngine,
+    ResizeMode,
+    Screenshot,
+    Space,
+)
+from gui_agent_screenshot_tools.area import area_downscale, area_factor
+
+
+def _noise(size, mode="RGB"):
+    channels = {"L": (), "LA": (2,), "RGB": (3,), "RGBA": (4,)}[mode]
+    arr = np.random.default_rng(0).integers(
+        0, 256, size=(size[1], size[0], *channels), dtype=np.uint8
+    )
+    return Image.fromarray(arr)
+
+
+class TestAreaFactor:
+    @pytest.mark.parametrize(
+        "source, target, expected",
+        [
+            (3840, 1920, 2),
+            (3840, 1280, 3),
+            (1921, 960, 2),  # near-integer
+            (3840, 1024, None),  # 3.75
+            (1000, 1000, 1),
+            (100, 200, None),  # upscale
+        ],
+    )
+    def test_factor(self, source, target, expected):
+        assert area_factor(source, target) == expected
+
+
+class TestAreaDownscale:
+    def test_exact_factor_is_block_mean(self):
+        img = _noise((64, 48))
+        out = area_downscale(img, (32, 16))
+        blocks = np.asarray(img).reshape(16, 3, 32, 2, 3).astype(int)
+        expected = (blocks.sum(axis=(1, 3)) + 3) // 6
+        np.testing.assert_allclose(np.asarray(out), expected, atol=1)
+
+    def test_near_integer_size_corrected(self):
+        assert area_downscale(_noise((1921, 1081)), (960, 540)).size == (960, 540)
+
+    def test_non_integer_declines(self):
+        assert area_downscale(_noise((300, 200)), (200, 200)) is None
+        assert area_downscale(_noise((30, 20)), (30, 20)) is None
+
+    def test_alpha_is_premultiplied(self):
+        arr = np.zeros((2, 2, 4), dtype=np.uint8)
+        arr[0, 0] = (255, 0, 0, 255)  # one opaque red pixel, three transparent black
+        out = area_downscale(Image.fromarray(arr), (1, 1))
+        r, g, b, a = out.getpixel((0, 0))
+        assert r == 255 and a == 64
+
+    @pytest.mark.parametrize("mode", ["L", "LA", "RGB", "RGBA"])
+    def test_modes_preserved(self, mode):
+        assert area_downscale(_noise((40, 40), mode), (20, 20)).mode == mode
+
+
+class TestResizeEngine:
+    @pytest.mark.parametrize(
+        "source, target, mode",
+        [
+            ((1280, 720), (640, 360), ResizeMode.STRETCH),
+            ((1280, 720), (640, 640), ResizeMode.LETTERBOX),
+            ((641, 361), (320, 180), ResizeMode.STRETCH),
+            ((640, 480), (500, 500), ResizeMode.LETTERBOX),  # falls back
+        ],
+    )
+    def test_matches_pillow_engine_geometry(self, source, target, mode):
+        shot = Screenshot.from_image(_noise(source))
+        space = Space(width=target[0], height=target[1])
+        pillow = shot.resize(space, mode)
+        area = shot.resize(space, mode, engine=ResizeEngine.AREA)
+        assert area.space == pillow.space
+        assert area.resize_metadata == pillow.resize_metadata
+        assert area.image.size == pillow.image.size
+
+    def test_close_to_lanczos_on_smooth_content(self):
+        img = Image.linear_gradient("L").resize((512, 512)).convert("RGB")
+        shot = Screenshot.from_image(img)
+        target = Space(width=256, height=256)
+        pillow = np.asarray(shot.resize(target, ResizeMode.STRETCH).image, dtype=int)
+        area = np.asarray(
+            shot.resize(target, ResizeMode.STRETCH, engine=ResizeEngine.AREA).image,
+            dtype=int,
+        )
+        assert np.abs(pillow - area).max() <= 2
+
+    def test_fallback_is_identical_to_pillow(self):
+        shot = Screenshot.from_image(_noise((640, 480)))
+        target = Space(width=500, height=500)
+        area = shot.resize(target, ResizeMode.LETTERBOX, engine=ResizeEngine.AREA)
+        assert area.image_bytes == shot.resize(target, ResizeMode.LETTERBOX).image_bytes
+
+    def test_letterbox_padding_intact(self):
+        shot = Screenshot.from_image(Image.new("RGB", (400, 200), (255, 255, 255)))
+        out = shot.resize(
+            Space(width=200, height=200), ResizeMode.LETTERBOX, engine=ResizeEngine.AREA
+        )
+        assert out.image.getpixel((100, 0)) == (0, 0, 0)
+        assert out.image.getpixel((100, 100)) == (255, 255, 255)
+
+    def test_context_engine(self):
+        shot = Screenshot.from_image(_noise((800, 600)))
+        target = Space(width=400, height=300)
+        context = ResizeContext(
+            shot.space, target, ResizeMode.STRETCH, engine=ResizeEngine.AREA
+        )
+        expected = shot.resize(target, ResizeMode.STRETCH, engine=ResizeEngine.AREA)
+        assert context.resize(shot).image_bytes == expected.image_bytes
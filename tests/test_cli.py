@@ -0,0 +1,112 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from PIL import Image
+
+from gui_agent_screenshot_tools import (
+    BatchTarget,
+    ResizeMetadata,
+    ResizeMode,
+    Space,
+    resize_directory,
+)
+from gui_agent_screenshot_tools.cli import MANIFEST_NAME, main, parse_space
+
+
+@pytest.fixture
+def captures(tmp_path):
+    root = tmp_path / "captures"
+    (root / "session1").mkdir(parents=True)
+    Image.new("RGB", (320, 180), (200, 0, 0)).save(root / "session1" / "a.png")
+    Image.new("RGB", (180, 320), (0, 200, 0)).save(root / "session1" / "a.jpg")
+    Image.new("RGBA", (64, 64), (0, 0, 200, 255)).save(root / "b.png")
+    (root / "notes.txt").write_text("not an image")
+    return root
+
+
+TARGETS = [
+    BatchTarget(Space(width=128, height=128), ResizeMode.LETTERBOX),
+    BatchTarget(Space(width=100, height=50), ResizeMode.STRETCH),
+]
+
+
+def _manifest(out):
+    return [json.loads(line) for line in (out / MANIFEST_NAME).read_text().splitlines()]
+
+
+def _run(captures, out, **kwargs):
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        return resize_directory([captures], out, TARGETS, executor=executor, **kwargs)
+
+
+class TestResizeDirectory:
+    def test_writes_outputs_and_manifest(self, captures, tmp_path):
+        out = tmp_path / "out"
+        progress = _run(captures, out)
+        assert (progress.done, progress.total, progress.failed) == (3, 3, 0)
+
+        records = _manifest(out)
+        assert len(records) == 6
+        by_key = {(r["source"], r["target"]): r for r in records}
+        record = by_key[("session1/a.jpg", "128x128-letterbox")]
+        assert record["output"] == "128x128-letterbox/session1/a.jpg.png"
+        metadata = ResizeMetadata.from_dict(record["resize_metadata"])
+        assert metadata.source_space == Space(width=180, height=320)
+        with Image.open(out / record["output"]) as img:
+            assert img.size == (128, 128)
+        with Image.open(out / "100x50-stretch" / "b.png") as img:
+            assert img.size == (100, 50)
+
+    def test_resume_skips_recorded_work(self, captures, tmp_path):
+        out = tmp_path / "out"
+        _run(captures, out)
+        progress = _run(captures, out)
+        assert progress.total == 0
+        assert len(_manifest(out)) == 6
+
+    def test_resume_after_new_target_and_torn_line(self, captures, tmp_path):
+        out = tmp_path / "out"
+        _run(captures, out)
+        with (out / MANIFEST_NAME).open("a") as f:
+            f.write('{"source": "b.pn')
+        extra = BatchTarget(Space(width=64, height=64), ResizeMode.LETTERBOX)
+        with ThreadPoolExecutor() as executor:
+            progress = resize_directory(
+                [captures], out, [*TARGETS, extra], executor=executor
+            )
+        assert progress.total == 3
+        lines = (out / MANIFEST_NAME).read_text().splitlines()
+        assert len(lines) == 10  # 6 + torn line + 3
+        added = [json.loads(line)["target"] for line in lines[7:]]
+        assert added == ["64x64-letterbox"] * 3
+
+    def test_failures_reported(self, captures, tmp_path):
+        (captures / "broken.png").write_bytes(b"not a png")
+        errors = []
+        progress = _run(
+            captures, tmp_path / "out", on_error=lambda path, exc: errors.append(path)
+        )
+        assert progress.failed == 1
+        assert [p.name for p in errors] == ["broken.png"]
+
+    def test_progress_callback(self, captures, tmp_path):
+        seen = []
+        _run(captures, tmp_path / "out", on_progress=seen.append)
+        assert [p.done for p in seen] == [1, 2, 3]
+        assert seen[-1].eta == 0
+
+
+class TestMain:
+    def test_process_pool_run(self, captures, tmp_path, capsys):
+        out = tmp_path / "out"
+        args = [str(captures), "-o", str(out), "-t", "64x64", "--workers", "2"]
+        code = main([*args, "-m", "letterbox", "-m", "stretch"])
+        assert code == 0
+        assert len(_manifest(out)) == 6
+        assert "resized 3 of 3 images" in capsys.readouterr().err
+
+    def test_parse_space(self):
+        assert parse_space("1280X720") == Space(width=1280, height=720)
+        with pytest.raises(ValueError):
+            parse_space("1280")
@@ -0,0 +1,120 @@
+import numpy as np
+import pytest
+
+from gui_agent_screenshot_tools import (
+    CODEC_VERSION,
+    BBox,
+    Coordinate,
+    ResizeMode,
+    Space,
+    compute_letterbox_metadata,
+    compute_stretch_metadata,
+    decode_boxes,
+    decode_message,
+    decode_points,
+    encode_boxes,
+    encode_message,
+    encode_points,
+)
+from gui_agent_screenshot_tools.codec import Kind, read_header
+
+SPACE = Space(width=1920, height=1080)
+
+
+class TestMessages:
+    @pytest.mark.parametrize(
+        "obj",
+        [
+            SPACE,
+            Coordinate(x=1919, y=0, space=SPACE),
+            BBox(x=10, y=20, width=300, height=40, space=SPACE),
+            compute_letterbox_metadata(SPACE, Space(width=1024, height=1024)),
+            compute_stretch_metadata(SPACE, Space(width=640, height=480)),
+        ],
+    )
+    def test_roundtrip(self, obj):
+        assert decode_message(encode_message(obj)) == obj
+
+    def test_fixed_sizes(self):
+        assert len(encode_message(SPACE)) == 16
+        assert len(encode_message(Coordinate(x=1, y=2, space=SPACE))) == 24
+        assert len(encode_message(BBox(x=1, y=2, width=3, height=4, space=SPACE))) == 32
+
+    def test_decodes_from_memoryview_at_offset(self):
+        data = b"junk" + encode_message(Coordinate(x=5, y=6, space=SPACE))
+        assert decode_message(memoryview(data)[4:]) == Coordinate(x=5, y=6, space=SPACE)
+
+    def test_header(self):
+        assert read_header(encode_message(SPACE)) == (CODEC_VERSION, Kind.SPACE)
+
+    def test_rejects_newer_version(self):
+        data = bytearray(encode_message(SPACE))
+        data[4] = CODEC_VERSION + 1
+        with pytest.raises(ValueError, match="newer"):
+            decode_message(data)
+
+    def test_rejects_bad_magic_and_truncation(self):
+        data = encode_message(SPACE)
+        with pytest.raises(ValueError):
+            decode_message(b"XXXX" + data[4:])
+        with pytest.raises(ValueError):
+            decode_message(data[:-1])
+
+    def test_decoded_values_are_validated(self):
+        data = bytearray(encode_message(Coordinate(x=5, y=6, space=SPACE)))
+        data[8:12] = (5000).to_bytes(4, "little", signed=True)
+        with pytest.raises(ValueError):
+            decode_message(data)
+
+    def test_unsupported_type(self):
+        with pytest.raises(TypeError):
+            encode_message((1, 2))
+
+    def test_batch_needs_batch_decoder(self):
+        with pytest.raises(ValueError):
+            decode_message(encode_points([[1, 2]], SPACE))
+
+
+class TestBatches:
+    def test_points_roundtrip(self):
+        points = np.array([[0, 0], [1919, 1079], [5, 7]])
+        decoded, space = decode_points(encode_points(points, SPACE))
+        assert space == SPACE
+        np.testing.assert_array_equal(decoded, points)
+
+    def test_boxes_roundtrip(self):
+        boxes = np.array([[0, 0, 10, 10], [100, 200, 30, 40]])
+        decoded, space = decode_boxes(encode_boxes(boxes, SPACE))
+        assert space == SPACE
+        np.testing.assert_array_equal(decoded, boxes)
+
+    def test_zero_copy(self):
+        buf = bytearray(encode_points([[1, 2], [3, 4]], SPACE))
+        decoded, _ = decode_points(memoryview(buf))
+        assert not decoded.flags.writeable
+        assert not decoded.flags.owndata
+        buf[-4:] = (9).to_bytes(4, "little")
+        assert decoded[1, 1] == 9
+
+    def test_empty(self):
+        decoded, _ = decode_boxes(encode_boxes(np.empty((0, 4)), SPACE))
+        assert decoded.shape == (0, 4)
+
+    def test_kind_mismatch(self):
+        with pytest.raises(ValueError, match="expected BOXES"):
+            decode_boxes(encode_points([[1, 2]], SPACE))
+
+    def test_shape_and_range_checked(self):
+        with pytest.raises(ValueError):
+            encode_points([[1, 2, 3]], SPACE)
+        with pytest.raises(ValueError):
+            encode_points([[2**40, 0]], SPACE)
+
+    def test_truncated(self):
+        with pytest.raises(ValueError):
+            decode_points(encode_points([[1, 2]], SPACE)[:-1])
+
+    def test_mode_codes_are_stable(self):
+        md = compute_stretch_metadata(SPACE, Space(width=10, height=10))
+        assert md.mode == ResizeMode.STRETCH
+        assert encode_message(md)[24] == 1
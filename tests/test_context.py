@@ -0,0 +1,59 @@
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from gui_agent_screenshot_tools import ResizeContext, ResizeMode, Space
+
+
+@pytest.fixture
+def make_source(make_screenshot):
+    return functools.partial(make_screenshot, size=(320, 180))
+
+
+@pytest.fixture
+def target():
+    return Space(width=128, height=128)
+
+
+class TestResizeContext:
+    @pytest.mark.parametrize("mode", [ResizeMode.LETTERBOX, ResizeMode.STRETCH])
+    def test_matches_screenshot_resize(self, target, mode, make_source):
+        shot = make_source((10, 200, 30))
+        ctx = ResizeContext(shot.space, target, mode)
+        via_ctx = ctx.resize(shot)
+        direct = shot.resize(target, mode)
+        assert via_ctx.image_bytes == direct.image_bytes
+        assert via_ctx.resize_metadata == direct.resize_metadata
+
+    def test_canvas_reuse_keeps_padding(self, target, make_source):
+        first, second = make_source((255, 255, 255)), make_source((0, 0, 255))
+        ctx = ResizeContext(first.space, target, ResizeMode.LETTERBOX, pad_color=(9, 9, 9))
+        ctx.resize(first)
+        out = ctx.resize(second)
+        assert out.image.getpixel((0, 0)) == (9, 9, 9)
+        assert out.image.getpixel((64, 64)) == (0, 0, 255)
+        assert out.image_bytes == second.resize(target, ResizeMode.LETTERBOX, pad_color=(9, 9, 9)).image_bytes
+
+    def test_metadata_shared(self, target, make_source):
+        shot = make_source((1, 2, 3))
+        ctx = ResizeContext(shot.space, target, ResizeMode.LETTERBOX)
+        assert ctx.resize(shot).resize_metadata is ctx.metadata
+
+    def test_mixed_source_modes(self, target, make_source):
+        ctx = ResizeContext(Space(width=320, height=180), target, ResizeMode.LETTERBOX)
+        assert ctx.resize(make_source(100, mode="L")).image.mode == "L"
+        assert ctx.resize(make_source((1, 2, 3))).image.mode == "RGB"
+
+    def test_rejects_other_source_space(self, target, make_source):
+        ctx = ResizeContext(Space(width=100, height=100), target, ResizeMode.LETTERBOX)
+        with pytest.raises(ValueError):
+            ctx.resize(make_source((0, 0, 0)))
+
+    def test_threads_get_consistent_results(self, target, make_source):
+        shots = [make_source((i * 30, 255 - i * 30, 0)) for i in range(8)]
+        ctx = ResizeContext(shots[0].space, target, ResizeMode.LETTERBOX)
+        expected = [s.resize(target, ResizeMode.LETTERBOX).image_bytes for s in shots]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda s: ctx.resize(s).image_bytes, shots * 4))
+        assert results == expected * 4
@@ -0,0 +1,113 @@
+import numpy as np
+import pytest
+
+from gui_agent_screenshot_tools import (
+    BBox,
+    Coordinate,
+    DesktopLayout,
+    Monitor,
+    ResizeMode,
+    Space,
+    compute_letterbox_metadata,
+)
+
+VIRTUAL = Space(width=4480, height=1440)
+
+
+@pytest.fixture
+def layout():
+    # A 1080p monitor on the left and a 1440p monitor at 2x DPI on the right.
+    return DesktopLayout(
+        [
+            Monitor(BBox(x=0, y=0, width=1920, height=1080, space=VIRTUAL)),
+            Monitor(BBox(x=1920, y=0, width=2560, height=1440, space=VIRTUAL), scale=2.0),
+        ]
+    )
+
+
+class TestMonitor:
+    def test_space_includes_scale(self):
+        monitor = Monitor(BBox(x=0, y=0, width=1280, height=800, space=VIRTUAL), scale=1.5)
+        assert monitor.space == Space(width=1920, height=1200)
+
+    def test_invalid_scale(self):
+        with pytest.raises(ValueError):
+            Monitor(BBox(x=0, y=0, width=10, height=10, space=VIRTUAL), scale=0)
+
+
+class TestDesktopLayout:
+    def test_monitor_at(self, layout):
+        points = [[0, 0], [1919, 1079], [1920, 0], [4479, 1439], [100, 1200], [4480, 0]]
+        np.testing.assert_array_equal(layout.monitor_at(points), [0, 0, 1, 1, -1, -1])
+
+    def test_to_local(self, layout):
+        index, local = layout.to_local(Coordinate(x=3200, y=720, space=VIRTUAL))
+        assert index == 1
+        assert local.space == Space(width=5120, height=2880)
+        # Pixel-center scaling: 1280 * 5119 / 2559 rounds to 2561.
+        assert (local.x, local.y) == (2561, 1441)
+
+    def test_to_local_gap(self, layout):
+        with pytest.raises(ValueError, match="not on any monitor"):
+            layout.to_local(Coordinate(x=10, y=1300, space=VIRTUAL))
+
+    def test_to_local_points(self, layout):
+        monitor, local = layout.to_local_points([[5, 6], [1920, 0], [10, 1300]])
+        np.testing.assert_array_equal(monitor, [0, 1, -1])
+        np.testing.assert_array_equal(local, [[5, 6], [0, 0], [-1, -1]])
+
+    def test_roundtrip_on_scaled_monitor(self, layout):
+        pts = np.array([[1920, 0], [2500, 333], [4479, 1439]])
+        monitor, local = layout.to_local_points(pts)
+        np.testing.assert_array_equal(layout.to_global_points(1, local), pts)
+
+    def test_to_global_from_resized_screenshot(self, layout):
+        metadata = compute_letterbox_metadata(
+            layout.monitors[1].space, Space(width=1024, height=1024)
+        )
+        assert metadata.mode == ResizeMode.LETTERBOX
+        model_out = [[0, metadata.offset_y], [1023, 1023 - metadata.offset_y]]
+        np.testing.assert_array_equal(
+            layout.to_global_points(1, model_out, metadata), [[1920, 0], [4479, 1439]]
+        )
+        coord = Coordinate(x=512, y=512, space=metadata.target_space)
+        on_monitor = coord.to_space(layout.monitors[1].space, metadata)
+        result = layout.to_global(1, coord, metadata)
+        assert result == layout.to_global(1, on_monitor)
+        assert result.space == VIRTUAL
+
+    def test_to_global_checks_space(self, layout):
+        with pytest.raises(ValueError):
+            layout.to_global(0, Coordinate(x=0, y=0, space=VIRTUAL))
+
+    def test_overlap_rejected(self):
+        with pytest.raises(ValueError, match="overlaps"):
+            DesktopLayout(
+                [
+                    Monitor(BBox(x=0, y=0, width=1920, height=1080, space=VIRTUAL)),
+                    Monitor(BBox(x=1900, y=0, width=1920, height=1080, space=VIRTUAL)),
+                ]
+            )
+
+    def test_mixed_spaces_rejected(self):
+        other = Space(width=100, height=100)
+        with pytest.raises(ValueError):
+            DesktopLayout(
+                [
+                    Monitor(BBox(x=0, y=0, width=10, height=10, space=VIRTUAL)),
+                    Monitor(BBox(x=0, y=0, width=10, height=10, space=other)),
+                ]
+            )
+
+    def test_vertical_stack_with_offset(self):
+        space = Space(width=2560, height=2520)
+        layout = DesktopLayout(
+            [
+                Monitor(BBox(x=320, y=0, width=1920, height=1080, space=space)),
+                Monitor(BBox(x=0, y=1080, width=2560, height=1440, space=space)),
+            ]
+        )
+        np.testing.assert_array_equal(
+            layout.monitor_at([[0, 0], [320, 0], [0, 1080], [2559, 2519]]),
+            [-1, 0, 1, 1],
+        )
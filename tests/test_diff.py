@@ -0,0 +1,99 @@
+import time
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+from gui_agent_screenshot_tools import BBox, Screenshot, Space, changed_regions
+from gui_agent_screenshot_tools.diff import _merge_overlapping
+
+
+def _frame(*rects, size=(320, 200), fill=(0, 200, 0)):
+    img = Image.new("RGB", size, color=(240, 240, 240))
+    draw = ImageDraw.Draw(img)
+    for rect in rects:
+        draw.rectangle(rect, fill=fill)
+    return Screenshot.from_image(img)
+
+
+class TestChangedRegions:
+    def test_identical_frames(self):
+        assert changed_regions(_frame(), _frame()) == []
+
+    def test_single_change_exact_box(self):
+        before = _frame()
+        after = _frame((50, 40, 69, 59))
+        assert changed_regions(before, after) == [
+            BBox(x=50, y=40, width=20, height=20, space=before.space)
+        ]
+
+    def test_separate_changes(self):
+        before = _frame()
+        after = _frame((10, 10, 19, 19), (200, 150, 229, 179))
+        regions = changed_regions(before, after)
+        assert regions == [
+            BBox(x=10, y=10, width=10, height=10, space=before.space),
+            BBox(x=200, y=150, width=30, height=30, space=before.space),
+        ]
+
+    def test_adjacent_blocks_grouped(self):
+        before = _frame()
+        after = _frame((10, 10, 60, 12))
+        assert len(changed_regions(before, after, block_size=8)) == 1
+
+    def test_tolerance_ignores_small_differences(self):
+        before = _frame()
+        after = _frame((50, 40, 69, 59), fill=(243, 240, 238))
+        assert changed_regions(before, after, tolerance=4) == []
+        assert len(changed_regions(before, after, tolerance=2)) == 1
+
+    def test_edge_block_partial(self):
+        before = _frame(size=(100, 50))
+        after = _frame((95, 45, 99, 49), size=(100, 50))
+        assert changed_regions(before, after) == [
+            BBox(x=95, y=45, width=5, height=5, space=before.space)
+        ]
+
+    def test_space_mismatch(self):
+        with pytest.raises(ValueError):
+            changed_regions(_frame(), _frame(size=(100, 100)))
+
+    def test_rgba_frames(self):
+        before = Screenshot.from_image(Image.new("RGBA", (64, 64), (0, 0, 0, 255)))
+        img = Image.new("RGBA", (64, 64), (0, 0, 0, 255))
+        img.putpixel((3, 4), (255, 255, 255, 255))
+        after = Screenshot.from_image(img)
+        assert changed_regions(before, after) == [
+            BBox(x=3, y=4, width=1, height=1, space=Space(width=64, height=64))
+        ]
+
+    def test_many_scattered_changes(self):
+        # One 2x2 dot in every other 16px block: ~2000 separate regions.
+        before = _frame(size=(1920, 1080))
+        img = before.image.copy()
+        draw = ImageDraw.Draw(img)
+        dots = [(x, y) for y in range(4, 1080, 32) for x in range(4, 1920, 32)]
+        for x, y in dots:
+            draw.rectangle((x, y, x + 1, y + 1), fill=(0, 0, 0))
+        regions = changed_regions(before, Screenshot.from_image(img))
+        assert [(r.x, r.y, r.width, r.height) for r in regions] == [
+            (x, y, 2, 2) for x, y in dots
+        ]
+
+
+class TestMergeOverlapping:
+    def test_merge_creating_new_overlap(self):
+        # The third box only overlaps the union of the first two.
+        boxes = np.array([[0, 0, 10, 10], [5, 5, 15, 15], [14, 0, 20, 2]])
+        assert _merge_overlapping(boxes).tolist() == [[0, 0, 20, 15]]
+
+    def test_disjoint_boxes_kept(self):
+        boxes = np.array([[0, 0, 1, 1], [3, 0, 4, 1], [0, 3, 1, 4]])
+        assert sorted(_merge_overlapping(boxes).tolist()) == sorted(boxes.tolist())
+
+    def test_scales_to_many_boxes(self):
+        xs, ys = np.meshgrid(np.arange(0, 4000, 20), np.arange(0, 2000, 20))
+        boxes = np.stack([xs.ravel(), ys.ravel(), xs.ravel() + 1, ys.ravel() + 1], 1)
+        start = time.perf_counter()
+        assert len(_merge_overlapping(boxes)) == len(boxes) == 20000
+        assert time.perf_counter() - start < 5
@@ -0,0 +1,59 @@
+import pytest
+from PIL import Image, ImageDraw
+
+from gui_agent_screenshot_tools import BBox, Coordinate, Screenshot, Space, foveate
+
+
+@pytest.fixture
+def screenshot():
+    img = Image.new("RGB", (1920, 1080), color=(255, 255, 255))
+    ImageDraw.Draw(img).rectangle((1000, 500, 1009, 509), fill=(0, 0, 255))
+    return Screenshot.from_image(img)
+
+
+@pytest.fixture
+def overview_space():
+    return Space(width=512, height=512)
+
+
+@pytest.fixture
+def fovea_size():
+    return Space(width=256, height=256)
+
+
+class TestFoveate:
+    def test_overview_is_resized(self, screenshot, overview_space, fovea_size):
+        view = foveate(screenshot, overview_space, Coordinate(x=1004, y=504, space=screenshot.space), fovea_size)
+        assert view.overview.screenshot.space == overview_space
+        assert view.overview.screenshot.resize_metadata.source_space == screenshot.space
+
+    def test_fovea_is_native_crop_around_focus(self, screenshot, overview_space, fovea_size):
+        view = foveate(screenshot, overview_space, Coordinate(x=1004, y=504, space=screenshot.space), fovea_size)
+        assert view.fovea.bbox.as_space == fovea_size
+        assert view.fovea.bbox.contains(Coordinate(x=1004, y=504, space=screenshot.space))
+        local = view.fovea.bbox.localize(Coordinate(x=1004, y=504, space=screenshot.space))
+        assert view.fovea.screenshot.image.getpixel((local.x, local.y)) == (0, 0, 255)
+
+    def test_fovea_clamped_at_edges(self, screenshot, overview_space, fovea_size):
+        view = foveate(screenshot, overview_space, Coordinate(x=5, y=1075, space=screenshot.space), fovea_size)
+        assert view.fovea.bbox.x == 0
+        assert view.fovea.bbox.y + view.fovea.bbox.height == 1080
+
+    def test_fovea_grows_for_large_focus_box(self, screenshot, overview_space, fovea_size):
+        focus = BBox(x=100, y=100, width=400, height=300, space=screenshot.space)
+        view = foveate(screenshot, overview_space, focus, fovea_size)
+        assert view.fovea.bbox.width == 400
+        assert view.fovea.bbox.height == 300
+
+    def test_both_views_map_back(self, screenshot, overview_space, fovea_size):
+        view = foveate(screenshot, overview_space, Coordinate(x=1004, y=504, space=screenshot.space), fovea_size)
+        in_fovea = view.fovea.bbox.localize(Coordinate(x=1004, y=504, space=screenshot.space))
+        assert view.fovea.coordinate_to_source(in_fovea) == Coordinate(x=1004, y=504, space=screenshot.space)
+        meta = view.overview.screenshot.resize_metadata
+        in_overview = meta.forward_transform_coordinate(Coordinate(x=1004, y=504, space=screenshot.space))
+        back = view.overview.coordinate_to_source(in_overview)
+        assert abs(back.x - 1004) <= 4 and abs(back.y - 504) <= 4
+
+    def test_focus_space_must_match(self, screenshot, overview_space, fovea_size):
+        with pytest.raises(ValueError):
+            foveate(screenshot, overview_space, Coordinate(x=1, y=1, space=overview_space), fovea_size)
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from gui_agent_screenshot_tools import (
+    BBox,
+    Space,
+    compute_letterbox_metadata,
+    compute_stretch_metadata,
+    grid_argmax,
+    project_grid,
+)
+
+
+@pytest.fixture
+def hd_to_square():
+    # 1920x1080 -> 1024x1024: content rows 224..799, padding above and below
+    return compute_letterbox_metadata(Space(width=1920, height=1080), Space(width=1024, height=1024))
+
+
+class TestProjectGrid:
+    def test_padding_rows_dropped(self, hd_to_square):
+        scores = np.zeros((32, 32))
+        projection = project_grid(scores, hd_to_square)
+        # Each row is 32px tall; rows 0-6 end before 224, rows 25-31 start at 800+
+        kept_rows = np.unique(projection.cells[:, 0])
+        assert kept_rows.tolist() == list(range(7, 25))
+        assert len(projection.boxes) == 18 * 32
+
+    def test_matches_bbox_to_space(self, hd_to_square):
+        scores = np.zeros((32, 32))
+        projection = project_grid(scores, hd_to_square)
+        resized = hd_to_square.target_space
+        for (row, col), box in zip(projection.cells[::37], projection.boxes[::37]):
+            cell = BBox(x=int(col) * 32, y=int(row) * 32, width=32, height=32, space=resized)
+            expected = cell.to_space(hd_to_square.source_space, resize_metadata=hd_to_square)
+            assert box.tolist() == [expected.x, expected.y, expected.width, expected.height]
+
+    def test_boxes_within_target(self, hd_to_square):
+        screen = Space(width=2560, height=1440)
+        projection = project_grid(np.zeros((16, 16)), hd_to_square, screen)
+        assert projection.space == screen
+        x, y, w, h = projection.boxes.T
+        assert (x >= 0).all() and (y >= 0).all()
+        assert (x + w <= screen.width).all() and (y + h <= screen.height).all()
+
+    def test_scores_follow_cells(self, hd_to_square):
+        scores = np.arange(64, dtype=float).reshape(8, 8)
+        projection = project_grid(scores, hd_to_square)
+        assert (projection.scores == scores[projection.cells[:, 0], projection.cells[:, 1]]).all()
+
+    def test_stretch_keeps_all_cells(self):
+        m = compute_stretch_metadata(Space(width=1920, height=1080), Space(width=1024, height=1024))
+        assert len(project_grid(np.zeros((32, 32)), m).boxes) == 32 * 32
+
+    def test_rejects_non_2d(self, hd_to_square):
+        with pytest.raises(ValueError):
+            project_grid(np.zeros(10), hd_to_square)
+
+
+class TestGridArgmax:
+    def test_peak_maps_to_source(self, hd_to_square):
+        scores = np.zeros((32, 32))
+        scores[16, 16] = 1.0
+        coord = grid_argmax(scores, hd_to_square)
+        assert coord.space == hd_to_square.source_space
+        assert abs(coord.x - 1920 * 16.5 / 32) <= 3
+        assert abs(coord.y - (16.5 * 32 - 224) * 1080 / 576) <= 3
+
+    def test_peak_in_padding_ignored(self, hd_to_square):
+        scores = np.zeros((32, 32))
+        scores[0, 0] = 10.0
+        scores[10, 3] = 1.0
+        coord = grid_argmax(scores, hd_to_square)
+        assert coord.y > 0
+        assert coord.x < 1920 * 4 / 32
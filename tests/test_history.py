@@ -0,0 +1,87 @@
+import pytest
+
+from gui_agent_screenshot_tools import ScreenshotHistory
+
+
+@pytest.fixture
+def shots(make_screenshot):
+    return [make_screenshot((i * 20, 10, 10), size=(40, 30)) for i in range(6)]
+
+
+class TestHistoryLookup:
+    def test_steps_are_sequential(self, shots):
+        history = ScreenshotHistory(max_bytes=10**9)
+        assert [history.append(s) for s in shots[:3]] == [0, 1, 2]
+        assert history.steps == range(0, 3)
+
+    def test_lookup_by_step(self, shots):
+        history = ScreenshotHistory(max_bytes=10**9)
+        for s in shots:
+            history.append(s)
+        assert history[4] is shots[4]
+        assert history[-1] is shots[-1]
+
+    def test_max_frames_evicts_oldest(self, shots):
+        history = ScreenshotHistory(max_bytes=10**9, max_frames=3)
+        for s in shots:
+            history.append(s)
+        assert len(history) == 3
+        assert history.steps == range(3, 6)
+        assert 2 not in history
+        with pytest.raises(KeyError):
+            history[2]
+
+    def test_iterates_oldest_first(self, shots):
+        history = ScreenshotHistory(max_bytes=10**9)
+        for s in shots[:3]:
+            history.append(s)
+        assert list(history) == shots[:3]
+
+
+class TestHistoryBudget:
+    def test_accounts_encoded_and_decoded(self, shots):
+        history = ScreenshotHistory(max_bytes=10**9)
+        history.append(shots[0])
+        assert history.encoded_nbytes == len(shots[0].image_bytes)
+        assert history.decoded_nbytes == 0
+        shots[0].image
+        assert history.decoded_nbytes == shots[0].decoded_nbytes > 0
+        assert history.nbytes == history.encoded_nbytes + history.decoded_nbytes
+
+    def test_decoded_images_evicted_before_frames(self, shots):
+        encoded = sum(len(s.image_bytes) for s in shots[:3])
+        history = ScreenshotHistory(max_bytes=encoded + 40 * 30 * 4)
+        for s in shots[:2]:
+            history.append(s)
+            s.image
+        history.append(shots[2])
+        assert len(history) == 3
+        assert shots[0].decoded_nbytes == 0
+        assert shots[1].decoded_nbytes > 0
+
+    def test_frames_evicted_when_encoded_over_budget(self, shots):
+        per_frame = max(len(s.image_bytes) for s in shots)
+        history = ScreenshotHistory(max_bytes=per_frame * 2)
+        for s in shots:
+            history.append(s)
+        assert len(history) == 2
+        assert history.steps == range(4, 6)
+
+    def test_newest_frame_always_kept(self, shots):
+        history = ScreenshotHistory(max_bytes=1)
+        history.append(shots[0])
+        history.append(shots[1])
+        assert len(history) == 1
+        assert history[1] is shots[1]
+
+    def test_released_image_decodes_again(self, shots):
+        history = ScreenshotHistory(max_bytes=1)
+        history.append(shots[0])
+        shots[0].image
+        history.enforce_budget()
+        assert shots[0].decoded_nbytes == 0
+        assert shots[0].image.size == (40, 30)
+
+    def test_rejects_non_positive_budget(self):
+        with pytest.raises(ValueError):
+            ScreenshotHistory(max_bytes=0)
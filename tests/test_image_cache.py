@@ -0,0 +1,119 @@
+import gc
+
+import pytest
+from PIL import Image
+
+from gui_agent_screenshot_tools import (
+    ImageCache,
+    Screenshot,
+    clear_image_cache,
+    get_image_cache,
+    image_cache_stats,
+    set_image_cache_limit,
+)
+from gui_agent_screenshot_tools.image_cache import image_nbytes
+
+
+@pytest.fixture
+def global_cache():
+    cache = get_image_cache()
+    previous = cache.max_bytes
+    clear_image_cache()
+    yield cache
+    set_image_cache_limit(previous)
+    clear_image_cache()
+
+
+class TestImageNbytes:
+    def test_rgb_uses_four_bytes_per_pixel(self):
+        assert image_nbytes(Image.new("RGB", (10, 10))) == 400
+
+    def test_grayscale_uses_one_byte_per_pixel(self):
+        assert image_nbytes(Image.new("L", (10, 10))) == 100
+
+
+class TestImageCache:
+    def test_get_put(self):
+        cache = ImageCache(max_bytes=10_000)
+        img = Image.new("L", (10, 10))
+        key = object()
+        assert cache.get(key) is None
+        cache.put(key, img)
+        assert cache.get(key) is img
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries, stats.nbytes) == (1, 1, 1, 100)
+
+    def test_lru_eviction(self):
+        cache = ImageCache(max_bytes=250)
+        a, b, c = object(), object(), object()
+        cache.put(a, Image.new("L", (10, 10)))
+        cache.put(b, Image.new("L", (10, 10)))
+        cache.get(a)
+        cache.put(c, Image.new("L", (10, 10)))
+        assert cache.get(b) is None
+        assert cache.get(a) is not None
+        assert cache.stats().evictions == 1
+
+    def test_oversized_image_not_cached(self):
+        cache = ImageCache(max_bytes=50)
+        key = object()
+        cache.put(key, Image.new("L", (10, 10)))
+        assert cache.get(key) is None
+        assert cache.stats().nbytes == 0
+
+    def test_peek_not_counted(self):
+        cache = ImageCache(max_bytes=10_000)
+        key = object()
+        assert cache.peek(key) is None
+        cache.put(key, Image.new("L", (10, 10)))
+        assert cache.peek(key) is not None
+        stats = cache.stats()
+        assert (stats.hits, stats.misses) == (0, 0)
+
+    def test_lowering_limit_evicts(self):
+        cache = ImageCache(max_bytes=1000)
+        for _ in range(5):
+            cache.put(object(), Image.new("L", (10, 10)))
+        cache.max_bytes = 200
+        assert cache.stats().entries == 2
+
+
+class TestScreenshotImageCaching:
+    def test_decode_registers_in_global_cache(self, global_cache, make_screenshot):
+        shot = make_screenshot(size=(50, 40))
+        shot.image
+        stats = image_cache_stats()
+        assert stats.entries == 1
+        assert stats.nbytes == shot.decoded_nbytes == 50 * 40 * 4
+
+    def test_cold_access_counts_one_miss(self, global_cache):
+        shot = Screenshot.from_image(Image.new("RGB", (50, 40)))
+        before = image_cache_stats()
+        shot.image
+        shot.image
+        after = image_cache_stats()
+        assert (after.misses - before.misses, after.hits - before.hits) == (1, 1)
+
+    def test_evicted_image_redecoded(self, global_cache, make_screenshot):
+        set_image_cache_limit(50 * 40 * 4)
+        first = make_screenshot(size=(50, 40))
+        second = make_screenshot(size=(50, 40))
+        img = first.image
+        second.image
+        assert first.decoded_nbytes == 0
+        again = first.image
+        assert again is not img
+        assert again.size == img.size
+
+    def test_release_image(self, global_cache, make_screenshot):
+        shot = make_screenshot(size=(50, 40))
+        shot.image
+        shot.release_image()
+        assert image_cache_stats().entries == 0
+
+    def test_garbage_collected_screenshot_leaves_cache(self, global_cache, make_screenshot):
+        shot = make_screenshot(size=(50, 40))
+        shot.image
+        del shot
+        gc.collect()
+        assert image_cache_stats().entries == 0
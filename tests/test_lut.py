@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+
+from gui_agent_screenshot_tools import (
+    Coordinate,
+    Space,
+    compute_letterbox_metadata,
+    compute_stretch_metadata,
+    forward_luts,
+    forward_transform_points,
+    inverse_luts,
+    transform_points,
+)
+
+METADATA = [
+    compute_letterbox_metadata(Space(width=192, height=108), Space(width=100, height=100)),
+    compute_letterbox_metadata(Space(width=108, height=240), Space(width=137, height=77)),
+    compute_stretch_metadata(Space(width=192, height=108), Space(width=64, height=64)),
+    compute_letterbox_metadata(Space(width=50, height=50), Space(width=120, height=90)),
+]
+
+
+@pytest.fixture(params=METADATA, ids=["hd-square", "mobile-wxga", "stretch", "upscale"])
+def metadata(request):
+    return request.param
+
+
+class TestInverseLuts:
+    def test_matches_transform_coordinate_to_source(self, metadata):
+        luts = inverse_luts(metadata, metadata.source_space)
+        resized = metadata.target_space
+        for x in range(resized.width):
+            c = metadata.transform_coordinate(Coordinate(x=x, y=0, space=resized), metadata.source_space)
+            assert luts.x[x] == c.x
+        for y in range(resized.height):
+            c = metadata.transform_coordinate(Coordinate(x=0, y=y, space=resized), metadata.source_space)
+            assert luts.y[y] == c.y
+
+    def test_matches_transform_coordinate_to_other_space(self, metadata):
+        screen = Space(width=301, height=173)
+        luts = inverse_luts(metadata, screen)
+        resized = metadata.target_space
+        for x in range(resized.width):
+            c = metadata.transform_coordinate(Coordinate(x=x, y=0, space=resized), screen)
+            assert luts.x[x] == c.x
+        for y in range(resized.height):
+            c = metadata.transform_coordinate(Coordinate(x=0, y=y, space=resized), screen)
+            assert luts.y[y] == c.y
+
+    def test_lengths(self, metadata):
+        luts = inverse_luts(metadata, metadata.source_space)
+        assert len(luts.x) == metadata.target_space.width
+        assert len(luts.y) == metadata.target_space.height
+
+
+class TestForwardLuts:
+    def test_matches_forward_transform_coordinate(self, metadata):
+        luts = forward_luts(metadata)
+        source = metadata.source_space
+        for x in range(source.width):
+            c = metadata.forward_transform_coordinate(Coordinate(x=x, y=0, space=source))
+            assert luts.x[x] == c.x
+        for y in range(source.height):
+            c = metadata.forward_transform_coordinate(Coordinate(x=0, y=y, space=source))
+            assert luts.y[y] == c.y
+
+    def test_from_other_space_composes_generic_mapping(self, metadata):
+        screen = Space(width=301, height=173)
+        luts = forward_luts(metadata, screen)
+        for x in (0, 17, 150, 300):
+            c = Coordinate(x=x, y=0, space=screen).to_space(metadata.source_space)
+            assert luts.x[x] == metadata.forward_transform_coordinate(c).x
+
+
+class TestLutCaching:
+    def test_same_tables_returned(self, metadata):
+        assert inverse_luts(metadata, metadata.source_space) is inverse_luts(metadata, metadata.source_space)
+        assert forward_luts(metadata) is forward_luts(metadata)
+
+    def test_tables_read_only(self, metadata):
+        luts = forward_luts(metadata)
+        with pytest.raises(ValueError):
+            luts.x[0] = 1
+
+    def test_cache_does_not_affect_equality_or_dict(self, metadata):
+        other = compute_letterbox_metadata(metadata.source_space, metadata.target_space)
+        inverse_luts(other, other.source_space)
+        assert "_axis_luts" not in other.to_dict()
+        assert hash(other) == hash(compute_letterbox_metadata(metadata.source_space, metadata.target_space))
+
+
+class TestBatchPoints:
+    def test_transform_points(self, metadata):
+        resized = metadata.target_space
+        pts = np.array([[0, 0], [resized.width - 1, resized.height - 1], [resized.width // 2, resized.height // 3]])
+        out = transform_points(metadata, pts, metadata.source_space)
+        for (x, y), (ox, oy) in zip(pts, out):
+            c = metadata.transform_coordinate(Coordinate(x=int(x), y=int(y), space=resized), metadata.source_space)
+            assert (ox, oy) == (c.x, c.y)
+
+    def test_forward_transform_points(self, metadata):
+        source = metadata.source_space
+        pts = np.array([[0, 0], [source.width - 1, source.height - 1]])
+        out = forward_transform_points(metadata, pts)
+        for (x, y), (ox, oy) in zip(pts, out):
+            c = metadata.forward_transform_coordinate(Coordinate(x=int(x), y=int(y), space=source))
+            assert (ox, oy) == (c.x, c.y)
+
+    def test_out_of_bounds_rejected(self, metadata):
+        with pytest.raises(ValueError):
+            transform_points(metadata, [[metadata.target_space.width, 0]], metadata.source_space)
+
+    def test_bad_shape_rejected(self, metadata):
+        with pytest.raises(ValueError):
+            transform_points(metadata, [1, 2, 3], metadata.source_space)
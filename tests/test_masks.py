@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from gui_agent_screenshot_tools import (
+    Coordinate,
+    Space,
+    compute_letterbox_metadata,
+    compute_stretch_metadata,
+    mask_to_space,
+    polygon_to_space,
+)
+
+
+@pytest.fixture
+def letterbox():
+    # 192x108 -> 100x100: content rows 22..77
+    return compute_letterbox_metadata(Space(width=192, height=108), Space(width=100, height=100))
+
+
+class TestMaskToSpace:
+    def test_output_shape(self, letterbox):
+        out = mask_to_space(np.zeros((100, 100), dtype=bool), letterbox)
+        assert out.shape == (108, 192)
+
+    def test_padding_not_sampled(self, letterbox):
+        mask = np.ones((100, 100), dtype=bool)
+        mask[22:78, :] = False
+        assert not mask_to_space(mask, letterbox).any()
+
+    def test_consistent_with_transform_coordinate(self, letterbox):
+        mask = np.zeros((100, 100), dtype=bool)
+        mask[40:50, 30:45] = True
+        out = mask_to_space(mask, letterbox)
+        source = letterbox.source_space
+        for y in range(0, 108, 7):
+            for x in range(0, 192, 7):
+                fwd = letterbox.forward_transform_coordinate(Coordinate(x=x, y=y, space=source))
+                assert out[y, x] == mask[fwd.y, fwd.x]
+
+    def test_mask_region_maps_near_transformed_box(self, letterbox):
+        mask = np.zeros((100, 100), dtype=bool)
+        mask[40:50, 30:45] = True
+        ys, xs = np.nonzero(mask_to_space(mask, letterbox))
+        tl = letterbox.transform_coordinate(Coordinate(x=30, y=40, space=letterbox.target_space), letterbox.source_space)
+        br = letterbox.transform_coordinate(Coordinate(x=44, y=49, space=letterbox.target_space), letterbox.source_space)
+        assert abs(xs.min() - tl.x) <= 1 and abs(ys.min() - tl.y) <= 1
+        assert abs(xs.max() - br.x) <= 1 and abs(ys.max() - br.y) <= 1
+
+    def test_leading_axes_kept(self, letterbox):
+        out = mask_to_space(np.zeros((3, 100, 100), dtype=np.uint8), letterbox, Space(width=50, height=40))
+        assert out.shape == (3, 40, 50)
+
+    def test_shape_mismatch(self, letterbox):
+        with pytest.raises(ValueError):
+            mask_to_space(np.zeros((10, 10)), letterbox)
+
+
+class TestPolygonToSpace:
+    @pytest.mark.parametrize(
+        "metadata",
+        [
+            compute_letterbox_metadata(Space(width=192, height=108), Space(width=100, height=100)),
+            compute_stretch_metadata(Space(width=192, height=108), Space(width=100, height=100)),
+        ],
+    )
+    def test_matches_transform_coordinate(self, metadata):
+        vertices = np.array([[0, 0], [99, 0], [99, 99], [10, 60], [50, 22]])
+        screen = Space(width=1920, height=1080)
+        out = polygon_to_space(vertices, metadata, screen)
+        for (x, y), (ox, oy) in zip(vertices, out):
+            c = metadata.transform_coordinate(
+                Coordinate(x=int(x), y=int(y), space=metadata.target_space), screen
+            )
+            assert (ox, oy) == (c.x, c.y)
+
+    def test_fractional_vertices(self, letterbox):
+        out = polygon_to_space([[49.5, 50.25]], letterbox)
+        assert out.dtype == np.int64
+        assert 0 <= out[0, 0] < 192 and 0 <= out[0, 1] < 108
+
+    def test_bad_shape(self, letterbox):
+        with pytest.raises(ValueError):
+            polygon_to_space([1, 2, 3], letterbox)
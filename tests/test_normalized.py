@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from gui_agent_screenshot_tools import (
+    PERMILLE_SPACE,
+    UNIT_SPACE,
+    Coordinate,
+    NormalizedSpace,
+    Space,
+    compute_letterbox_metadata,
+    denormalize_boxes,
+    denormalize_points,
+)
+
+
+@pytest.fixture
+def hd():
+    return Space(width=1920, height=1080)
+
+
+@pytest.fixture
+def letterbox(hd):
+    return compute_letterbox_metadata(hd, Space(width=1024, height=1024))
+
+
+class TestNormalizedSpace:
+    def test_rejects_non_positive_scale(self):
+        with pytest.raises(ValidationError):
+            NormalizedSpace(scale=0)
+
+    def test_unit_endpoints(self, hd):
+        assert UNIT_SPACE.coordinate(0.0, 0.0, hd) == Coordinate(x=0, y=0, space=hd)
+        assert UNIT_SPACE.coordinate(1.0, 1.0, hd) == Coordinate(x=1919, y=1079, space=hd)
+
+    def test_permille_center(self, hd):
+        c = PERMILLE_SPACE.coordinate(500, 500, hd)
+        assert abs(c.x - 960) <= 1 and abs(c.y - 540) <= 1
+
+    def test_out_of_range_clamped(self, hd):
+        c = UNIT_SPACE.coordinate(1.2, -0.1, hd)
+        assert (c.x, c.y) == (1919, 0)
+
+    def test_bbox_orders_corners(self, hd):
+        box = PERMILLE_SPACE.bbox(600, 400, 100, 200, hd)
+        assert box.x < 1920 * 0.1 + 1 and box.x + box.width > 1920 * 0.6 - 1
+
+    def test_normalize_inverts_coordinate(self, hd):
+        c = Coordinate(x=1919, y=0, space=hd)
+        assert UNIT_SPACE.normalize(c) == (1.0, 0.0)
+
+    def test_integrates_with_to_space(self, letterbox, hd):
+        c = PERMILLE_SPACE.coordinate(500, 500, letterbox.target_space)
+        back = c.to_space(hd, resize_metadata=letterbox)
+        assert abs(back.x - 960) <= 2 and abs(back.y - 540) <= 2
+
+
+class TestDenormalizePoints:
+    def test_matches_per_point_path(self, letterbox, hd):
+        pts = np.array([[0, 0], [1000, 1000], [500, 500], [123.4, 876.5]])
+        out = denormalize_points(pts, PERMILLE_SPACE, resize_metadata=letterbox)
+        for (nx, ny), (x, y) in zip(pts, out):
+            c = PERMILLE_SPACE.coordinate(nx, ny, letterbox.target_space)
+            expected = c.to_space(hd, resize_metadata=letterbox)
+            assert (x, y) == (expected.x, expected.y)
+
+    def test_other_target(self, letterbox):
+        screen = Space(width=2560, height=1440)
+        out = denormalize_points([[1.0, 1.0]], UNIT_SPACE, resize_metadata=letterbox, target=screen)
+        assert out.tolist() == [[2559, 1439]]
+
+    def test_without_metadata(self, hd):
+        out = denormalize_points([[0.5, 0.5]], UNIT_SPACE, hd, target=Space(width=101, height=101))
+        assert out.tolist() == [[50, 50]]
+
+    def test_requires_space_or_metadata(self):
+        with pytest.raises(ValueError):
+            denormalize_points([[0.5, 0.5]], UNIT_SPACE)
+
+    def test_bad_shape(self, hd):
+        with pytest.raises(ValueError):
+            denormalize_points([0.5, 0.5], UNIT_SPACE, hd)
+
+
+class TestDenormalizeBoxes:
+    def test_matches_bbox_to_space(self, letterbox, hd):
+        boxes = np.array([[100, 300, 400, 500], [0, 0, 1000, 1000], [900, 800, 700, 600]])
+        out = denormalize_boxes(boxes, PERMILLE_SPACE, resize_metadata=letterbox)
+        for row, box in zip(boxes, out):
+            expected = PERMILLE_SPACE.bbox(*row, letterbox.target_space).to_space(
+                hd, resize_metadata=letterbox
+            )
+            assert box.tolist() == [expected.x, expected.y, expected.width, expected.height]
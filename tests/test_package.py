@@ -0,0 +1,55 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import gui_agent_screenshot_tools
+
+
+def _run(code):
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.split()
+
+
+class TestLazyImports:
+    def test_geometry_does_not_import_pillow_or_numpy(self):
+        loaded = _run(
+            "import sys\n"
+            "from gui_agent_screenshot_tools import BBox, Coordinate, Space\n"
+            "box = BBox(x=1, y=2, width=3, height=4, space=Space(width=10, height=10))\n"
+            "box.center.to_space(Space(width=20, height=20))\n"
+            "print('PIL' in sys.modules, 'numpy' in sys.modules)"
+        )
+        assert loaded == ["False", "False"]
+
+    def test_attribute_access_imports_module(self):
+        loaded = _run(
+            "import sys, gui_agent_screenshot_tools as g\n"
+            "g.Screenshot\n"
+            "print('PIL' in sys.modules)"
+        )
+        assert loaded == ["True"]
+
+    @pytest.mark.parametrize("name", gui_agent_screenshot_tools.__all__)
+    def test_all_names_resolve(self, name):
+        assert getattr(gui_agent_screenshot_tools, name) is not None
+
+    def test_foveate_is_the_function(self):
+        from gui_agent_screenshot_tools.foveation import foveate
+
+        assert gui_agent_screenshot_tools.foveate is foveate
+
+    def test_no_export_named_like_a_submodule(self):
+        # Importing a submodule binds it on the package under its own name.
+        package_dir = Path(gui_agent_screenshot_tools.__file__).parent
+        modules = {path.stem for path in package_dir.glob("*.py")}
+        assert not modules & set(gui_agent_screenshot_tools.__all__)
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError):
+            gui_agent_screenshot_tools.does_not_exist
+
+    def test_dir_lists_lazy_names(self):
+        assert set(gui_agent_screenshot_tools.__all__) <= set(dir(gui_agent_screenshot_tools))
@@ -4,7 +4,9 @@ from gui_agent_screenshot_tools import Coordinate, ResizeMode, Space
 from gui_agent_screenshot_tools.resize import (
     ResizeMetadata,
     compute_letterbox_metadata,
+    compute_patch_metadata,
     compute_stretch_metadata,
+    plan_patch_space,
 )
 
 
@@ -272,3 +274,68 @@ class TestLetterboxPaddingRegionClamping:
         coord = Coordinate(x=512, y=1023, space=square)
         result = m.transform_coordinate(coord, hd)
         assert result.y == 1079  # Clamped to bottom edge
+
+
+class TestPlanPatchSpace:
+    def test_sides_are_patch_multiples(self, hd):
+        s = plan_patch_space(hd, 28, max_pixels=1_003_520)
+        assert s.width % 28 == 0
+        assert s.height % 28 == 0
+
+    def test_within_max_pixels(self, hd):
+        s = plan_patch_space(hd, 28, max_pixels=28 * 28 * 256)
+        assert s.width * s.height <= 28 * 28 * 256
+
+    def test_within_min_pixels(self):
+        tiny = Space(width=60, height=40)
+        s = plan_patch_space(tiny, 14, min_pixels=56 * 56)
+        assert s.width * s.height >= 56 * 56
+
+    def test_native_size_when_within_bounds(self):
+        s = plan_patch_space(Space(width=1120, height=840), 28, max_pixels=2_000_000)
+        assert s == Space(width=1120, height=840)
+
+    def test_aspect_ratio_preserved(self, mobile):
+        s = plan_patch_space(mobile, 14, max_pixels=14 * 14 * 1024)
+        assert s.aspect_ratio == pytest.approx(mobile.aspect_ratio, rel=0.05)
+
+    def test_padding_less_than_one_patch(self, hd, mobile):
+        for source in (hd, mobile):
+            m = compute_patch_metadata(source, 28, max_pixels=1_003_520)
+            assert m.target_space.width - m.scaled_width < 28
+            assert m.target_space.height - m.scaled_height < 28
+
+    def test_metadata_roundtrip(self, hd):
+        m = compute_patch_metadata(hd, 28, max_pixels=1_003_520)
+        original = Coordinate(x=500, y=300, space=hd)
+        back = m.transform_coordinate(m.forward_transform_coordinate(original), hd)
+        assert abs(back.x - original.x) <= 2
+        assert abs(back.y - original.y) <= 2
+
+    @pytest.mark.parametrize(
+        "source", [Space(width=3840, height=100), Space(width=100, height=3840)]
+    )
+    def test_extreme_aspect_ratio_within_max_pixels(self, source):
+        s = plan_patch_space(source, 28, max_pixels=28 * 28 * 16)
+        assert s.width * s.height <= 28 * 28 * 16
+        assert sorted((s.width, s.height)) == [28, 28 * 16]
+
+    def test_extreme_aspect_ratio_within_both_bounds(self):
+        s = plan_patch_space(
+            Space(width=5000, height=60), 14, min_pixels=14 * 14 * 30, max_pixels=14 * 14 * 40
+        )
+        assert 14 * 14 * 30 <= s.width * s.height <= 14 * 14 * 40
+        assert s.height == 14
+
+    def test_unsatisfiable_bounds_raise(self):
+        # Only 7 patches allowed, and no near-square grid has exactly 7.
+        with pytest.raises(ValueError):
+            plan_patch_space(Space(width=500, height=500), 10, min_pixels=700, max_pixels=700)
+
+    def test_invalid_bounds(self, hd):
+        with pytest.raises(ValueError):
+            plan_patch_space(hd, 28, min_pixels=10_000, max_pixels=1_000)
+        with pytest.raises(ValueError):
+            plan_patch_space(hd, 28, max_pixels=100)
+        with pytest.raises(ValueError):
+            plan_patch_space(hd, 0)
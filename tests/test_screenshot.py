@@ -1,9 +1,15 @@
+import base64
+import copy
 import io
+import pickle
+import threading
 
 import pytest
 from PIL import Image
 
 from gui_agent_screenshot_tools import ResizeMode, Screenshot, Space
+from gui_agent_screenshot_tools import screenshot as screenshot_module
+from gui_agent_screenshot_tools.screenshot import MAX_CACHED_PAYLOADS
 
 
 class TestScreenshotCreation:
@@ -33,6 +39,38 @@ class TestScreenshotImage:
         assert img1 is img2
 
 
+class TestScreenshotCopies:
+    def test_equal_for_same_fields(self, sample_image_bytes, hd_space):
+        a = Screenshot(image_bytes=sample_image_bytes, space=hd_space)
+        b = Screenshot(image_bytes=sample_image_bytes, space=hd_space)
+        a.image
+        assert a == b
+
+    def test_not_equal_for_other_bytes(self, make_screenshot):
+        assert make_screenshot((255, 0, 0)) != make_screenshot((0, 0, 255))
+
+    def test_model_copy_with_new_bytes_decodes_them(self, make_screenshot):
+        red, blue = make_screenshot((255, 0, 0)), make_screenshot((0, 0, 255))
+        copy = red.model_copy(update={"image_bytes": blue.image_bytes})
+        red.image
+        assert copy.image.getpixel((0, 0)) == (0, 0, 255)
+        assert red.image.getpixel((0, 0)) == (255, 0, 0)
+
+    def test_assigning_bytes_drops_decoded_image(self, make_screenshot):
+        shot = make_screenshot((255, 0, 0))
+        shot.image
+        shot.image_bytes = make_screenshot((0, 0, 255)).image_bytes
+        assert shot.image.getpixel((0, 0)) == (0, 0, 255)
+
+    def test_deep_copy_has_own_cache_entry(self, make_screenshot):
+        shot = make_screenshot((255, 0, 0))
+        shot.image
+        duplicate = copy.deepcopy(shot)
+        duplicate.image
+        shot.release_image()
+        assert duplicate.decoded_nbytes > 0
+
+
 class TestScreenshotFromImage:
     def test_creates_from_pil_image(self):
         img = Image.new("RGB", (800, 600), color=(255, 0, 0))
@@ -146,3 +184,217 @@ class TestLetterboxBlackBarPixels:
         cx = meta.offset_x + meta.scaled_width // 2
         cy = meta.offset_y + meta.scaled_height // 2
         assert img.getpixel((cx, cy)) != (0, 0, 0)
+
+
+class TestScreenshotResizeToPatches:
+    def test_patch_aligned_dimensions(self, sample_screenshot):
+        resized = sample_screenshot.resize_to_patches(28, max_pixels=28 * 28 * 512)
+        assert resized.space.width % 28 == 0
+        assert resized.space.height % 28 == 0
+        assert resized.image.size == (resized.space.width, resized.space.height)
+        assert resized.resize_metadata.mode == ResizeMode.LETTERBOX
+
+
+class TestResizeModePreservation:
+    @pytest.mark.parametrize("mode", ["RGBA", "L", "P"])
+    @pytest.mark.parametrize("resize_mode", [ResizeMode.LETTERBOX, ResizeMode.STRETCH])
+    def test_source_mode_kept(self, mode, resize_mode):
+        img = Image.new("RGB", (320, 180), color=(200, 30, 30)).convert(mode)
+        resized = Screenshot.from_image(img).resize(Space(width=128, height=128), resize_mode)
+        assert resized.image.mode == mode
+
+    def test_rgba_padding_is_opaque_black(self):
+        img = Image.new("RGBA", (320, 180), color=(200, 30, 30, 255))
+        resized = Screenshot.from_image(img).resize(Space(width=128, height=128), ResizeMode.LETTERBOX)
+        assert resized.image.getpixel((0, 0)) == (0, 0, 0, 255)
+
+    def test_grayscale_canvas(self, sample_screenshot):
+        target = Space(width=256, height=256)
+        rgb = sample_screenshot.resize(target, ResizeMode.LETTERBOX)
+        gray = sample_screenshot.resize(target, ResizeMode.LETTERBOX, canvas_mode="L")
+        assert gray.image.mode == "L"
+        assert gray.image.getpixel((0, 0)) == 0
+        assert gray.resize_metadata == rgb.resize_metadata
+
+    def test_palette_canvas(self, sample_screenshot):
+        resized = sample_screenshot.resize(Space(width=256, height=256), ResizeMode.LETTERBOX, canvas_mode="P")
+        img = resized.image
+        assert img.mode == "P"
+        meta = resized.resize_metadata
+        center = (meta.offset_x + meta.scaled_width // 2, meta.offset_y + meta.scaled_height // 2)
+        assert img.convert("RGB").getpixel(center) == (128, 64, 32)
+        assert img.convert("RGB").getpixel((0, 0)) == (0, 0, 0)
+
+    def test_palette_source_keeps_palette(self):
+        img = Image.new("RGB", (320, 180), color=(10, 120, 250)).convert("P")
+        resized = Screenshot.from_image(img).resize(Space(width=100, height=100), ResizeMode.STRETCH)
+        assert resized.image.convert("RGB").getpixel((50, 50)) == img.convert("RGB").getpixel((0, 0))
+
+    def test_custom_pad_color(self, sample_screenshot):
+        resized = sample_screenshot.resize(
+            Space(width=256, height=256), ResizeMode.LETTERBOX, pad_color=(255, 255, 255)
+        )
+        assert resized.image.getpixel((0, 0)) == (255, 255, 255)
+
+    @pytest.mark.parametrize("canvas_mode", ["L", "LA", None])
+    def test_rgb_pad_color_on_grayscale_canvas(self, canvas_mode):
+        shot = Screenshot.from_image(Image.new("L", (320, 180), color=200))
+        resized = shot.resize(
+            Space(width=128, height=128),
+            ResizeMode.LETTERBOX,
+            canvas_mode=canvas_mode,
+            pad_color=(114, 114, 114),
+        )
+        pad = resized.image.getpixel((0, 0))
+        assert (pad[0] if isinstance(pad, tuple) else pad) == 114
+
+    @pytest.mark.parametrize(
+        ("mode", "format", "color"),
+        [("CMYK", "JPEG", (0, 200, 0, 0)), ("F", "TIFF", 100.0)],
+    )
+    def test_non_png_source_modes_become_rgb(self, mode, format, color):
+        buf = io.BytesIO()
+        Image.new(mode, (320, 180), color=color).save(buf, format=format)
+        shot = Screenshot(image_bytes=buf.getvalue(), space=Space(width=320, height=180))
+        resized = shot.resize(Space(width=128, height=128), ResizeMode.LETTERBOX)
+        assert resized.image.mode == "RGB"
+        assert resized.image.getpixel((0, 0)) == (0, 0, 0)
+
+    def test_grayscale_output_is_smaller(self):
+        img = Image.effect_noise((640, 360), 64).convert("RGB")
+        shot = Screenshot.from_image(img)
+        target = Space(width=512, height=512)
+        rgb = shot.resize(target, ResizeMode.LETTERBOX)
+        gray = shot.resize(target, ResizeMode.LETTERBOX, canvas_mode="L")
+        assert len(gray.image_bytes) < len(rgb.image_bytes)
+
+
+class TestConcurrentDecode:
+    THREADS = 16
+
+    def _hammer(self, fn):
+        barrier = threading.Barrier(self.THREADS)
+        results = [None] * self.THREADS
+
+        def run(i):
+            barrier.wait()
+            results[i] = fn()
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(self.THREADS)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return results
+
+    def test_image_decoded_once(self, monkeypatch):
+        shot = Screenshot.from_image(Image.new("RGB", (640, 480), color=(1, 2, 3)))
+        calls = []
+        real_open = Image.open
+
+        def counting_open(*args, **kwargs):
+            calls.append(1)
+            return real_open(*args, **kwargs)
+
+        monkeypatch.setattr(screenshot_module.Image, "open", counting_open)
+        images = self._hammer(lambda: shot.image)
+        assert len(calls) == 1
+        assert all(img is images[0] for img in images)
+
+    def test_lazy_bytes_loaded_once(self):
+        data = Screenshot.from_image(Image.new("RGB", (32, 32))).image_bytes
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return data
+
+        shot = Screenshot.lazy(loader, Space(width=32, height=32))
+        results = self._hammer(lambda: shot.image.size)
+        assert len(calls) == 1
+        assert results == [(32, 32)] * self.THREADS
+
+    def test_concurrent_resizes_match_serial(self):
+        shot = Screenshot.from_image(Image.new("RGB", (640, 480), color=(200, 10, 10)))
+        target = Space(width=320, height=320)
+        expected = shot.resize(target, ResizeMode.LETTERBOX).image_bytes
+        shot.release_image()
+        results = self._hammer(lambda: shot.resize(target, ResizeMode.LETTERBOX))
+        assert {r.image_bytes for r in results} == {expected}
+
+    def test_still_picklable(self):
+        shot = Screenshot.from_image(Image.new("RGB", (8, 8)))
+        assert pickle.loads(pickle.dumps(shot)).image_bytes == shot.image_bytes
+
+
+class TestPayloadEncoding:
+    @pytest.fixture
+    def shot(self):
+        return Screenshot.from_image(Image.new("RGBA", (64, 48), color=(10, 20, 30, 255)))
+
+    def test_data_url_uses_image_bytes(self, shot):
+        prefix, payload = shot.to_data_url().split(",", 1)
+        assert prefix == "data:image/png;base64"
+        assert base64.b64decode(payload) == shot.image_bytes
+
+    def test_data_url_is_cached(self, shot):
+        assert shot.to_data_url() is shot.to_data_url()
+        assert shot.to_data_url("JPEG", 80) is shot.to_data_url("jpeg", 80)
+        assert shot.to_data_url("JPEG", 80) != shot.to_data_url("JPEG", 30)
+
+    def test_reencode_formats(self, shot):
+        for fmt, mime in [("JPEG", "image/jpeg"), ("WEBP", "image/webp")]:
+            prefix, payload = shot.to_data_url(fmt, quality=70).split(",", 1)
+            assert prefix == f"data:{mime};base64"
+            decoded = Image.open(io.BytesIO(base64.b64decode(payload)))
+            assert decoded.format == fmt
+            assert decoded.size == (64, 48)
+
+    def test_format_aliases(self, shot):
+        assert shot.to_data_url("jpg", 80).startswith("data:image/jpeg;base64,")
+        assert shot.to_data_url("jpg", 80) is shot.to_data_url("JPEG", 80)
+
+    def test_unknown_format_rejected(self, shot):
+        with pytest.raises(ValueError, match="unsupported image format"):
+            shot.to_data_url("nope")
+
+    def test_mime_sniffed_from_bytes(self):
+        buf = io.BytesIO()
+        Image.new("RGB", (8, 8)).save(buf, format="JPEG")
+        shot = Screenshot(image_bytes=buf.getvalue(), space=Space(width=8, height=8))
+        assert shot.to_data_url().startswith("data:image/jpeg;base64,")
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 100, 1 << 20])
+    def test_chunks_concatenate_to_base64(self, shot, chunk_size):
+        chunks = list(shot.iter_base64_chunks(chunk_size))
+        assert b"".join(chunks) == base64.b64encode(shot.image_bytes)
+        assert b"".join(shot.iter_base64_chunks(chunk_size, "JPEG")) == (
+            shot.to_data_url("JPEG").split(",", 1)[1].encode()
+        )
+
+    def test_payload_cache_is_bounded_and_counted(self, shot):
+        base = shot.encoded_nbytes
+        url = shot.to_data_url("JPEG", 80)
+        assert shot.encoded_nbytes > base + len(url)
+        for quality in range(10, 10 + 2 * MAX_CACHED_PAYLOADS):
+            shot.to_data_url("JPEG", quality)
+        assert len(shot._payloads) == MAX_CACHED_PAYLOADS
+        expected = base + sum(nbytes for _, nbytes in shot._payloads.values())
+        assert shot.encoded_nbytes == expected
+
+    def test_copy_with_new_bytes_has_fresh_payloads(self, shot, make_screenshot):
+        other = make_screenshot((200, 0, 0))
+        shot.to_data_url()
+        copy = shot.model_copy(update={"image_bytes": other.image_bytes})
+        assert copy.to_data_url() == other.to_data_url()
+        assert shot.to_data_url() != other.to_data_url()
+
+    def test_assigning_bytes_clears_payloads(self, shot, make_screenshot):
+        other = make_screenshot((200, 0, 0))
+        shot.to_data_url("WEBP")
+        shot.image_bytes = other.image_bytes
+        assert shot.to_data_url("WEBP") == other.to_data_url("WEBP")
+
+    def test_data_url_stable_across_pickle(self, shot):
+        url = shot.to_data_url("WEBP")
+        assert pickle.loads(pickle.dumps(shot)).to_data_url("WEBP") == url
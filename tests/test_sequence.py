@@ -0,0 +1,155 @@
+import gc
+import weakref
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from gui_agent_screenshot_tools import (
+    ArchiveError,
+    ArchiveReader,
+    ArchiveWriter,
+    ResizeMode,
+    Screenshot,
+    SequenceReader,
+    SequenceWriter,
+    Space,
+)
+
+
+def _session(count, size=(320, 240), mode="RGB"):
+    """A noisy background with a small region changing each frame, like typing."""
+    rng = np.random.default_rng(0)
+    channels = {"L": (), "LA": (2,), "RGB": (3,), "RGBA": (4,)}[mode]
+    pixels = rng.integers(0, 256, size=(size[1], size[0], *channels), dtype=np.uint8)
+    frames = []
+    for i in range(count):
+        pixels = pixels.copy()
+        pixels[100:110, 10 + 8 * i : 18 + 8 * i] = 255
+        frames.append(Screenshot.from_image(Image.fromarray(pixels)))
+    return frames
+
+
+def _write(path, frames, **kwargs):
+    with SequenceWriter(path, fsync=False, **kwargs) as writer:
+        for i, frame in enumerate(frames):
+            writer.append(frame, timestamp=float(i))
+
+
+def _pixels(screenshot):
+    return np.asarray(screenshot.image)
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "session.gss"
+
+
+class TestSequenceRoundtrip:
+    def test_frames_are_lossless(self, path):
+        frames = _session(12)
+        _write(path, frames, keyframe_interval=5)
+        with SequenceReader(path) as reader:
+            assert len(reader) == 12
+            for frame, original in zip(reader, frames):
+                np.testing.assert_array_equal(_pixels(frame.screenshot), _pixels(original))
+                assert frame.screenshot.space == original.space
+
+    def test_random_access(self, path):
+        frames = _session(12)
+        _write(path, frames, keyframe_interval=5)
+        with SequenceReader(path) as reader:
+            for index in [11, 3, 7, 0, 9, 9, -1]:
+                frame = reader[index]
+                np.testing.assert_array_equal(
+                    _pixels(frame.screenshot), _pixels(frames[index])
+                )
+                assert frame.timestamp == float(index % 12)
+
+    def test_delta_frames_have_png_bytes(self, path):
+        frames = _session(3)
+        _write(path, frames)
+        with SequenceReader(path) as reader:
+            shot = reader[2].screenshot
+            decoded = Screenshot(image_bytes=shot.image_bytes, space=shot.space)
+            np.testing.assert_array_equal(_pixels(decoded), _pixels(frames[2]))
+
+    def test_released_delta_image_is_freed(self, path):
+        frames = _session(3)
+        _write(path, frames)
+        with SequenceReader(path) as reader:
+            shot = reader[2].screenshot
+            image = weakref.ref(shot.image)
+            shot.release_image()
+            gc.collect()
+            assert image() is None
+            np.testing.assert_array_equal(_pixels(shot), _pixels(frames[2]))
+
+    def test_keyframes_keep_original_bytes(self, path):
+        frames = _session(3)
+        _write(path, frames)
+        with SequenceReader(path) as reader:
+            assert reader[0].screenshot.image_bytes == frames[0].image_bytes
+
+    @pytest.mark.parametrize("mode", ["L", "LA", "RGBA"])
+    def test_other_modes(self, path, mode):
+        frames = _session(4, mode=mode)
+        _write(path, frames)
+        with SequenceReader(path) as reader:
+            shot = reader[3].screenshot
+            assert shot.image.mode == mode
+            np.testing.assert_array_equal(_pixels(shot), _pixels(frames[3]))
+
+    def test_resize_metadata_preserved(self, path):
+        frames = [
+            f.resize(Space(width=128, height=128), ResizeMode.LETTERBOX)
+            for f in _session(3)
+        ]
+        _write(path, frames)
+        with SequenceReader(path) as reader:
+            assert [f.screenshot.resize_metadata for f in reader] == [
+                f.resize_metadata for f in frames
+            ]
+
+
+class TestSequenceStorage:
+    def test_much_smaller_than_archive(self, path, tmp_path):
+        frames = _session(20)
+        _write(path, frames, keyframe_interval=30)
+        with ArchiveWriter(tmp_path / "full.gsa", fsync=False) as writer:
+            for frame in frames:
+                writer.append(frame)
+        assert path.stat().st_size * 5 < (tmp_path / "full.gsa").stat().st_size
+
+    def test_size_change_forces_keyframe(self, path):
+        frames = _session(2) + _session(2, size=(100, 80))
+        _write(path, frames)
+        with SequenceReader(path) as reader:
+            assert reader[2].screenshot.image_bytes == frames[2].image_bytes
+            np.testing.assert_array_equal(_pixels(reader[3].screenshot), _pixels(frames[3]))
+
+    def test_mostly_changed_frame_is_keyframe(self, path):
+        frames = _session(2)
+        noisy = np.random.default_rng(1).integers(0, 256, (240, 320, 3), dtype=np.uint8)
+        frames.append(Screenshot.from_image(Image.fromarray(noisy)))
+        _write(path, frames)
+        with SequenceReader(path) as reader:
+            assert reader[2].screenshot.image_bytes == frames[2].image_bytes
+
+    def test_reopen_appends_keyframe(self, path):
+        frames = _session(6)
+        _write(path, frames[:3])
+        _write(path, frames[3:])
+        with SequenceReader(path) as reader:
+            assert len(reader) == 6
+            assert reader[3].screenshot.image_bytes == frames[3].image_bytes
+            np.testing.assert_array_equal(_pixels(reader[5].screenshot), _pixels(frames[5]))
+
+    def test_not_readable_as_plain_archive(self, path):
+        _write(path, _session(2))
+        with pytest.raises(ArchiveError):
+            ArchiveReader(path)
+
+    def test_invalid_parameters(self, path):
+        with pytest.raises(ValueError):
+            SequenceWriter(path, tile_size=0)
@@ -0,0 +1,91 @@
+import json
+
+import pytest
+from PIL import Image
+
+from gui_agent_screenshot_tools import (
+    FileBlobStore,
+    ResizeMode,
+    Screenshot,
+    SharedMemoryBlobStore,
+    Space,
+    dump_screenshot,
+    file_ref,
+    load_screenshot,
+)
+
+
+@pytest.fixture
+def resized():
+    shot = Screenshot.from_image(Image.new("RGB", (320, 180), color=(9, 99, 199)))
+    return shot.resize(Space(width=128, height=128), ResizeMode.LETTERBOX)
+
+
+@pytest.fixture
+def shm_store():
+    store = SharedMemoryBlobStore()
+    yield store
+    store.close()
+
+
+class TestDumpScreenshot:
+    def test_json_has_no_inline_bytes(self, resized, tmp_path):
+        payload = dump_screenshot(resized, FileBlobStore(tmp_path))
+        raw = json.loads(payload)
+        assert set(raw) == {"space", "resize_metadata", "blob"}
+        assert raw["blob"]["scheme"] == "sha256"
+        assert raw["blob"]["size"] == len(resized.image_bytes)
+        assert raw["resize_metadata"]["mode"] == "letterbox"
+        assert len(payload) < 600
+
+    def test_file_store_deduplicates(self, resized, tmp_path):
+        store = FileBlobStore(tmp_path)
+        assert store.put(resized.image_bytes) == store.put(resized.image_bytes)
+        assert len(list(tmp_path.rglob("*"))) == 2  # one shard dir, one blob
+
+    def test_requires_store_or_ref(self, resized):
+        with pytest.raises(ValueError):
+            dump_screenshot(resized)
+
+
+class TestLoadScreenshot:
+    def test_file_store_roundtrip(self, resized, tmp_path):
+        store = FileBlobStore(tmp_path)
+        loaded = load_screenshot(dump_screenshot(resized, store), store)
+        assert loaded.space == resized.space
+        assert loaded.resize_metadata == resized.resize_metadata
+        assert loaded.image_bytes == resized.image_bytes
+
+    def test_blob_not_read_until_needed(self, resized, tmp_path):
+        store = FileBlobStore(tmp_path)
+        payload = dump_screenshot(resized, store)
+        for blob in tmp_path.rglob("*"):
+            if blob.is_file():
+                blob.unlink()
+        loaded = load_screenshot(payload, store)
+        assert loaded.space == resized.space
+        with pytest.raises(FileNotFoundError):
+            loaded.image_bytes
+
+    def test_shared_memory_roundtrip(self, resized, shm_store):
+        payload = dump_screenshot(resized, shm_store)
+        assert json.loads(payload)["blob"]["scheme"] == "shm"
+        assert load_screenshot(payload, shm_store).image_bytes == resized.image_bytes
+        assert load_screenshot(payload, SharedMemoryBlobStore()).image_bytes == resized.image_bytes
+
+    def test_file_ref_needs_no_store(self, resized, tmp_path):
+        path = tmp_path / "frame.png"
+        path.write_bytes(resized.image_bytes)
+        payload = dump_screenshot(resized, ref=file_ref(path))
+        loaded = load_screenshot(payload)
+        assert loaded.image.size == (128, 128)
+
+    def test_store_required_for_hash_refs(self, resized, tmp_path):
+        payload = dump_screenshot(resized, FileBlobStore(tmp_path))
+        with pytest.raises(ValueError):
+            load_screenshot(payload)
+
+    def test_lazy_screenshot_model_dump_includes_bytes(self, resized, tmp_path):
+        store = FileBlobStore(tmp_path)
+        loaded = load_screenshot(dump_screenshot(resized, store), store)
+        assert loaded.model_dump()["image_bytes"] == resized.image_bytes
@@ -0,0 +1,201 @@
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from PIL import Image
+
+from gui_agent_screenshot_tools import (
+    ResizeClient,
+    ResizeJob,
+    ResizeMode,
+    ResizeService,
+    ResizeServiceError,
+    Screenshot,
+    Space,
+    make_server,
+)
+
+
+class _CountingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=2)
+        self.batch_sizes = []
+
+    def submit(self, fn, jobs):
+        self.batch_sizes.append(len(jobs))
+        return super().submit(fn, jobs)
+
+
+class _BarrierExecutor(ThreadPoolExecutor):
+    """Tasks only finish once ``max_workers`` of them run at the same time."""
+
+    def __init__(self, max_workers):
+        super().__init__(max_workers=max_workers)
+        self.barrier = threading.Barrier(max_workers)
+
+    def submit(self, fn, jobs):
+        def run(jobs):
+            self.barrier.wait(timeout=5)
+            return fn(jobs)
+
+        return super().submit(run, jobs)
+
+
+@pytest.fixture
+def shot():
+    return Screenshot.from_image(Image.new("RGB", (320, 180), color=(30, 60, 90)))
+
+
+@pytest.fixture
+def executor():
+    with _CountingExecutor() as ex:
+        yield ex
+
+
+@pytest.fixture
+def service(executor):
+    svc = ResizeService(max_batch=4, max_delay=0.05, executor=executor)
+    yield svc
+    svc.close()
+
+
+def _serve(server):
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return thread
+
+
+@pytest.fixture
+def unix_client(service, tmp_path):
+    path = str(tmp_path / "resize.sock")
+    server = make_server(service, unix_socket=path)
+    _serve(server)
+    yield ResizeClient(unix_socket=path)
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def tcp_client(service):
+    server = make_server(service, port=0)
+    _serve(server)
+    host, port = server.server_address[:2]
+    yield ResizeClient(url=f"http://{host}:{port}")
+    server.shutdown()
+    server.server_close()
+
+
+class TestResizeService:
+    def test_batches_concurrent_jobs(self, service, executor, shot):
+        job = ResizeJob(
+            image_bytes=shot.image_bytes,
+            source=shot.space,
+            target=Space(width=64, height=64),
+            mode=ResizeMode.LETTERBOX,
+        )
+        futures = [service.submit(job) for _ in range(8)]
+        results = [f.result(timeout=10) for f in futures]
+        # Two batches of four, each split across the two workers.
+        assert executor.batch_sizes == [2, 2, 2, 2]
+        assert all(r == results[0] for r in results)
+
+    def test_batch_runs_in_parallel(self, shot):
+        job = ResizeJob(shot.image_bytes, shot.space, Space(width=32, height=32), ResizeMode.STRETCH)
+        with _BarrierExecutor(max_workers=4) as executor:
+            svc = ResizeService(max_batch=4, max_delay=0.05, executor=executor)
+            try:
+                futures = [svc.submit(job) for _ in range(4)]
+                assert all(f.result(timeout=10)[0] for f in futures)
+            finally:
+                svc.close()
+
+    def test_uneven_batch_split(self, shot):
+        with _CountingExecutor() as executor:
+            svc = ResizeService(max_batch=5, max_delay=0.05, executor=executor)
+            job = ResizeJob(shot.image_bytes, shot.space, Space(width=32, height=32), ResizeMode.STRETCH)
+            try:
+                for f in [svc.submit(job) for _ in range(5)]:
+                    f.result(timeout=10)
+            finally:
+                svc.close()
+        assert executor.batch_sizes == [2, 3]
+
+    def test_bad_job_fails_alone(self, service, shot):
+        good = ResizeJob(shot.image_bytes, shot.space, Space(width=32, height=32), ResizeMode.STRETCH)
+        bad = ResizeJob(b"not an image", shot.space, Space(width=32, height=32), ResizeMode.STRETCH)
+        good_f, bad_f = service.submit(good), service.submit(bad)
+        assert good_f.result(timeout=10)[0]
+        with pytest.raises(ValueError):
+            bad_f.result(timeout=10)
+
+    def test_internal_error_not_reported_as_bad_input(self, service, shot, monkeypatch):
+        def fail(*args, **kwargs):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(Screenshot, "resize", fail)
+        job = ResizeJob(shot.image_bytes, shot.space, Space(width=32, height=32), ResizeMode.STRETCH)
+        with pytest.raises(RuntimeError, match="boom"):
+            service.submit(job).result(timeout=10)
+
+    def test_process_pool(self, shot):
+        svc = ResizeService(workers=1)
+        try:
+            job = ResizeJob(shot.image_bytes, shot.space, Space(width=32, height=32), ResizeMode.STRETCH)
+            image_bytes, metadata = svc.submit(job).result(timeout=60)
+        finally:
+            svc.close()
+        assert metadata["target_space"] == {"width": 32, "height": 32}
+
+
+class TestResizeClient:
+    @pytest.mark.parametrize("client_fixture", ["unix_client", "tcp_client"])
+    def test_matches_local_resize(self, request, client_fixture, shot):
+        client = request.getfixturevalue(client_fixture)
+        target = Space(width=100, height=100)
+        remote = client.resize(shot, target, ResizeMode.LETTERBOX)
+        local = shot.resize(target, ResizeMode.LETTERBOX)
+        assert remote.image_bytes == local.image_bytes
+        assert remote.resize_metadata == local.resize_metadata
+        assert remote.space == target
+
+    def test_encoding_options_forwarded(self, unix_client, shot):
+        remote = unix_client.resize(
+            shot, Space(width=100, height=100), ResizeMode.LETTERBOX, canvas_mode="L", pad_color=255
+        )
+        assert remote.image.mode == "L"
+        assert remote.image.getpixel((0, 0)) == 255
+
+    def test_server_error_raised(self, unix_client, shot):
+        bad = Screenshot(image_bytes=b"garbage", space=shot.space)
+        with pytest.raises(ResizeServiceError, match="400"):
+            unix_client.resize(bad, Space(width=10, height=10), ResizeMode.STRETCH)
+
+    def test_internal_error_is_500(self, unix_client, shot, monkeypatch):
+        def fail(*args, **kwargs):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(Screenshot, "resize", fail)
+        with pytest.raises(ResizeServiceError, match="500"):
+            unix_client.resize(shot, Space(width=10, height=10), ResizeMode.STRETCH)
+
+    def test_requires_one_endpoint(self):
+        with pytest.raises(ValueError):
+            ResizeClient()
+
+
+class TestMakeServer:
+    def test_replaces_stale_socket(self, service, tmp_path):
+        path = str(tmp_path / "resize.sock")
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(path)
+        stale.close()
+        server = make_server(service, unix_socket=path)
+        server.server_close()
+
+    def test_refuses_to_replace_regular_file(self, service, tmp_path):
+        path = tmp_path / "resize.sock"
+        path.write_text("keep me")
+        with pytest.raises(FileExistsError):
+            make_server(service, unix_socket=str(path))
+        assert path.read_text() == "keep me"
@@ -0,0 +1,106 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from PIL import Image
+
+from gui_agent_screenshot_tools import ResizeCoalescer, ResizeMode, Screenshot, Space
+
+
+@pytest.fixture
+def shot():
+    return Screenshot.from_image(Image.new("RGB", (320, 180), color=(1, 2, 3)))
+
+
+@pytest.fixture
+def target():
+    return Space(width=64, height=64)
+
+
+@pytest.fixture
+def slow_resize(monkeypatch):
+    calls = []
+    original = Screenshot.resize
+
+    def resize(self, *args, **kwargs):
+        calls.append(args)
+        time.sleep(0.2)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(Screenshot, "resize", resize)
+    return calls
+
+
+class TestResizeCoalescerThreads:
+    def test_concurrent_duplicates_share_result(self, shot, target, slow_resize):
+        coalescer = ResizeCoalescer()
+        barrier = threading.Barrier(6)
+
+        def call(_):
+            barrier.wait()
+            return coalescer.resize(shot, target, ResizeMode.LETTERBOX)
+
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            results = list(pool.map(call, range(6)))
+        assert len(slow_resize) == 1
+        assert all(r is results[0] for r in results)
+        stats = coalescer.stats()
+        assert (stats.calls, stats.computed, stats.deduplicated, stats.in_flight) == (6, 1, 5, 0)
+
+    def test_identical_content_different_objects(self, target, slow_resize):
+        a = Screenshot.from_image(Image.new("RGB", (32, 32), color=(5, 5, 5)))
+        b = Screenshot(image_bytes=a.image_bytes, space=a.space)
+        coalescer = ResizeCoalescer()
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            list(pool.map(lambda s: coalescer.resize(s, target, ResizeMode.STRETCH), [a, b]))
+        assert coalescer.stats().deduplicated == 1
+
+    def test_different_options_not_merged(self, shot, target):
+        coalescer = ResizeCoalescer()
+        coalescer.resize(shot, target, ResizeMode.LETTERBOX)
+        coalescer.resize(shot, target, ResizeMode.STRETCH)
+        coalescer.resize(shot, target, ResizeMode.LETTERBOX, canvas_mode="L")
+        assert coalescer.stats().computed == 3
+
+    def test_sequential_calls_recompute(self, shot, target):
+        coalescer = ResizeCoalescer()
+        first = coalescer.resize(shot, target, ResizeMode.LETTERBOX)
+        second = coalescer.resize(shot, target, ResizeMode.LETTERBOX)
+        assert first is not second
+        assert coalescer.stats().deduplicated == 0
+
+    def test_errors_propagate_and_clear(self, shot, target, monkeypatch):
+        def fail(self, *args, **kwargs):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(Screenshot, "resize", fail)
+        coalescer = ResizeCoalescer()
+        with pytest.raises(RuntimeError):
+            coalescer.resize(shot, target, ResizeMode.LETTERBOX)
+        assert coalescer.stats().in_flight == 0
+
+
+class TestResizeCoalescerAsync:
+    def test_concurrent_duplicates_share_result(self, shot, target, slow_resize):
+        coalescer = ResizeCoalescer()
+
+        async def main():
+            return await asyncio.gather(
+                *(coalescer.aresize(shot, target, ResizeMode.LETTERBOX) for _ in range(5))
+            )
+
+        results = asyncio.run(main())
+        assert len(slow_resize) == 1
+        assert all(r is results[0] for r in results)
+        assert coalescer.stats().deduplicated == 4
+
+    def test_async_joins_thread_flight(self, shot, target, slow_resize):
+        coalescer = ResizeCoalescer()
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            thread_result = pool.submit(coalescer.resize, shot, target, ResizeMode.LETTERBOX)
+            time.sleep(0.05)
+            async_result = asyncio.run(coalescer.aresize(shot, target, ResizeMode.LETTERBOX))
+            assert async_result is thread_result.result()
+        assert len(slow_resize) == 1
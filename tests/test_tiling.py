@@ -0,0 +1,129 @@
+import pytest
+from PIL import Image, ImageDraw
+
+from gui_agent_screenshot_tools import (
+    BBox,
+    ResizeMode,
+    Screenshot,
+    Space,
+    merge_tile_detections,
+    tile_screenshot,
+)
+
+
+@pytest.fixture
+def wide_screenshot():
+    img = Image.new("RGB", (1000, 400), color=(255, 255, 255))
+    ImageDraw.Draw(img).rectangle((480, 180, 519, 219), fill=(255, 0, 0))
+    return Screenshot.from_image(img)
+
+
+@pytest.fixture
+def model_space():
+    return Space(width=200, height=200)
+
+
+class TestTileScreenshot:
+    def test_tiles_cover_source(self, wide_screenshot, model_space):
+        tiles = tile_screenshot(wide_screenshot, model_space, tile_size=Space(width=400, height=400))
+        assert tiles[0].bbox.x == 0
+        assert max(t.bbox.x + t.bbox.width for t in tiles) == 1000
+        for a, b in zip(tiles, tiles[1:]):
+            assert b.bbox.x < a.bbox.x + a.bbox.width  # overlapping
+
+    def test_tiles_resized_to_model_space(self, wide_screenshot, model_space):
+        tiles = tile_screenshot(wide_screenshot, model_space, tile_size=Space(width=400, height=400))
+        for tile in tiles:
+            assert tile.screenshot.space == model_space
+            assert tile.screenshot.image.size == (200, 200)
+            assert tile.screenshot.resize_metadata.source_space == tile.bbox.as_space
+
+    def test_native_tiles_by_default(self, wide_screenshot, model_space):
+        tiles = tile_screenshot(wide_screenshot, model_space, overlap=0.0)
+        assert len(tiles) == 5 * 2
+        assert all(t.bbox.as_space == model_space for t in tiles)
+
+    def test_invalid_overlap(self, wide_screenshot, model_space):
+        with pytest.raises(ValueError):
+            tile_screenshot(wide_screenshot, model_space, overlap=1.0)
+
+    def test_tile_content_matches_source(self, wide_screenshot, model_space):
+        tiles = tile_screenshot(wide_screenshot, model_space, mode=ResizeMode.STRETCH)
+        center = BBox(x=480, y=180, width=40, height=40, space=wide_screenshot.space).center
+        tile = next(t for t in tiles if t.bbox.contains(center))
+        local = tile.bbox.localize(center)
+        assert tile.screenshot.image.getpixel((local.x, local.y))[1] < 50
+
+
+class TestTileMapping:
+    def test_to_source_roundtrip(self, wide_screenshot, model_space):
+        tiles = tile_screenshot(wide_screenshot, model_space, tile_size=Space(width=400, height=400))
+        tile = tiles[1]
+        meta = tile.screenshot.resize_metadata
+        region = BBox(x=100, y=100, width=50, height=50, space=tile.bbox.as_space)
+        top_left = meta.forward_transform_coordinate(region.top_left)
+        bottom_right = meta.forward_transform_coordinate(region.bottom_right)
+        detection = BBox(
+            x=top_left.x,
+            y=top_left.y,
+            width=bottom_right.x - top_left.x + 1,
+            height=bottom_right.y - top_left.y + 1,
+            space=model_space,
+        )
+        mapped = tile.to_source(detection)
+        assert mapped.space == wide_screenshot.space
+        assert abs(mapped.x - (tile.bbox.x + 100)) <= 2
+        assert abs(mapped.y - 100) <= 2
+
+
+class TestMergeTileDetections:
+    def test_duplicates_across_overlap_removed(self, wide_screenshot, model_space):
+        tiles = tile_screenshot(
+            wide_screenshot, model_space, tile_size=Space(width=400, height=400), overlap=0.5
+        )
+        containing = [t for t in tiles if t.bbox.x <= 480 and t.bbox.x + t.bbox.width >= 520]
+        assert len(containing) >= 2
+        detections = []
+        for tile in tiles:
+            if tile in containing:
+                meta = tile.screenshot.resize_metadata
+                local = BBox(x=480 - tile.bbox.x, y=180, width=40, height=40, space=tile.bbox.as_space)
+                tl = meta.forward_transform_coordinate(local.top_left)
+                br = meta.forward_transform_coordinate(local.bottom_right)
+                detections.append(
+                    [BBox(x=tl.x, y=tl.y, width=br.x - tl.x + 1, height=br.y - tl.y + 1, space=model_space)]
+                )
+            else:
+                detections.append([])
+        merged = merge_tile_detections(tiles, detections)
+        assert len(merged) == 1
+        assert abs(merged[0].x - 480) <= 3
+        assert abs(merged[0].y - 180) <= 3
+
+    def test_distinct_detections_kept(self, wide_screenshot, model_space):
+        tiles = tile_screenshot(wide_screenshot, model_space, overlap=0.0)
+        detections = [[BBox(x=10, y=10, width=20, height=20, space=model_space)] for _ in tiles]
+        assert len(merge_tile_detections(tiles, detections)) == len(tiles)
+
+    def test_scores_pick_survivor(self, wide_screenshot, model_space):
+        tiles = tile_screenshot(wide_screenshot, model_space, overlap=0.0)[:1]
+        big = BBox(x=10, y=10, width=100, height=100, space=model_space)
+        small = BBox(x=12, y=12, width=96, height=96, space=model_space)
+        merged = merge_tile_detections(tiles, [[big, small]], scores=[[0.1, 0.9]])
+        assert merged == [tiles[0].to_source(small)]
+
+    def test_nested_pair_from_one_tile_kept(self):
+        frame = Screenshot.from_image(Image.new("RGB", (2000, 1000)))
+        space = Space(width=400, height=400)
+        tiles = tile_screenshot(frame, space)
+        panel = BBox(x=0, y=0, width=400, height=400, space=space)
+        button = BBox(x=100, y=100, width=50, height=30, space=space)
+        detections = [[panel, button]] + [[] for _ in tiles[1:]]
+        scores = [[0.5, 0.9]] + [[] for _ in tiles[1:]]
+        merged = merge_tile_detections(tiles, detections, scores=scores)
+        assert merged == [tiles[0].to_source(button), tiles[0].to_source(panel)]
+
+    def test_mismatched_lengths(self, wide_screenshot, model_space):
+        tiles = tile_screenshot(wide_screenshot, model_space)
+        with pytest.raises(ValueError):
+            merge_tile_detections(tiles, [])